@@ -2,9 +2,10 @@ from __future__ import absolute_import
 
 import atexit
 import functools
-import inspect
 import os
+import sys
 import weakref
+from importlib import import_module
 
 from .actions import Action
 from .actions import CallPrinter
@@ -31,9 +32,13 @@ except ImportError:
     from .predicates import Query
     from .tracer import Tracer
 
+from .predicates import Sample
+from .predicates import Throttle
+
 __version__ = "2.0.2"
 __all__ = (
     'And',
+    'Background',
     'CallPrinter',
     'CodePrinter',
     'Debugger',
@@ -42,6 +47,9 @@ __all__ = (
     'Or',
     'Q',
     'Query',
+    'Sample',
+    'Throttle',
+    'TraceRecorder',
     'VarsPrinter',
     'When',
 
@@ -50,6 +58,25 @@ __all__ = (
 )
 _last_tracer = None
 
+#: Imported on first use (the tracer doesn't need them).
+_LAZY_ATTRIBUTES = {
+    'Background': '.background',
+    'TraceRecorder': '.recorder',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = globals()[name] = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        return value
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # No module level __getattr__ (PEP 562).
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
+
 
 def Q(*predicates, **query):
     """
@@ -70,7 +97,7 @@ def Q(*predicates, **query):
 
     if predicates:
         predicates = tuple(
-            p() if inspect.isclass(p) and issubclass(p, Action) else p
+            p() if isinstance(p, type) and issubclass(p, Action) else p
             for p in predicates
         )
         if any(isinstance(p, CodePrinter) for p in predicates):
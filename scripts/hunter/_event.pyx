@@ -1,20 +1,16 @@
 # cython: linetrace=True
 import re
 import weakref
-from functools import partial
-from linecache import getline
-from linecache import getlines
 from os.path import exists
 from threading import current_thread
-from tokenize import TokenError
-from tokenize import generate_tokens
 
 from cpython.pythread cimport PyThread_get_thread_ident
 
-from .const import SITE_PACKAGES_PATHS
-from .const import SYS_PREFIX_PATHS
+from .const import get_site_packages_paths
+from .const import get_sys_prefix_paths
 from .event import CYTHON_SUFFIX_RE
-from .event import LEADING_WHITESPACE_RE
+from .event import get_fullsource
+from .event import get_source_entry
 from ._tracer cimport *
 
 try:
@@ -181,10 +177,10 @@ cdef class Event:
             A boolean flag. ``True`` if frame is in stdlib.
             """
             if self._stdlib is UNSET:
-                if self.filename.startswith(SITE_PACKAGES_PATHS):
+                if self.filename.startswith(get_site_packages_paths()):
                     # if it's in site-packages then its definitely not stdlib
                     self._stdlib = False
-                elif self.filename.startswith(SYS_PREFIX_PATHS):
+                elif self.filename.startswith(get_sys_prefix_paths()):
                     self._stdlib = True
                 else:
                     self._stdlib = False
@@ -214,7 +210,7 @@ cdef class Event:
             """
             if self._source is UNSET:
                 try:
-                    self._source = getline(self.filename, self.lineno)
+                    self._source = self._source_entry[0]
                 except Exception as exc:
                     self._source = "??? NO SOURCE: {!r}".format(exc)
 
@@ -222,36 +218,18 @@ cdef class Event:
 
     property _raw_fullsource:
         def __get__(self):
-            cdef list lines
+            cdef list entry = self._source_entry
 
-            if self.kind == 'call' and self.code.co_name != "<module>":
-                lines = []
-                try:
-                    for _, token, _, _, line in generate_tokens(partial(
-                        next,
-                        yield_lines(self.filename, self.lineno - 1, lines)
-                    )):
-                        if token in ("def", "class", "lambda"):
-                            return ''.join(lines)
-                except TokenError:
-                    pass
+            if entry[1] is None:
+                if entry[2]:
+                    entry[1] = get_fullsource(self.filename, self.lineno)
+                else:
+                    entry[1] = entry[0]
+            return entry[1]
 
-            return getline(self.filename, self.lineno)
+    property _source_entry:
+        def __get__(self):
+            return get_source_entry(self.filename, self.lineno, self.kind == 'call' and self.code.co_name != "<module>")
 
     def __getitem__(self, item):
         return getattr(self, item)
-
-
-def yield_lines(filename, start, list collector,
-                limit=10):
-    dedent = None
-    amount = 0
-    for line in getlines(filename)[start:start + limit]:
-        if dedent is None:
-            dedent = LEADING_WHITESPACE_RE.findall(line)
-            dedent = dedent[0] if dedent else ""
-            amount = len(dedent)
-        elif not line.startswith(dedent):
-            break
-        collector.append(line)
-        yield line[amount:]
@@ -39,4 +39,5 @@ cdef class Tracer:
         object __weakref__
 
         readonly object _threading_previous
+        readonly list _stop_callbacks
         Py_tracefunc _previousfunc
@@ -58,6 +58,7 @@ cdef class Tracer:
         self.threading_support = threading_support
         self.depth = 1
         self.calls = 0
+        self._stop_callbacks = []
 
     def __dealloc__(self):
         cdef PyThreadState *state = PyThreadState_Get()
@@ -88,6 +89,12 @@ cdef class Tracer:
             PyEval_SetTrace(<pystate.Py_tracefunc> trace_func, <PyObject *> self)
         return self
 
+    def add_stop_callback(self, callback):
+        """
+        Register a function to call (without arguments) after tracing is stopped. Used by actions that need to flush.
+        """
+        self._stop_callbacks.append(callback)
+
     def trace(self, predicate):
         cdef PyThreadState *state = PyThreadState_Get()
         self.handler = predicate
@@ -114,6 +121,8 @@ cdef class Tracer:
             if self.threading_support:
                 threading.settrace(self._threading_previous)
                 self._threading_previous = None
+            for callback in self._stop_callbacks:
+                callback()
 
     def __enter__(self):
         return self
@@ -3,45 +3,55 @@ from __future__ import absolute_import
 import ast
 import os
 import sys
-import threading
 from collections import defaultdict
-from itertools import chain
-
-from colorama import AnsiToWin32
-from colorama import Back
-from colorama import Fore
-from colorama import Style
-from six import string_types
 
 from .util import Fields
-
-EVENT_COLORS = {
-    'reset': Style.RESET_ALL,
-    'normal': Style.NORMAL,
-    'filename': '',
-    'colon': Style.BRIGHT + Fore.BLACK,
-    'lineno': Style.RESET_ALL,
-    'kind': Fore.CYAN,
-    'continuation': Style.BRIGHT + Fore.BLUE,
-    'call': Style.BRIGHT + Fore.BLUE,
-    'return': Style.BRIGHT + Fore.GREEN,
-    'exception': Style.BRIGHT + Fore.RED,
-    'detail': Style.NORMAL,
-    'vars': Style.RESET_ALL + Fore.MAGENTA,
-    'vars-name': Style.BRIGHT,
-    'internal-failure': Style.BRIGHT + Back.RED + Fore.RED,
-    'internal-detail': Fore.WHITE,
-    'source-failure': Style.BRIGHT + Back.YELLOW + Fore.YELLOW,
-    'source-detail': Fore.WHITE,
-}
-CODE_COLORS = {
-    'call': Fore.RESET + Style.BRIGHT,
-    'line': Fore.RESET,
-    'return': Fore.YELLOW,
-    'exception': Fore.RED,
-}
-NO_COLORS = {key: '' for key in chain(CODE_COLORS, EVENT_COLORS)}
+from .util import bounded_repr
+from .util import string_types
+
+#: Filled in with the colorama codes the first time a stream needs colors (see ``_load_colors``).
+EVENT_COLORS = {}
+CODE_COLORS = {}
+NO_COLORS = {key: '' for key in (
+    'reset', 'normal', 'filename', 'colon', 'lineno', 'kind', 'continuation', 'call', 'return', 'exception', 'detail',
+    'vars', 'vars-name', 'internal-failure', 'internal-detail', 'source-failure', 'source-detail', 'line',
+)}
 MISSING = type('MISSING', (), {'__repr__': lambda _: '?'})()
+CO_OPTIMIZED = 0x0001
+
+
+def _load_colors():
+    if EVENT_COLORS:
+        return
+    from colorama import Back
+    from colorama import Fore
+    from colorama import Style
+
+    EVENT_COLORS.update({
+        'reset': Style.RESET_ALL,
+        'normal': Style.NORMAL,
+        'filename': '',
+        'colon': Style.BRIGHT + Fore.BLACK,
+        'lineno': Style.RESET_ALL,
+        'kind': Fore.CYAN,
+        'continuation': Style.BRIGHT + Fore.BLUE,
+        'call': Style.BRIGHT + Fore.BLUE,
+        'return': Style.BRIGHT + Fore.GREEN,
+        'exception': Style.BRIGHT + Fore.RED,
+        'detail': Style.NORMAL,
+        'vars': Style.RESET_ALL + Fore.MAGENTA,
+        'vars-name': Style.BRIGHT,
+        'internal-failure': Style.BRIGHT + Back.RED + Fore.RED,
+        'internal-detail': Fore.WHITE,
+        'source-failure': Style.BRIGHT + Back.YELLOW + Fore.YELLOW,
+        'source-detail': Fore.WHITE,
+    })
+    CODE_COLORS.update({
+        'call': Fore.RESET + Style.BRIGHT,
+        'line': Fore.RESET,
+        'return': Fore.YELLOW,
+        'exception': Fore.RED,
+    })
 
 
 class Action(object):
@@ -108,6 +118,9 @@ class ColorStreamAction(Fields.stream.force_colors.filename_alignment.thread_ali
 
         isatty = getattr(value, 'isatty', None)
         if self.force_colors or (isatty and isatty() and os.name != 'java'):
+            from colorama import AnsiToWin32
+
+            _load_colors()
             self._stream = AnsiToWin32(value, strip=False)
             self._tty = True
             self.event_colors = EVENT_COLORS
@@ -122,7 +135,7 @@ class ColorStreamAction(Fields.stream.force_colors.filename_alignment.thread_ali
         limit = self.repr_limit
 
         try:
-            s = repr(obj)
+            s = bounded_repr(obj, limit)
             s = s.replace('\n', r'\n')
             if len(s) > limit:
                 cutoff = limit // 2
@@ -173,10 +186,11 @@ class CodePrinter(ColorStreamAction):
         #     len(filename)
         # )
         lines = self._safe_source(event)
-        thread_name = threading.current_thread().name if event.tracer.threading_support else ''
+        thread_name = event.threadname if event.tracer.threading_support else ''
         thread_align = self.thread_alignment if event.tracer.threading_support else ''
 
-        self.stream.write(
+        # A single write per event, so the streams that batch writes (ie: RemoteStream) don't split it
+        output = [
             "{thread:{thread_align}}{filename}{:>{align}}{colon}:{lineno}{:<5} {kind}{:9} {code}{}{reset}\n".format(
                 self._format_filename(event),
                 event.lineno,
@@ -186,9 +200,10 @@ class CodePrinter(ColorStreamAction):
                 align=self.filename_alignment,
                 code=self.code_colors[event.kind],
                 **self.event_colors
-            ))
+            )
+        ]
         for line in lines[1:]:
-            self.stream.write("{thread:{thread_align}}{:>{align}}       {kind}{:9} {code}{}{reset}\n".format(
+            output.append("{thread:{thread_align}}{:>{align}}       {kind}{:9} {code}{}{reset}\n".format(
                 "",
                 r"   |",
                 line,
@@ -199,7 +214,7 @@ class CodePrinter(ColorStreamAction):
             ))
 
         if event.kind in ('return', 'exception'):
-            self.stream.write(
+            output.append(
                 "{thread:{thread_align}}{:>{align}}       {continuation}{:9} {color}{} "
                 "value: {detail}{}{reset}\n".format(
                     "",
@@ -211,6 +226,7 @@ class CodePrinter(ColorStreamAction):
                     color=self.event_colors[event.kind],
                     **self.event_colors
                 ))
+        self.stream.write(''.join(output))
 
 
 class CallPrinter(CodePrinter):
@@ -242,7 +258,7 @@ class CallPrinter(CodePrinter):
         """
         filename = self._format_filename(event)
         ident = event.module, event.function
-        thread = threading.current_thread()
+        thread = event.thread
         thread_name = thread.name if event.tracer.threading_support else ''
         thread_align = self.thread_alignment if event.tracer.threading_support else ''
         stack = self.locals[thread.ident]
@@ -336,6 +352,11 @@ class VarsPrinter(Fields.names.globals.stream.filename_alignment, ColorStreamAct
         }
         self.globals = options.pop('globals', False)
         super(VarsPrinter, self).__init__(**options)
+        self._expressions = tuple(
+            (name, compile(name, '<VarsPrinter %s>' % name, 'eval'), tuple(symbols))
+            for name, symbols in self.names.items()
+        )
+        self._candidates_cache = {}
 
     @staticmethod
     def _iter_symbols(code):
@@ -360,32 +381,55 @@ class VarsPrinter(Fields.names.globals.stream.filename_alignment, ColorStreamAct
         except Exception as exc:
             return "{internal-failure}FAILED EVAL: {internal-detail}{!r}".format(exc, **self.event_colors)
 
+    def _candidates(self, code):
+        """
+        The expressions that could have all their symbols present on frames running ``code``. For functions (that
+        have "fast" locals) and when globals aren't allowed the local names are known in advance.
+        """
+        candidates = self._candidates_cache.get(code)
+        if candidates is None:
+            if self.globals or not getattr(code, 'co_flags', 0) & CO_OPTIMIZED:
+                candidates = self._expressions
+            else:
+                local_names = set(code.co_varnames + code.co_cellvars + code.co_freevars)
+                candidates = tuple(
+                    expression for expression in self._expressions
+                    if local_names.issuperset(expression[2])
+                )
+            self._candidates_cache[code] = candidates
+        return candidates
+
     def __call__(self, event):
         """
         Handle event and print the specified variables.
         """
+        candidates = self._candidates(event.code)
+        if not candidates:
+            return
         first = True
-        frame_symbols = set(event.locals)
-        if self.globals:
-            frame_symbols |= set(event.globals)
-        thread_name = threading.current_thread().name if event.tracer.threading_support else ''
+        frame_locals = event.locals
+        frame_globals = event.globals if self.globals else None
+        thread_name = event.threadname if event.tracer.threading_support else ''
         thread_align = self.thread_alignment if event.tracer.threading_support else ''
 
-        for code, symbols in self.names.items():
-            try:
-                obj = eval(code, event.globals if self.globals else {}, event.locals)
-            except AttributeError:
-                continue
-            except Exception as exc:
-                printout = "{internal-failure}FAILED EVAL: {internal-detail}{!r}".format(exc, **self.event_colors)
+        for name, code, symbols in candidates:
+            for symbol in symbols:
+                if symbol not in frame_locals and (frame_globals is None or symbol not in frame_globals):
+                    break
             else:
-                printout = self._safe_repr(obj)
+                try:
+                    obj = eval(code, event.globals if self.globals else {}, frame_locals)
+                except AttributeError:
+                    continue
+                except Exception as exc:
+                    printout = "{internal-failure}FAILED EVAL: {internal-detail}{!r}".format(exc, **self.event_colors)
+                else:
+                    printout = self._safe_repr(obj)
 
-            if frame_symbols >= symbols:
                 self.stream.write("{thread:{thread_align}}{:>{align}}       {vars}{:9} {vars-name}{} {vars}=> {reset}{}{reset}\n".format(
                     "",
                     "vars" if first else "...",
-                    code,
+                    name,
                     printout,
                     thread=thread_name, thread_align=thread_align,
                     align=self.filename_alignment,
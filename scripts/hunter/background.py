@@ -0,0 +1,297 @@
+from __future__ import absolute_import
+from __future__ import print_function
+
+import atexit
+import sys
+import threading
+import weakref
+from collections import deque
+
+from .actions import MISSING
+from .actions import Action
+from .actions import ColorStreamAction
+from .event import Event
+from .recorder import RecordedThread
+from .util import bounded_repr
+
+__all__ = 'Background',
+
+BACKPRESSURE_POLICIES = 'block', 'drop-oldest', 'sample'
+
+
+class Rendered(object):
+    """
+    A ``repr()`` (bounded to ``limit``) taken on the traced thread. Its own ``repr()`` gives back the same text (or
+    raises the same error) so the printers can format it later, from the background thread.
+    """
+    __slots__ = 'text', 'error'
+
+    def __init__(self, obj, limit):
+        try:
+            self.text = bounded_repr(obj, limit)
+            self.error = None
+        except Exception as exc:
+            self.text = None
+            self.error = exc
+
+    def __repr__(self):
+        if self.error is not None:
+            raise self.error
+        return self.text
+
+
+class ThreadTracer(object):
+    """
+    Stand-in for :class:`hunter.tracer.Tracer` on snapshot events. Only ``threading_support`` is used by the printers.
+    """
+
+    def __init__(self, threading_support):
+        self.threading_support = threading_support
+
+
+class SnapshotCode(object):
+    """
+    Stand-in for the code object of a snapshot event.
+    """
+
+    def __init__(self, name, argnames, filename):
+        self.co_name = name
+        self.co_varnames = argnames
+        self.co_argcount = len(argnames)
+        self.co_filename = filename
+
+
+TRACERS = ThreadTracer(False), ThreadTracer(True)
+
+
+class SnapshotEvent(Event):
+    """
+    An :class:`hunter.event.Event` rebuilt in the background thread from the tuple made by :func:`reduce_event`.
+    Values (``arg`` and the call arguments) were rendered on the traced thread. The source code is looked up lazily.
+    """
+
+    def __init__(self, item):
+        (kind, filename, lineno, module, function, depth, calls, threadid, thread_ident, thread_name, args, arg,
+         threading_support) = item
+        self.frame = None
+        self.kind = kind
+        self.arg = arg
+        self.depth = depth
+        self.calls = calls
+        self.tracer = TRACERS[threading_support]
+        self.thread = RecordedThread(thread_ident, thread_name)
+
+        # prime the cached properties that would otherwise need the frame
+        self.__dict__.update(
+            code=SnapshotCode(function, tuple(name for name, _ in args), filename),
+            function=function,
+            filename=filename,
+            module=module,
+            lineno=lineno,
+            locals=dict(args),
+            globals={},
+            threadid=threadid,
+            threadname=thread_name,
+        )
+
+
+def reduce_event(event, limit, current_thread=threading.current_thread):
+    """
+    Reduce an event to a tuple holding just what the printers need. Runs on the traced thread.
+    """
+    kind = event.kind
+    if kind == 'call':
+        code = event.code
+        event_locals = event.locals
+        args = tuple(
+            (name, Rendered(event_locals.get(name, MISSING), limit))
+            for name in code.co_varnames[:code.co_argcount]
+        )
+    else:
+        args = ()
+    thread = current_thread()
+    return (
+        kind, event.filename, event.lineno, event.module, event.function, event.depth, event.calls, event.threadid,
+        thread.ident, thread.name, args, Rendered(event.arg, limit) if kind in ('return', 'exception') else None,
+        bool(event.tracer.threading_support),
+    )
+
+
+class BatchBuffer(object):
+    """
+    Collects the writes of a printer so they can be written out together.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.write = self.chunks.append
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        value = ''.join(self.chunks)
+        del self.chunks[:]
+        return value
+
+
+class Background(Action):
+    """
+    Runs a printer (:class:`hunter.CodePrinter` or :class:`hunter.CallPrinter`) in a background thread. On the traced
+    thread events are only reduced to small tuples (values are rendered with ``repr()`` right away as they may change)
+    and put in a bounded queue. The background thread formats them and writes them out in batches.
+
+    Queued events are flushed when the tracer is stopped.
+
+    Args:
+        action (ColorStreamAction): The printer to run. Default: ``CallPrinter()``.
+        maxsize (int): Maximum number of queued events. Default: ``16384``.
+        backpressure (str): What to do when the queue is full. Default: ``'block'``.
+
+            * ``'block'`` - wait for the background thread to make room.
+            * ``'drop-oldest'`` - discard the oldest queued event.
+            * ``'sample'`` - only queue every ``sample_every``-th event (waiting for room), discard the others.
+        sample_every (int): Used by the ``'sample'`` policy. Default: ``10``.
+        batch_size (int): Number of events that wake the background thread. Default: ``1024``.
+        interval (float): Maximum time (in seconds) events wait in the queue. Default: ``0.1``.
+
+    .. note::
+
+        The ``dropped`` attribute counts the discarded events.
+    """
+
+    def __init__(self, action=None, maxsize=16384, backpressure='block', sample_every=10, batch_size=1024,
+                 interval=0.1):
+        if action is None:
+            from .actions import CallPrinter
+            action = CallPrinter()
+        if not isinstance(action, ColorStreamAction) or not hasattr(action, '_safe_source'):
+            raise TypeError('Background can only run CodePrinter or CallPrinter actions, not %r.' % (action,))
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError('Invalid backpressure %r. Must be one of %s.' % (backpressure, BACKPRESSURE_POLICIES))
+        self.action = action
+        self.maxsize = maxsize
+        self.backpressure = backpressure
+        self.sample_every = sample_every
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+
+        self._queue = deque()
+        self._condition = threading.Condition(threading.Lock())
+        self._in_flight = 0
+        self._skipped = 0
+        self._closed = False
+        self._flushing = False
+        self._tracers = weakref.WeakSet()
+        self._stream = action._stream
+        self._buffer = action._stream = BatchBuffer()
+
+        # Started right away so that it's not traced when using ``threading_support``.
+        self._thread = threading.Thread(target=self._run, name='hunter.Background')
+        self._thread.daemon = True
+        self._thread.start()
+
+        @atexit.register
+        def atexit_cleanup(ref=weakref.ref(self)):
+            background = ref()
+            if background is not None:
+                background.close()
+
+    def __repr__(self):
+        return '<hunter.background.Background: action=%r, backpressure=%r, dropped=%s>' % (
+            self.action, self.backpressure, self.dropped)
+
+    def __call__(self, event):
+        """
+        Reduce the event and queue it.
+        """
+        tracer = event.tracer
+        if tracer not in self._tracers:
+            self._tracers.add(tracer)
+            tracer.add_stop_callback(self.flush)
+        item = reduce_event(event, self.action.repr_limit)
+
+        condition = self._condition
+        queue = self._queue
+        with condition:
+            if self._closed:
+                return
+            if len(queue) >= self.maxsize:
+                if self.backpressure == 'drop-oldest':
+                    queue.popleft()
+                    self.dropped += 1
+                else:
+                    if self.backpressure == 'sample':
+                        self._skipped += 1
+                        if self._skipped % self.sample_every:
+                            self.dropped += 1
+                            return
+                    condition.notify_all()
+                    while len(queue) >= self.maxsize and not self._closed and self._thread.is_alive():
+                        condition.wait(self.interval)
+                    if len(queue) >= self.maxsize:
+                        # Nothing is going to make room
+                        self.dropped += 1
+                        return
+            queue.append(item)
+            if len(queue) == self.batch_size:
+                condition.notify_all()
+
+    def _run(self):
+        sys.settrace(None)
+        action = self.action
+        condition = self._condition
+        queue = self._queue
+        while True:
+            with condition:
+                if len(queue) < self.batch_size and not self._flushing and not self._closed:
+                    condition.wait(self.interval)
+                items = list(queue)
+                queue.clear()
+                self._in_flight = len(items)
+                condition.notify_all()
+                if not items and self._closed:
+                    return
+            if items:
+                for item in items:
+                    try:
+                        action(SnapshotEvent(item))
+                    except Exception as exc:
+                        print('Hunter failed to handle a %s event in the background: %r' % (item[0], exc),
+                              file=sys.stderr)
+                try:
+                    self._stream.write(self._buffer.getvalue())
+                    flush = getattr(self._stream, 'flush', None)
+                    if flush is not None:
+                        flush()
+                except Exception as exc:
+                    print('Hunter failed to write the trace output: %r' % (exc,), file=sys.stderr)
+                with condition:
+                    self._in_flight = 0
+                    condition.notify_all()
+
+    def flush(self):
+        """
+        Wait until all the queued events are written out.
+        """
+        condition = self._condition
+        with condition:
+            self._flushing = True
+            condition.notify_all()
+            while (self._queue or self._in_flight) and self._thread.is_alive():
+                condition.wait(self.interval)
+            self._flushing = False
+
+    def close(self):
+        """
+        Flush and stop the background thread. Events received afterwards are ignored.
+        """
+        with self._condition:
+            if self._closed:
+                return
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
@@ -0,0 +1,460 @@
+from __future__ import absolute_import
+
+import operator
+from array import array
+from collections import defaultdict
+
+from .predicates import And
+from .predicates import Not
+from .predicates import Or
+from .predicates import Query
+from .recorder import EVENT_RECORD
+from .recorder import KINDS
+from .recorder import RecordedEvent
+from .recorder import ReplayTracer
+from .recorder import TraceReader
+from .util import cached_property
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = 'TraceTable',
+
+#: column name, ``array`` typecode, ``numpy`` dtype (same layout as ``EVENT_RECORD``)
+COLUMNS = (
+    ('kind', 'B', '<u1'),
+    ('code', 'I', '<u4'),
+    ('lineno', 'I', '<u4'),
+    ('depth', 'i', '<i4'),
+    ('threadid', 'Q', '<u8'),
+    ('timestamp', 'd', '<f8'),
+)
+CALL = KINDS.index('call')
+LINE = KINDS.index('line')
+#: Rows converted to Python values at once when iterating over a table.
+ITER_CHUNK_SIZE = 4096
+
+#: Keys evaluated directly on the event columns.
+VECTOR_KEYS = 'lineno', 'depth', 'calls', 'threadid'
+#: Keys that only depend on the code object, evaluated once per code object.
+CODE_KEYS = 'function', 'module', 'filename', 'stdlib'
+#: Keys that depend on the code object, line and kind, evaluated once per distinct location.
+SOURCE_KEYS = 'source', 'fullsource'
+
+QUERY_OPERATORS = (
+    ('query_eq', operator.eq),
+    ('query_in', lambda evalue, value: evalue in value),
+    ('query_contains', lambda evalue, value: value in evalue),
+    ('query_startswith', lambda evalue, value: evalue.startswith(value)),
+    ('query_endswith', lambda evalue, value: evalue.endswith(value)),
+    ('query_regex', lambda evalue, value: value.match(evalue)),
+    ('query_lt', operator.lt),
+    ('query_lte', operator.le),
+    ('query_gt', operator.gt),
+    ('query_gte', operator.ge),
+)
+NUMPY_OPERATORS = {
+    'query_eq': operator.eq,
+    'query_lt': operator.lt,
+    'query_lte': operator.le,
+    'query_gt': operator.gt,
+    'query_gte': operator.ge,
+}
+
+try:
+    from ._predicates import And as _CAnd
+    from ._predicates import Not as _CNot
+    from ._predicates import Or as _COr
+    from ._predicates import Query as _CQuery
+except ImportError:
+    QUERY_TYPES, AND_TYPES, OR_TYPES, NOT_TYPES = (Query,), (And,), (Or,), (Not,)
+else:
+    QUERY_TYPES, AND_TYPES, OR_TYPES, NOT_TYPES = (Query, _CQuery), (And, _CAnd), (Or, _COr), (Not, _CNot)
+
+
+class TraceTable(object):
+    """
+    Columnar view over a trace recorded with :class:`hunter.TraceRecorder`, for answering queries offline.
+
+    Queries use the same vocabulary as :class:`hunter.Query` (``filename_startswith``, ``function``, ``depth_gt``,
+    ``kind`` and so on, combined with :class:`hunter.And`, :class:`hunter.Or` and :class:`hunter.Not`) but they
+    evaluate to masks over whole columns instead of calling a predicate for each event. String criteria are evaluated
+    once per distinct code object (or source line), not once per event.
+
+    Columns are ``numpy`` arrays when ``numpy`` is importable, ``array.array`` otherwise.
+
+    Example::
+
+        table = TraceTable.from_file('trace.bin')
+        slow = table.select(filename_startswith='/srv/app', depth_gt=3)
+        slow.line_hits()
+    """
+
+    def __init__(self, columns, codes, modules, threading_support=False):
+        self.columns = columns
+        self.codes = codes
+        self.modules = modules
+        self.threading_support = threading_support
+
+    @classmethod
+    def from_file(cls, path, threading_support=False):
+        """
+        Load the trace at ``path`` into columns.
+        """
+        with TraceReader(path) as reader:
+            if numpy is None:
+                columns = _load_array_columns(reader)
+            else:
+                columns = _load_numpy_columns(reader)
+            return cls(columns, list(reader.codes), list(reader.modules), threading_support)
+
+    def __repr__(self):
+        return '<hunter.columns.TraceTable: %s events, %s code objects>' % (len(self), len(self.codes))
+
+    def __len__(self):
+        return len(self.columns['kind'])
+
+    def __iter__(self):
+        """
+        Iterate :class:`hunter.recorder.RecordedEvent` objects for the rows of this table.
+        """
+        tracer = ReplayTracer(self.threading_support)
+        codes = self.codes
+        modules = self.modules
+        columns = [self.columns[name] for name in ('kind', 'code', 'lineno', 'depth', 'calls', 'threadid', 'timestamp')]
+        # A chunk at a time, not the whole columns as lists
+        for start in range(0, len(self), ITER_CHUNK_SIZE):
+            chunk = [_tolist(column[start:start + ITER_CHUNK_SIZE]) for column in columns]
+            for kind, cid, lineno, depth, calls, threadid, timestamp in zip(*chunk):
+                tracer.depth = depth
+                tracer.calls = calls
+                yield RecordedEvent(KINDS[kind], codes[cid], modules[cid], lineno, depth, calls, threadid, timestamp,
+                                    tracer)
+
+    def take(self, mask):
+        """
+        Return a new table with the rows where ``mask`` is true.
+        """
+        if numpy is None:
+            columns = {
+                name: array(column.typecode, (value for value, keep in zip(column, mask) if keep))
+                for name, column in self.columns.items()
+            }
+        else:
+            columns = {name: column[mask] for name, column in self.columns.items()}
+        return TraceTable(columns, self.codes, self.modules, self.threading_support)
+
+    def mask(self, *predicates, **query):
+        """
+        Evaluate the predicates (:class:`hunter.Query` objects or ``And``/``Or``/``Not`` over them) and keyword
+        criteria. Returns a boolean mask with a value for each row.
+        """
+        if query:
+            predicates += Query(**query),
+        if not predicates:
+            return _full(len(self), True)
+        result = self._evaluate(predicates[0])
+        for predicate in predicates[1:]:
+            result = _and(result, self._evaluate(predicate))
+        return result
+
+    def select(self, *predicates, **query):
+        """
+        Same as :meth:`mask` but returns a new table with the matching rows.
+        """
+        return self.take(self.mask(*predicates, **query))
+
+    def count(self, *predicates, **query):
+        """
+        Number of rows matching the predicates.
+        """
+        return _count(self.mask(*predicates, **query))
+
+    def _evaluate(self, predicate):
+        if isinstance(predicate, QUERY_TYPES):
+            result = _full(len(self), True)
+            for attribute, op in QUERY_OPERATORS:
+                for key, value in getattr(predicate, attribute):
+                    result = _and(result, self._evaluate_criteria(key, attribute, op, value))
+            return result
+        elif isinstance(predicate, AND_TYPES):
+            result = _full(len(self), True)
+            for sub_predicate in predicate.predicates:
+                result = _and(result, self._evaluate(sub_predicate))
+            return result
+        elif isinstance(predicate, OR_TYPES):
+            result = _full(len(self), False)
+            for sub_predicate in predicate.predicates:
+                result = _or(result, self._evaluate(sub_predicate))
+            return result
+        elif isinstance(predicate, NOT_TYPES):
+            return _not(self._evaluate(predicate.predicate))
+        else:
+            raise TypeError('Predicate %r cannot be evaluated over columns. Only Query, And, Or and Not are supported.'
+                            % (predicate,))
+
+    def _evaluate_criteria(self, key, attribute, op, value):
+        if key in VECTOR_KEYS:
+            column = self.columns[key]
+            if key == 'threadid':
+                # threadid is recorded as 0 for the main thread, as opposed to None on live events
+                if attribute == 'query_in':
+                    value = tuple(0 if i is None else i for i in value)
+                elif value is None:
+                    value = 0
+            if numpy is not None:
+                if attribute in NUMPY_OPERATORS:
+                    return NUMPY_OPERATORS[attribute](column, value)
+                elif attribute == 'query_in':
+                    return numpy.isin(column, list(value))
+            return _unique_mask(column, lambda evalue: op(evalue, value))
+        elif key == 'kind':
+            return _unique_mask(self.columns['kind'], lambda kind: op(KINDS[kind], value))
+        elif key in CODE_KEYS:
+            return _unique_mask(self.columns['code'], lambda cid: op(self._code_events[cid][key], value))
+        elif key in SOURCE_KEYS:
+            return _unique_mask(self._location_keys, lambda location: op(self._location_event(location)[key], value))
+        else:
+            raise TypeError('Cannot query on %r: it is not recorded. Queries over recorded traces support: %s.' % (
+                key, ('kind',) + VECTOR_KEYS + CODE_KEYS + SOURCE_KEYS
+            ))
+
+    @cached_property
+    def _code_events(self):
+        tracer = ReplayTracer(self.threading_support)
+        return [
+            RecordedEvent('line', code, module, code.co_firstlineno, 0, 0, 0, 0.0, tracer)
+            for code, module in zip(self.codes, self.modules)
+        ]
+
+    @cached_property
+    def _location_keys(self):
+        # (code id, lineno, is-call) packed into a single integer
+        if numpy is None:
+            return array('Q', (
+                (cid << 33) | (lineno << 1) | (kind == CALL)
+                for cid, lineno, kind in zip(self.columns['code'], self.columns['lineno'], self.columns['kind'])
+            ))
+        else:
+            return (
+                (self.columns['code'].astype(numpy.uint64) << numpy.uint64(33)) |
+                (self.columns['lineno'].astype(numpy.uint64) << numpy.uint64(1)) |
+                (self.columns['kind'] == CALL).astype(numpy.uint64)
+            )
+
+    def _location_event(self, location):
+        cid = location >> 33
+        return RecordedEvent(
+            'call' if location & 1 else 'line', self.codes[cid], self.modules[cid], (location >> 1) & 0xffffffff,
+            0, 0, 0, 0.0, ReplayTracer(self.threading_support)
+        )
+
+    @cached_property
+    def index_by_code(self):
+        """
+        A dict of code id to the row positions of that code object's events.
+        """
+        return _group_positions(self.columns['code'])
+
+    @cached_property
+    def index_by_line(self):
+        """
+        A dict of ``(filename, lineno)`` to the row positions of the events on that line.
+        """
+        index = defaultdict(list)
+        for location, positions in _group_positions(self._location_keys).items():
+            code = self.codes[location >> 33]
+            index[code.co_filename, (location >> 1) & 0xffffffff].append(positions)
+        return {key: _concatenate(positions) for key, positions in index.items()}
+
+    def events_at(self, filename, lineno):
+        """
+        Return a new table with the events on the given line, using :attr:`index_by_line`.
+        """
+        positions = self.index_by_line.get((filename, lineno), ())
+        if not len(positions):
+            return self.take(_full(len(self), False))
+        elif numpy is None:
+            positions = set(positions)
+            return self.take([i in positions for i in range(len(self))])
+        else:
+            mask = numpy.zeros(len(self), bool)
+            mask[positions] = True
+            return self.take(mask)
+
+    def line_hits(self):
+        """
+        Number of ``line`` events for each ``(filename, lineno)``.
+        """
+        hits = defaultdict(int)
+        line_rows = self.take(_equal(self.columns['kind'], LINE))
+        for location, count in _value_counts(line_rows._location_keys).items():
+            hits[self.codes[location >> 33].co_filename, (location >> 1) & 0xffffffff] += count
+        return dict(hits)
+
+    def function_calls(self):
+        """
+        Number of ``call`` events for each ``(filename, function)``.
+        """
+        calls = defaultdict(int)
+        call_rows = self.take(_equal(self.columns['kind'], CALL))
+        for cid, count in _value_counts(call_rows.columns['code']).items():
+            code = self.codes[cid]
+            calls[code.co_filename, code.co_name] += count
+        return dict(calls)
+
+    def time_per_depth(self):
+        """
+        Time spent at each depth, in seconds. The time between two consecutive events of a thread is attributed to the
+        depth of the first one, so only the time between recorded events is accounted for.
+        """
+        totals = defaultdict(float)
+        threadids = self.columns['threadid']
+        for positions in _group_positions(threadids).values():
+            if numpy is None:
+                timestamps = [self.columns['timestamp'][i] for i in positions]
+                depths = [self.columns['depth'][i] for i in positions]
+                for depth, start, end in zip(depths, timestamps, timestamps[1:]):
+                    totals[depth] += end - start
+            else:
+                timestamps = self.columns['timestamp'][positions]
+                depths = self.columns['depth'][positions][:-1]
+                if not len(depths):
+                    continue
+                offset = int(depths.min())
+                durations = numpy.bincount(depths - offset, weights=numpy.diff(timestamps))
+                for depth in numpy.flatnonzero(durations).tolist():
+                    totals[depth + offset] += float(durations[depth])
+        return dict(totals)
+
+
+def _load_numpy_columns(reader):
+    dtype = numpy.dtype([(name, dtype) for name, _, dtype in COLUMNS])
+    assert dtype.itemsize == EVENT_RECORD.size
+    chunks = [numpy.frombuffer(data, dtype) for data in reader.iter_event_blocks()]
+    records = numpy.concatenate(chunks) if chunks else numpy.empty(0, dtype)
+    columns = {name: numpy.ascontiguousarray(records[name]) for name, _, _ in COLUMNS}
+    columns['calls'] = _calls_column(columns['kind'])
+    return columns
+
+
+def _load_array_columns(reader):
+    columns = {name: array(typecode) for name, typecode, _ in COLUMNS}
+    appenders = [columns[name].append for name, _, _ in COLUMNS]
+    for record in reader.iter_records():
+        for append, value in zip(appenders, record):
+            append(value)
+    columns['calls'] = _calls_column(columns['kind'])
+    return columns
+
+
+def _calls_column(kinds):
+    # number of calls before each event, same as ``Event.calls``
+    if numpy is None:
+        calls = array('Q')
+        count = 0
+        for kind in kinds:
+            calls.append(count)
+            if kind == CALL:
+                count += 1
+        return calls
+    else:
+        is_call = (kinds == CALL).astype(numpy.uint64)
+        return numpy.cumsum(is_call) - is_call
+
+
+def _tolist(column):
+    return column.tolist()
+
+
+def _full(size, value):
+    if numpy is None:
+        return [value] * size
+    else:
+        return numpy.full(size, value, bool)
+
+
+def _and(left, right):
+    if numpy is None:
+        return [a and b for a, b in zip(left, right)]
+    else:
+        return left & right
+
+
+def _or(left, right):
+    if numpy is None:
+        return [a or b for a, b in zip(left, right)]
+    else:
+        return left | right
+
+
+def _not(mask):
+    if numpy is None:
+        return [not i for i in mask]
+    else:
+        return ~mask
+
+
+def _count(mask):
+    if numpy is None:
+        return sum(mask)
+    else:
+        return int(numpy.count_nonzero(mask))
+
+
+def _equal(column, value):
+    if numpy is None:
+        return [i == value for i in column]
+    else:
+        return column == value
+
+
+def _unique_mask(column, evaluate):
+    """
+    Evaluate ``evaluate`` once for each distinct value in ``column`` and map the results back to every row.
+    """
+    if numpy is None:
+        cache = {}
+        mask = []
+        for value in column:
+            result = cache.get(value)
+            if result is None:
+                result = cache[value] = bool(evaluate(value))
+            mask.append(result)
+        return mask
+    else:
+        unique, inverse = numpy.unique(column, return_inverse=True)
+        matches = numpy.fromiter((bool(evaluate(value)) for value in unique.tolist()), bool, len(unique))
+        return matches[inverse.reshape(-1)]
+
+
+def _value_counts(column):
+    if numpy is None:
+        counts = defaultdict(int)
+        for value in column:
+            counts[value] += 1
+        return counts
+    else:
+        unique, counts = numpy.unique(column, return_counts=True)
+        return dict(zip(unique.tolist(), counts.tolist()))
+
+
+def _group_positions(column):
+    if numpy is None:
+        groups = defaultdict(list)
+        for position, value in enumerate(column):
+            groups[value].append(position)
+        return dict(groups)
+    else:
+        order = numpy.argsort(column, kind='stable')
+        unique, starts = numpy.unique(column[order], return_index=True)
+        return dict(zip(unique.tolist(), numpy.split(order, starts[1:])))
+
+
+def _concatenate(chunks):
+    if numpy is None:
+        return sorted(position for chunk in chunks for position in chunk)
+    else:
+        return numpy.sort(numpy.concatenate(chunks))
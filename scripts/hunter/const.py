@@ -1,20 +1,41 @@
 import site
 import sys
-from distutils.sysconfig import get_python_lib
+import sysconfig
 
-SITE_PACKAGES_PATHS = set()
-if hasattr(site, 'getsitepackages'):
-    SITE_PACKAGES_PATHS.update(site.getsitepackages())
-if hasattr(site, 'getusersitepackages'):
-    SITE_PACKAGES_PATHS.add(site.getusersitepackages())
-SITE_PACKAGES_PATHS.add(get_python_lib())
-SITE_PACKAGES_PATHS = tuple(SITE_PACKAGES_PATHS)
+_SITE_PACKAGES_PATHS = None
+_SYS_PREFIX_PATHS = None
 
-SYS_PREFIX_PATHS = set((
-    sys.prefix,
-    sys.exec_prefix
-))
-for prop in 'real_prefix', 'real_exec_prefix', 'base_prefix', 'base_exec_prefix':
-    if hasattr(sys, prop):
-        SYS_PREFIX_PATHS.add(getattr(sys, prop))
-SYS_PREFIX_PATHS = tuple(SYS_PREFIX_PATHS)
+
+def get_site_packages_paths():
+    """
+    The site-packages directories. Computed on first use (``site`` and ``sysconfig`` lookups are slow).
+    """
+    global _SITE_PACKAGES_PATHS
+
+    if _SITE_PACKAGES_PATHS is None:
+        paths = set()
+        if hasattr(site, 'getsitepackages'):
+            paths.update(site.getsitepackages())
+        if hasattr(site, 'getusersitepackages'):
+            paths.add(site.getusersitepackages())
+        paths.add(sysconfig.get_paths()['purelib'])
+        _SITE_PACKAGES_PATHS = tuple(paths)
+    return _SITE_PACKAGES_PATHS
+
+
+def get_sys_prefix_paths():
+    """
+    The prefixes of the standard library. Computed on first use.
+    """
+    global _SYS_PREFIX_PATHS
+
+    if _SYS_PREFIX_PATHS is None:
+        paths = set((
+            sys.prefix,
+            sys.exec_prefix
+        ))
+        for prop in 'real_prefix', 'real_exec_prefix', 'base_prefix', 'base_exec_prefix':
+            if hasattr(sys, prop):
+                paths.add(getattr(sys, prop))
+        _SYS_PREFIX_PATHS = tuple(paths)
+    return _SYS_PREFIX_PATHS
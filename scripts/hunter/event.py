@@ -10,8 +10,8 @@ from threading import current_thread
 
 from fields import Fields
 
-from .const import SITE_PACKAGES_PATHS
-from .const import SYS_PREFIX_PATHS
+from .const import get_site_packages_paths
+from .const import get_sys_prefix_paths
 from .util import cached_property
 
 try:
@@ -169,10 +169,10 @@ class Event(Fields.kind.depth.function.module.filename):
         """
         A boolean flag. ``True`` if frame is in stdlib.
         """
-        if self.filename.startswith(SITE_PACKAGES_PATHS):
+        if self.filename.startswith(get_site_packages_paths()):
             # if it's in site-packages then its definitely not stdlib
             return False
-        elif self.filename.startswith(SYS_PREFIX_PATHS):
+        elif self.filename.startswith(get_sys_prefix_paths()):
             return True
         else:
             return False
@@ -190,39 +190,81 @@ class Event(Fields.kind.depth.function.module.filename):
             return "??? NO SOURCE: {!r}".format(exc)
 
     @cached_property
-    def source(self, getline=linecache.getline):
+    def source(self):
         """
         A string with the sourcecode for the current line (from ``linecache`` - failures are ignored).
 
         Fast but sometimes incomplete.
         """
         try:
-            return getline(self.filename, self.lineno)
+            return self._source_entry[0]
         except Exception as exc:
             return "??? NO SOURCE: {!r}".format(exc)
 
     @cached_property
-    def _raw_fullsource(self,
-                        getlines=linecache.getlines,
-                        getline=linecache.getline,
-                        generate_tokens=tokenize.generate_tokens):
-        if self.kind == 'call' and self.code.co_name != "<module>":
-            lines = []
-            try:
-                for _, token, _, _, line in generate_tokens(partial(
-                    next,
-                    yield_lines(self.filename, self.lineno - 1, lines.append)
-                )):
-                    if token in ("def", "class", "lambda"):
-                        return ''.join(lines)
-            except tokenize.TokenError:
-                pass
-
-        return getline(self.filename, self.lineno)
+    def _raw_fullsource(self):
+        entry = self._source_entry
+        if entry[1] is None:
+            if entry[2]:
+                entry[1] = get_fullsource(self.filename, self.lineno)
+            else:
+                entry[1] = entry[0]
+        return entry[1]
+
+    @cached_property
+    def _source_entry(self):
+        return get_source_entry(self.filename, self.lineno, self.kind == 'call' and self.code.co_name != "<module>")
 
     __getitem__ = object.__getattribute__
 
 
+#: Process-wide cache of ``filename => (linecache entry, {(lineno, is-definition) => [source, fullsource, is-definition]})``.
+#: A file's entries are dropped as soon as ``linecache`` holds another entry for it (eg: once ``linecache.checkcache``
+#: notices the file changed) so stale sources don't outlive the lines they came from. The fullsource is resolved on
+#: first use.
+SOURCE_CACHE = {}
+
+
+def get_source_entry(filename, lineno, definition,
+                     cache=SOURCE_CACHE,
+                     getline=linecache.getline):
+    # Looked up on each call: linecache.clearcache() rebinds it (before Python 3.9)
+    lines = linecache.cache.get(filename)
+    file_cache = cache.get(filename)
+    if file_cache is not None and file_cache[0] is lines:
+        entry = file_cache[1].get((lineno, definition))
+        if entry is not None:
+            return entry
+    source = getline(filename, lineno)
+    entry = [source, None, definition]
+    # The lookup may have (re)loaded the file
+    lines = linecache.cache.get(filename)
+    if lines is None:
+        cache.pop(filename, None)
+    else:
+        if file_cache is None or file_cache[0] is not lines:
+            file_cache = cache[filename] = lines, {}
+        file_cache[1][lineno, definition] = entry
+    return entry
+
+
+def get_fullsource(filename, lineno,
+                   getline=linecache.getline,
+                   generate_tokens=tokenize.generate_tokens):
+    lines = []
+    try:
+        for _, token, _, _, line in generate_tokens(partial(
+            next,
+            yield_lines(filename, lineno - 1, lines.append)
+        )):
+            if token in ("def", "class", "lambda"):
+                return ''.join(lines)
+    except tokenize.TokenError:
+        pass
+
+    return getline(filename, lineno)
+
+
 def yield_lines(filename, start, collector,
                 limit=10,
                 getlines=linecache.getlines,
@@ -1,14 +1,19 @@
 from __future__ import absolute_import
 
-import inspect
+import random
 import re
 from itertools import chain
 
-from fields import Fields
-from six import string_types
-
 from .actions import Action
 from .event import Event
+from .util import CompactFields
+from .util import cached_hash
+from .util import string_types
+
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
 
 ALLOWED_KEYS = tuple(i for i in Event.__dict__.keys() if not i.startswith('_') and i not in ('tracer', 'thread'))
 ALLOWED_OPERATORS = (
@@ -25,12 +30,15 @@ def _sloppy_hash(obj):
         return 'id(%x)' % id(obj)
 
 
-class Query(Fields.query_eq.query_startswith.query_endswith.query_in.query_contains):
+class Query(CompactFields.query_eq.query_startswith.query_endswith.query_in.query_contains):
     """
     A query class.
 
     See :class:`hunter.Event` for fields that can be filtered on.
     """
+
+    __slots__ = 'query_regex', 'query_lt', 'query_lte', 'query_gt', 'query_gte'
+
     def __init__(self, **query):
         """
         Args:
@@ -226,18 +234,20 @@ class Query(Fields.query_eq.query_startswith.query_endswith.query_in.query_conta
     __rand__ = __and__
 
 
-class When(Fields.condition.actions):
+class When(CompactFields.condition.actions):
     """
     Runs ``actions`` when ``condition(event)`` is ``True``.
 
     Actions take a single ``event`` argument.
     """
 
+    __slots__ = ()
+
     def __init__(self, condition, *actions):
         if not actions:
             raise TypeError('Must give at least one action.')
         super(When, self).__init__(condition, tuple(
-            action() if inspect.isclass(action) and issubclass(action, Action) else action
+            action() if isinstance(action, type) and issubclass(action, Action) else action
             for action in actions))
 
     def __str__(self):
@@ -273,11 +283,13 @@ class When(Fields.condition.actions):
     __rand__ = __and__
 
 
-class And(Fields.predicates):
+class And(CompactFields.predicates):
     """
     `And` predicate. Exits at the first sub-predicate that returns ``False``.
     """
 
+    __slots__ = ()
+
     def __init__(self, *predicates):
         self.predicates = predicates
 
@@ -313,18 +325,22 @@ class And(Fields.predicates):
     def __invert__(self):
         return Not(self)
 
-    def __hash__(self):
-        return hash(frozenset(self.predicates))
+    def _hash_key(self):
+        return frozenset(self.predicates)
+
+    __hash__ = cached_hash
 
     __ror__ = __or__
     __rand__ = __and__
 
 
-class Or(Fields.predicates):
+class Or(CompactFields.predicates):
     """
     `Or` predicate. Exits at first sub-predicate that returns ``True``.
     """
 
+    __slots__ = ()
+
     def __init__(self, *predicates):
         self.predicates = predicates
 
@@ -360,18 +376,22 @@ class Or(Fields.predicates):
     def __invert__(self):
         return Not(self)
 
-    def __hash__(self):
-        return hash(frozenset(self.predicates))
+    def _hash_key(self):
+        return frozenset(self.predicates)
+
+    __hash__ = cached_hash
 
     __ror__ = __or__
     __rand__ = __and__
 
 
-class Not(Fields.predicate):
+class Not(CompactFields.predicate):
     """
     `Not` predicate.
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return 'Not(%s)' % self.predicate
 
@@ -401,3 +421,118 @@ class Not(Fields.predicate):
 
     __ror__ = __or__
     __rand__ = __and__
+
+
+class Sample(CompactFields.every_n.probability):
+    """
+    Sampling predicate. Returns ``True`` for every ``every_n``-th event of each location (code object and line), and/or
+    with the given ``probability``.
+
+    Example: ``When(Sample(every_n=1000), CallPrinter)`` prints one out of a thousand events of each line.
+    """
+
+    __slots__ = '_counters',
+
+    def __init__(self, every_n=None, probability=None):
+        if every_n is None and probability is None:
+            raise TypeError('Sample requires every_n and/or probability.')
+        if every_n is not None and every_n < 1:
+            raise ValueError('Value %r for every_n is invalid. Must be a positive number.' % (every_n,))
+        if probability is not None and not 0 <= probability <= 1:
+            raise ValueError('Value %r for probability is invalid. Must be between 0 and 1.' % (probability,))
+        self.every_n = every_n
+        self.probability = probability
+        self._counters = {}
+
+    def __str__(self):
+        return 'Sample(every_n=%r, probability=%r)' % (self.every_n, self.probability)
+
+    def __repr__(self):
+        return '<hunter.predicates.Sample: every_n=%r, probability=%r>' % (self.every_n, self.probability)
+
+    def __call__(self, event, random=random.random):
+        """
+        Handles the event.
+        """
+        if self.every_n is not None:
+            key = event.code, event.lineno
+            count = self._counters.get(key, 0)
+            self._counters[key] = count + 1
+            if count % self.every_n:
+                return False
+        if self.probability is not None:
+            return random() < self.probability
+        return True
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    __ror__ = __or__
+    __rand__ = __and__
+
+
+THROTTLE_SCOPES = 'code', 'line', 'global'
+
+
+class Throttle(CompactFields.max_per_second.per):
+    """
+    Rate limiting predicate. Returns ``True`` for at most ``max_per_second`` events each second, counted per code object
+    (``per='code'``), per line (``per='line'``) or for all the events (``per='global'``).
+
+    Example: ``When(Q(function='handle') & Throttle(max_per_second=10), CallPrinter)``.
+    """
+
+    __slots__ = '_windows',
+
+    def __init__(self, max_per_second, per='code'):
+        if per not in THROTTLE_SCOPES:
+            raise ValueError('Value %r for per is invalid. Must be one of %s.' % (per, THROTTLE_SCOPES))
+        self.max_per_second = max_per_second
+        self.per = per
+        # key => [second, count]
+        self._windows = {}
+
+    def __str__(self):
+        return 'Throttle(max_per_second=%r, per=%r)' % (self.max_per_second, self.per)
+
+    def __repr__(self):
+        return '<hunter.predicates.Throttle: max_per_second=%r, per=%r>' % (self.max_per_second, self.per)
+
+    def __call__(self, event, monotonic=monotonic):
+        """
+        Handles the event.
+        """
+        per = self.per
+        if per == 'code':
+            key = event.code
+        elif per == 'line':
+            key = event.code, event.lineno
+        else:
+            key = None
+        second = int(monotonic())
+        window = self._windows.get(key)
+        if window is None or window[0] != second:
+            self._windows[key] = [second, 1]
+            return self.max_per_second >= 1
+        if window[1] >= self.max_per_second:
+            return False
+        window[1] += 1
+        return True
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    __ror__ = __or__
+    __rand__ = __and__
@@ -0,0 +1,384 @@
+from __future__ import absolute_import
+
+import atexit
+import mmap
+import os
+import struct
+import threading
+import weakref
+import zlib
+
+from .actions import Action
+from .event import Event
+
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+
+__all__ = 'TraceRecorder', 'TraceReader', 'RecordedEvent'
+
+MAGIC = b'HNTRTRC\x00'
+VERSION = 1
+
+KINDS = ('call', 'line', 'return', 'exception', 'c_call', 'c_return', 'c_exception')
+KIND_IDS = {kind: i for i, kind in enumerate(KINDS)}
+
+BLOCK_TABLES = 1
+BLOCK_EVENTS = 2
+FLAG_ZLIB = 1
+
+#: magic, version, reserved
+HEADER = struct.Struct('<8sHH')
+#: block type, flags, raw size, stored size
+BLOCK_HEADER = struct.Struct('<BBII')
+#: kind, code id, lineno, depth, thread id, monotonic timestamp
+EVENT_RECORD = struct.Struct('<BIIiQd')
+#: tag, string id, length (followed by the utf-8 encoded string)
+STRING_ENTRY = struct.Struct('<BII')
+#: tag, code id, filename id, function id, module id, first lineno
+CODE_ENTRY = struct.Struct('<BIIIII')
+
+TAG_STRING = 1
+TAG_CODE = 2
+
+
+class TraceRecorder(Action):
+    """
+    An action that records events to a compact binary file, for replaying or querying them later (see
+    :class:`hunter.recorder.TraceReader`). No formatting is done in the traced process.
+
+    Each event is stored as a fixed size record (kind, code id, lineno, depth, thread id and a monotonic timestamp).
+    Filenames, function and module names are interned in a string table that is written alongside the events.
+
+    Args:
+        path (str): File to write to. It's truncated if it exists.
+        compress (bool): Compress each block with ``zlib``. Default: ``False``.
+        compress_level (int): The ``zlib`` compression level. Default: ``1``.
+        block_size (int): Size of the event buffer flushed as a single block. Default: ``65536``.
+    """
+
+    def __init__(self, path, compress=False, compress_level=1, block_size=65536):
+        self.path = path
+        self.compress = compress
+        self.compress_level = compress_level
+        self.block_size = block_size
+
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0))
+        self._lock = threading.Lock()
+        self._strings = {}
+        self._codes = {}
+        self._tables = bytearray()
+        self._events = bytearray()
+
+        @atexit.register
+        def atexit_cleanup(ref=weakref.ref(self)):
+            recorder = ref()
+            if recorder is not None:
+                recorder.close()
+
+    def __repr__(self):
+        return '<hunter.recorder.TraceRecorder: path=%r, compress=%r>' % (self.path, self.compress)
+
+    def _intern_string(self, value):
+        sid = self._strings.get(value)
+        if sid is None:
+            sid = self._strings[value] = len(self._strings)
+            data = value.encode('utf-8', 'surrogateescape')
+            self._tables += STRING_ENTRY.pack(TAG_STRING, sid, len(data))
+            self._tables += data
+        return sid
+
+    def _intern_code(self, event):
+        code = event.code
+        cid = self._codes.get(code)
+        if cid is None:
+            cid = self._codes[code] = len(self._codes)
+            self._tables += CODE_ENTRY.pack(
+                TAG_CODE, cid,
+                self._intern_string(event.filename),
+                self._intern_string(code.co_name),
+                self._intern_string(event.module),
+                code.co_firstlineno,
+            )
+        return cid
+
+    def __call__(self, event):
+        """
+        Pack the event and buffer it. The buffer is written out once it reaches ``block_size``.
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._events += EVENT_RECORD.pack(
+                KIND_IDS[event.kind],
+                self._intern_code(event),
+                event.lineno,
+                event.depth,
+                event.threadid or 0,
+                monotonic(),
+            )
+            if len(self._events) >= self.block_size:
+                self._flush()
+
+    def _write_block(self, kind, data):
+        flags = 0
+        stored = bytes(data)
+        if self.compress:
+            flags |= FLAG_ZLIB
+            stored = zlib.compress(stored, self.compress_level)
+        self._file.write(BLOCK_HEADER.pack(kind, flags, len(data), len(stored)))
+        self._file.write(stored)
+
+    def _flush(self):
+        # The tables must always precede the events that reference them.
+        if self._tables:
+            self._write_block(BLOCK_TABLES, self._tables)
+            self._tables = bytearray()
+        if self._events:
+            self._write_block(BLOCK_EVENTS, self._events)
+            self._events = bytearray()
+
+    def flush(self):
+        """
+        Write out any buffered events.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+                self._file.flush()
+
+    def close(self):
+        """
+        Write out any buffered events and close the file. Events received afterwards are ignored.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class RecordedCode(object):
+    """
+    Stand-in for the code object of a recorded event. Only the name and the first line number are known.
+    """
+    co_varnames = ()
+    co_argcount = 0
+
+    def __init__(self, name, firstlineno, filename):
+        self.co_name = name
+        self.co_firstlineno = firstlineno
+        self.co_filename = filename
+
+    def __repr__(self):
+        return '<recorded code %s, file %r, line %s>' % (self.co_name, self.co_filename, self.co_firstlineno)
+
+
+class RecordedThread(object):
+    """
+    Stand-in for the thread object of a recorded event.
+    """
+
+    def __init__(self, ident, name):
+        self.ident = ident
+        self.name = name
+
+    def __repr__(self):
+        return '<recorded thread %s, ident %s>' % (self.name, self.ident)
+
+
+MAIN_THREAD = RecordedThread(None, 'MainThread')
+
+
+class ReplayTracer(object):
+    """
+    Stand-in for :class:`hunter.tracer.Tracer` given to the actions run by :meth:`TraceReader.replay`.
+    """
+
+    def __init__(self, threading_support=False):
+        self.threading_support = threading_support
+        self.depth = 0
+        self.calls = 0
+        self._stop_callbacks = []
+
+    def add_stop_callback(self, callback):
+        """
+        Register a function to call (without arguments) once the replay is done. Used by actions that need to flush.
+        """
+        self._stop_callbacks.append(callback)
+
+    def stop(self):
+        for callback in self._stop_callbacks:
+            callback()
+
+
+class RecordedEvent(Event):
+    """
+    An :class:`hunter.event.Event` rebuilt from a recording. There's no frame, so ``locals``, ``globals`` and ``arg``
+    are always empty. The ``source`` and ``fullsource`` properties are still looked up through ``linecache``.
+    """
+
+    def __init__(self, kind, code, module, lineno, depth, calls, threadid, timestamp, tracer):
+        self.frame = None
+        self.kind = kind
+        self.arg = None
+        self.depth = depth
+        self.calls = calls
+        self.tracer = tracer
+        self.timestamp = timestamp
+
+        # prime the cached properties that would otherwise need the frame
+        self.__dict__.update(
+            code=code,
+            function=code.co_name,
+            filename=code.co_filename,
+            module=module,
+            lineno=lineno,
+            locals={},
+            globals={},
+            threadid=threadid or None,
+        )
+        if threadid:
+            self.thread = RecordedThread(threadid, 'Thread-%s' % threadid)
+        else:
+            self.thread = MAIN_THREAD
+        self.threadname = self.thread.name
+
+
+class TraceReader(object):
+    """
+    Reads a file written by :class:`hunter.recorder.TraceRecorder`. The file is memory-mapped and decoded block by
+    block, so only the block being iterated is held in memory.
+
+    Args:
+        path (str): File to read.
+        threading_support (bool): Passed to the actions (via ``event.tracer``) when replaying. Default: ``False``.
+    """
+
+    def __init__(self, path, threading_support=False):
+        self.path = path
+        self.threading_support = threading_support
+        self.strings = []
+        self.codes = []
+        self.modules = []
+
+        with open(path, 'rb') as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError('%r is not a hunter trace (file too short).' % path)
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _ = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError('%r is not a hunter trace (bad magic %r).' % (path, magic))
+        if version != VERSION:
+            raise ValueError('%r has unsupported trace version %s.' % (path, version))
+
+    def __repr__(self):
+        return '<hunter.recorder.TraceReader: path=%r>' % self.path
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _iter_blocks(self):
+        buf = self._mmap
+        offset = HEADER.size
+        end = len(buf)
+        while offset < end:
+            kind, flags, raw_size, stored_size = BLOCK_HEADER.unpack_from(buf, offset)
+            offset += BLOCK_HEADER.size
+            data = buf[offset:offset + stored_size]
+            offset += stored_size
+            if flags & FLAG_ZLIB:
+                data = zlib.decompress(data)
+                if len(data) != raw_size:
+                    raise ValueError('Corrupted block at offset %s in %r.' % (offset - stored_size, self.path))
+            yield kind, data
+
+    def _load_tables(self, data):
+        offset = 0
+        end = len(data)
+        while offset < end:
+            tag = data[offset]
+            if tag == TAG_STRING:
+                _, sid, length = STRING_ENTRY.unpack_from(data, offset)
+                offset += STRING_ENTRY.size
+                assert sid == len(self.strings)
+                self.strings.append(data[offset:offset + length].decode('utf-8', 'surrogateescape'))
+                offset += length
+            elif tag == TAG_CODE:
+                _, cid, filename, function, module, firstlineno = CODE_ENTRY.unpack_from(data, offset)
+                offset += CODE_ENTRY.size
+                assert cid == len(self.codes)
+                self.codes.append(RecordedCode(self.strings[function], firstlineno, self.strings[filename]))
+                self.modules.append(self.strings[module])
+            else:
+                raise ValueError('Unknown table entry %r in %r.' % (tag, self.path))
+
+    def iter_event_blocks(self):
+        """
+        Iterate the (decompressed) event blocks, each a buffer of packed ``EVENT_RECORD`` structs. The string and code
+        tables are loaded as a side effect.
+        """
+        del self.strings[:], self.codes[:], self.modules[:]
+        for kind, data in self._iter_blocks():
+            if kind == BLOCK_TABLES:
+                self._load_tables(data)
+            elif kind == BLOCK_EVENTS:
+                yield data
+
+    def iter_records(self):
+        """
+        Iterate the raw ``(kind id, code id, lineno, depth, thread id, timestamp)`` tuples. The string and code tables
+        are loaded as a side effect.
+        """
+        iter_unpack = EVENT_RECORD.iter_unpack
+        for data in self.iter_event_blocks():
+            for record in iter_unpack(data):
+                yield record
+
+    def __iter__(self):
+        """
+        Iterate :class:`RecordedEvent` objects, in the order they were recorded.
+        """
+        return self._events(ReplayTracer(self.threading_support))
+
+    def _events(self, tracer):
+        codes = self.codes
+        modules = self.modules
+        for kind, cid, lineno, depth, threadid, timestamp in self.iter_records():
+            kind = KINDS[kind]
+            tracer.depth = depth
+            yield RecordedEvent(kind, codes[cid], modules[cid], lineno, depth, tracer.calls, threadid, timestamp,
+                                tracer)
+            if kind == 'call':
+                tracer.calls += 1
+
+    def replay(self, *predicates, **options):
+        """
+        Run the recorded events through predicates and actions, as :func:`hunter.trace` would have. Takes the same
+        arguments (``action`` defaults to :class:`hunter.CallPrinter`).
+        """
+        from . import _prepare_predicate
+
+        predicate = _prepare_predicate(*predicates, **options)
+        tracer = ReplayTracer(self.threading_support)
+        try:
+            for event in self._events(tracer):
+                predicate(event)
+        finally:
+            tracer.stop()
@@ -7,6 +7,7 @@ import os
 import signal
 import socket
 import sys
+import threading
 import time
 from contextlib import closing
 from contextlib import contextmanager
@@ -28,24 +29,124 @@ def install(**kwargs):
 
 
 class RemoteStream(object):
-    def __init__(self, path, isatty, encoding):
+    """
+    Stream that sends the trace output to the ``hunter-trace`` process over an unix socket.
+
+    Writes are collected (per thread) until one ends a line, or until ``flush()``: that output (usually an event) is
+    an entry. Entries are appended to a buffer and a background thread sends the buffer in batches, when it reaches
+    ``batch_size`` characters or every ``interval`` seconds. The buffer holds at most ``max_buffer`` characters:
+    entries that don't fit are dropped whole (and counted) so a slow reader never stalls the traced process. The count
+    is reported on close.
+    """
+
+    def __init__(self, path, isatty, encoding, batch_size=65536, interval=0.05, max_buffer=4 * 1024 * 1024):
         self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         self._sock.connect(path)
         self._isatty = isatty
         self._encoding = encoding
+        self._batch_size = batch_size
+        self._interval = interval
+        self._max_buffer = max_buffer
+
+        self._pending = threading.local()
+        self._chunks = []
+        self._size = 0
+        self._dropped = 0
+        self._error = None
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+
+        # Started right away so that it's not traced when using ``threading_support``.
+        self._thread = threading.Thread(target=self._run, name='hunter.RemoteStream')
+        self._thread.daemon = True
+        self._thread.start()
 
     def isatty(self):
         return self._isatty
 
-    def write(self, data):
+    @property
+    def dropped(self):
+        """
+        Number of entries dropped because the buffer was full.
+        """
+        return self._dropped
+
+    def _pending_chunks(self):
         try:
-            self._sock.send(data.encode(self._encoding))
-        except Exception as exc:
-            print("Hunter failed to send trace output: %s. Stopping tracer." % exc, file=sys.stderr)
+            return self._pending.chunks
+        except AttributeError:
+            chunks = self._pending.chunks = []
+            return chunks
+
+    def write(self, data):
+        if self._error is not None:
+            print("Hunter failed to send trace output: %s. Stopping tracer." % self._error, file=sys.stderr)
+            self._error = None
             stop()
+            return
+        chunks = self._pending_chunks()
+        chunks.append(data)
+        if data.endswith('\n'):
+            self._add_entry(chunks)
+
+    def _add_entry(self, chunks):
+        entry = ''.join(chunks)
+        del chunks[:]
+        with self._condition:
+            if self._closed or not entry:
+                return
+            size = self._size + len(entry)
+            if size > self._max_buffer:
+                self._dropped += 1
+                return
+            self._chunks.append(entry)
+            self._size = size
+            if size >= self._batch_size:
+                self._condition.notify()
 
     def flush(self):
-        pass
+        """
+        End the current entry and wake up the sender. Doesn't wait for the data to be sent.
+        """
+        self._add_entry(self._pending_chunks())
+        with self._condition:
+            self._condition.notify()
+
+    def _run(self):
+        sys.settrace(None)
+        condition = self._condition
+        while True:
+            with condition:
+                if self._size < self._batch_size and not self._closed:
+                    condition.wait(self._interval)
+                chunks = self._chunks
+                closed = self._closed
+                self._chunks = []
+                self._size = 0
+            if chunks:
+                try:
+                    self._sock.sendall(''.join(chunks).encode(self._encoding))
+                except Exception as exc:
+                    self._error = exc
+                    return
+            if closed:
+                return
+
+    def close(self):
+        """
+        Send everything that's buffered, then a trailer with the number of dropped entries (if any) and close the
+        socket.
+        """
+        self._add_entry(self._pending_chunks())
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            if self._dropped:
+                self._chunks.append("\nHunter dropped %s trace entries (the output buffer was full).\n" % self._dropped)
+            self._condition.notify()
+        self._thread.join()
+        self._sock.close()
 
 
 @contextmanager
@@ -115,6 +216,7 @@ def activate(sink_path, isatty, encoding, options):
             'Tracer options where: %s.' % options if options else 'No tracer options.'
         ))
         actions.DEFAULT_STREAM = sys.stderr
+        stream.close()
         raise
 
 
@@ -122,8 +224,11 @@ trace  # used in eval above
 
 
 def deactivate():
+    stream = actions.DEFAULT_STREAM
     actions.DEFAULT_STREAM = sys.stderr
     stop()
+    if isinstance(stream, RemoteStream):
+        stream.close()
 
 
 parser = argparse.ArgumentParser(description='Trace a process.')
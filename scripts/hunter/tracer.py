@@ -19,6 +19,7 @@ class Tracer(object):
         self.threading_support = threading_support
         self.depth = 0
         self.calls = 0
+        self._stop_callbacks = []
 
     @property
     def handler(self):
@@ -57,6 +58,12 @@ class Tracer(object):
 
             return self
 
+    def add_stop_callback(self, callback):
+        """
+        Register a function to call (without arguments) after tracing is stopped. Used by actions that need to flush.
+        """
+        self._stop_callbacks.append(callback)
+
     def trace(self, predicate):
         self._handler = predicate
         if self.threading_support:
@@ -73,6 +80,8 @@ class Tracer(object):
             if self.threading_support:
                 threading.settrace(self._threading_previous)
                 self._threading_previous = None
+            for callback in self._stop_callbacks:
+                callback()
 
     def __enter__(self):
         return self
@@ -1,8 +1,99 @@
+import sys
+from operator import attrgetter
+
 import fields
 
+try:
+    string_types = basestring,  # noqa: F821
+except NameError:
+    string_types = str,
+
 Fields = fields.factory(fields.class_sealer, initializer=False, base=object)
 
 
+def cached_hash(self):
+    """
+    A ``__hash__`` for the ``CompactFields`` classes: hashes ``self._hash_key()`` once and keeps it in ``self._hash``.
+    Classes that override ``__eq__`` must set ``__hash__ = cached_hash`` again.
+    """
+    try:
+        return self._hash
+    except AttributeError:
+        value = self._hash = hash(self._hash_key())
+        return value
+
+
+def compact_class_sealer(fields_, defaults):
+    """
+    Like ``fields.class_sealer`` but for the objects that are called on every event (predicates):
+
+    * the fields are ``__slots__`` (subclasses must list their other attributes in ``__slots__`` too),
+    * comparisons use an ``operator.attrgetter`` instead of building tuples from generators,
+    * the hash is computed once (these objects must not be changed after ``__init__``).
+    """
+    baseclass_name = 'CompactFieldsBase_for__{0}'.format('__'.join(fields_))
+    global_namespace, local_namespace = fields.make_init_func(fields_, defaults, baseclass_name, super_call=False)
+    key = attrgetter(*fields_)
+
+    class CompactFieldsBase(object):
+        __slots__ = tuple(fields_) + ('_hash',)
+        __init__ = local_namespace['__init__']
+
+        def __eq__(self, other):
+            if isinstance(other, self.__class__):
+                return key(self) == key(other)
+            else:
+                return NotImplemented
+
+        def __ne__(self, other):
+            result = self.__eq__(other)
+            if result is NotImplemented:
+                return NotImplemented
+            else:
+                return not result
+
+        def __lt__(self, other):
+            if isinstance(other, self.__class__):
+                return key(self) < key(other)
+            else:
+                return NotImplemented
+
+        def __le__(self, other):
+            if isinstance(other, self.__class__):
+                return key(self) <= key(other)
+            else:
+                return NotImplemented
+
+        def __gt__(self, other):
+            if isinstance(other, self.__class__):
+                return key(self) > key(other)
+            else:
+                return NotImplemented
+
+        def __ge__(self, other):
+            if isinstance(other, self.__class__):
+                return key(self) >= key(other)
+            else:
+                return NotImplemented
+
+        __hash__ = cached_hash
+
+        def _hash_key(self):
+            return key(self)
+
+        def __repr__(self):
+            return "{0}({1})".format(
+                self.__class__.__name__,
+                ", ".join("{0}={1}".format(attr, repr(getattr(self, attr))) for attr in fields_)
+            )
+
+    global_namespace[baseclass_name] = CompactFieldsBase
+    return CompactFieldsBase
+
+
+CompactFields = fields.factory(compact_class_sealer)
+
+
 class cached_property(object):
     def __init__(self, func):
         self.func = func
@@ -13,3 +104,141 @@ class cached_property(object):
             return self
         value = obj.__dict__[self.func.__name__] = self.func(obj)
         return value
+
+
+def bounded_repr(obj, limit):
+    """
+    Like ``repr(obj)`` but stops rendering the builtin containers, strings and bytes once about ``limit`` characters
+    were produced (truncated parts are marked with ``...``). Objects that fit in the limit get the same output as
+    ``repr()``.
+
+    Other types can be handled by adding a ``function(obj, budget, active)`` to ``REPR_HANDLERS`` (or to
+    ``LAZY_REPR_HANDLERS`` under the qualified type name, for types from modules that might not be imported).
+    """
+    return _bounded_repr(obj, limit, set())
+
+
+def _bounded_repr(obj, budget, active):
+    cls = type(obj)
+    handler = REPR_HANDLERS.get(cls)
+    if handler is None:
+        handler = _lookup_lazy_handler(cls)
+    if handler is None:
+        return repr(obj)
+    return handler(obj, budget, active)
+
+
+def _lookup_lazy_handler(cls, missing=set()):
+    if cls in missing:
+        return None
+    try:
+        name = '%s.%s' % (cls.__module__, cls.__name__)
+    except AttributeError:
+        name = None
+    handler = LAZY_REPR_HANDLERS.get(name)
+    if handler is None:
+        missing.add(cls)
+    else:
+        REPR_HANDLERS[cls] = handler
+    return handler
+
+
+def _iter_reprs(items, budget, active):
+    size = 0
+    for item in items:
+        if size > budget:
+            yield '...'
+            return
+        part = _bounded_repr(item, budget - size, active)
+        size += len(part) + 2
+        yield part
+
+
+def _container_repr(opening, closing, recursive):
+    def handler(obj, budget, active):
+        ident = id(obj)
+        if ident in active:
+            return recursive
+        active.add(ident)
+        try:
+            return opening + ', '.join(_iter_reprs(obj, budget - len(opening) - len(closing), active)) + closing
+        finally:
+            active.discard(ident)
+    return handler
+
+
+def _tuple_repr(obj, budget, active):
+    if len(obj) == 1:
+        return '(%s,)' % _bounded_repr(obj[0], budget - 3, active)
+    return '(%s)' % ', '.join(_iter_reprs(obj, budget - 2, active))
+
+
+def _set_repr(opening, closing, empty):
+    def handler(obj, budget, active):
+        if not obj:
+            return empty
+        return opening + ', '.join(_iter_reprs(obj, budget - len(opening) - len(closing), active)) + closing
+    return handler
+
+
+def _dict_repr(obj, budget, active):
+    ident = id(obj)
+    if ident in active:
+        return '{...}'
+    active.add(ident)
+    try:
+        parts = []
+        size = 2
+        for key, value in obj.items():
+            if size > budget:
+                parts.append('...')
+                break
+            part = '%s: %s' % (
+                _bounded_repr(key, budget - size, active),
+                _bounded_repr(value, budget - size, active),
+            )
+            size += len(part) + 2
+            parts.append(part)
+        return '{%s}' % ', '.join(parts)
+    finally:
+        active.discard(ident)
+
+
+def _sliced_repr(obj, budget, active):
+    if len(obj) <= budget:
+        return repr(obj)
+    text = repr(obj[:max(budget, 0)])
+    # An escaped character takes up to 10 characters (ie: '\U000e0001')
+    prefix = len(text) - len(text.lstrip('brf'))
+    return text[:max(budget, prefix + 1)] + '...' + text[-1]
+
+
+def _bytearray_repr(obj, budget, active):
+    if len(obj) <= budget:
+        return repr(obj)
+    return 'bytearray(%s)' % _sliced_repr(bytes(obj[:max(budget, 0) + 1]), budget, active)
+
+
+def _numpy_repr(obj, budget, active):
+    # Each element takes at least 3 characters so bigger arrays would exceed the budget anyway.
+    threshold = max(budget // 2, 6)
+    if obj.size <= threshold:
+        return repr(obj)
+    numpy = sys.modules['numpy']
+    with numpy.printoptions(threshold=threshold, edgeitems=3):
+        return repr(obj)
+
+
+REPR_HANDLERS = {
+    list: _container_repr('[', ']', '[...]'),
+    tuple: _tuple_repr,
+    set: _set_repr('{', '}', 'set()'),
+    frozenset: _set_repr('frozenset({', '})', 'frozenset()'),
+    dict: _dict_repr,
+    str: _sliced_repr,
+    bytes: _sliced_repr,
+    bytearray: _bytearray_repr,
+}
+LAZY_REPR_HANDLERS = {
+    'numpy.ndarray': _numpy_repr,
+}
@@ -0,0 +1,112 @@
+import importlib.util
+import os
+import socket
+import sys
+import threading
+import time
+import types
+
+from .. import wolf_attach
+from .session_test import write_script
+
+TARGET = '''def worker(stop, started):
+    while not stop.is_set():
+        started.set()
+        stop  # ?
+
+def main(stop):
+    while not stop.is_set():
+        stop  # ?
+'''
+WORKER_LINE, MAIN_LINE = 4, 8
+
+
+def load_target(directory):
+    path = write_script(directory, TARGET, 'target.py')
+    spec = importlib.util.spec_from_file_location('wolf_attach_target', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return path, module
+
+
+def capture(directory, path):
+    sink = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sink.bind(os.path.join(str(directory), 'sink'))
+    sink.listen(1)
+    return wolf_attach.AttachedCapture(sink.getsockname(), path, sample_every=1, max_per_second=0, interval=60)
+
+
+def test_vendored_modules_are_not_left_imported():
+    assert wolf_attach.wolf.__file__ == os.path.join(wolf_attach.SCRIPTS_DIR, 'wolf.py')
+    assert sys.modules.get('wolf') is not wolf_attach.wolf
+    assert wolf_attach.SCRIPTS_DIR not in sys.path[:1]
+
+
+def test_running_threads_are_captured(tmp_path):
+    path, target = load_target(tmp_path)
+    stop, started = threading.Event(), threading.Event()
+    worker = threading.Thread(target=target.worker, args=(stop, started))
+    worker.start()
+    started.wait()
+
+    attached = capture(tmp_path, path)
+    results = []
+
+    def attach():
+        # From another thread, like the manhole one
+        attached.start()
+        time.sleep(0.2)
+        results.extend(attached.results())
+        stop.set()
+
+    attacher = threading.Thread(target=attach)
+    attacher.start()
+    target.main(stop)
+    attacher.join()
+    worker.join()
+    attached.close()
+
+    lines = [result['lineno'] for result in results]
+    if sys.version_info < (3, 12):
+        # Only the main thread (see `run_in_main_thread`)
+        assert lines == [MAIN_LINE]
+    else:
+        assert lines == [WORKER_LINE, MAIN_LINE]
+    assert all('Event' in result['value'] and not result['error'] for result in results)
+
+
+def test_capture_stops(tmp_path):
+    path, target = load_target(tmp_path)
+    attached = capture(tmp_path, path)
+    attached.start()
+    stop, started = threading.Event(), threading.Event()
+    later = threading.Thread(target=target.worker, args=(stop, started))
+    later.start()
+    time.sleep(0.05)
+    attached.close()
+    hits = attached.results()[0]['hits']
+    time.sleep(0.05)
+    stop.set()
+    later.join()
+    assert hits > 0
+    assert attached.results()[0]['hits'] == hits
+
+
+class Copied(object):
+    copies = 0
+
+    def __deepcopy__(self, memo):
+        Copied.copies += 1
+        return Copied()
+
+
+def test_macros_copy_only_their_variables(tmp_path):
+    path = write_script(tmp_path, 'total = len(items) + n  # ?\n', 'macro.py')
+    attached = capture(tmp_path, path)
+    items = [Copied()]
+    frame = types.SimpleNamespace(f_globals={'items': items, 'unrelated': Copied()},
+                                  f_locals={'n': 1, 'other': Copied()})
+    attached.capture(attached.plan[1], frame)
+    attached.close()
+    assert attached.plan[1].value == 'total = 2'
+    assert Copied.copies == 1
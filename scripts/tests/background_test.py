@@ -0,0 +1,49 @@
+import io
+
+from ..hunter import CallPrinter
+from ..hunter import Q
+from ..hunter.background import Background
+from ..hunter.tracer import Tracer
+
+
+def traced(a):
+    b = a + 1
+    return b * 2
+
+
+class FailingPrinter(CallPrinter):
+    def __call__(self, event):
+        if event.kind == 'line':
+            raise RuntimeError('broken printer')
+        super(FailingPrinter, self).__call__(event)
+
+
+def trace(action):
+    with Tracer().trace(Q(filename=__file__, function='traced', action=action)):
+        traced(1)
+
+
+def test_failing_action_keeps_the_thread(capsys):
+    stream = io.StringIO()
+    background = Background(FailingPrinter(stream=stream, force_colors=False), interval=60)
+    trace(background)
+    trace(background)
+    assert background._thread.is_alive()
+    background.close()
+    assert stream.getvalue().count('=> traced(a=1)') == 2
+    assert capsys.readouterr().err.count('failed to handle a line event in the background') == 4
+
+
+def test_block_without_the_thread():
+    stream = io.StringIO()
+    background = Background(CallPrinter(stream=stream, force_colors=False), maxsize=1, interval=0.01)
+    # As if the thread died
+    with background._condition:
+        background._closed = True
+        background._condition.notify_all()
+    background._thread.join()
+    background._closed = False
+
+    trace(background)  # <- used to wait forever for room in the queue
+    assert len(background._queue) == 1
+    assert background.dropped == 3
@@ -0,0 +1,77 @@
+import pytest
+
+from ..hunter import Q
+from ..hunter import columns
+from ..hunter.columns import TraceTable
+from .recorder_test import record
+from .recorder_test import traced
+
+BODY = traced.__code__.co_firstlineno + 1
+FILENAME = traced.__code__.co_filename
+
+
+@pytest.fixture(params=['numpy', 'array'])
+def table(request, tmp_path, monkeypatch):
+    if request.param == 'array':
+        monkeypatch.setattr(columns, 'numpy', None)
+    elif columns.numpy is None:
+        pytest.skip('numpy is not installed')
+    path, expected = record(tmp_path)
+    table = TraceTable.from_file(path)
+    assert len(table) == len(expected)
+    return table
+
+
+def rows(table):
+    return [(event.kind, event.function, event.lineno, event.depth) for event in table]
+
+
+def test_events_at(table):
+    lines = table.events_at(FILENAME, BODY)
+    assert [(e.kind, e.lineno) for e in lines] == [('line', BODY), ('line', BODY)]
+    assert len(table.events_at(__file__, BODY)) == 0
+    assert len(table.events_at(FILENAME, 10 ** 6)) == 0
+    assert table.function_calls() == {(FILENAME, 'traced'): 2}
+
+
+def test_iteration_in_chunks(table, monkeypatch):
+    everything = rows(table)
+    assert [kind for kind, _, _, _ in everything] == ['call', 'line', 'line', 'return'] * 2
+    monkeypatch.setattr(columns, 'ITER_CHUNK_SIZE', 3)
+    assert rows(table) == everything
+
+
+def test_queries(table):
+    kinds = [event.kind for event in table]
+    assert list(table.mask(kind='line')) == [kind == 'line' for kind in kinds]
+    assert list(table.mask()) == [True] * len(table)
+
+    assert table.count(kind='line') == 4
+    assert table.count(Q(kind='call') | Q(kind='return')) == 4
+    assert table.count(~Q(kind='line'), function='traced') == 4
+    assert table.count(Q(kind='line'), lineno=BODY) == 2
+    assert table.count(lineno_gt=BODY) == 4
+    assert table.count(kind_in=('call', 'return'), filename_endswith='recorder_test.py') == 4
+    assert table.count(function_startswith='other') == 0
+
+    calls = table.select(kind='call')
+    assert rows(calls) == [row for row in rows(table) if row[0] == 'call']
+    assert calls.count(kind='line') == 0
+    with pytest.raises(TypeError):
+        table.count(Q(kind='line', action=print))
+
+
+def test_line_hits(table):
+    assert table.line_hits() == {(FILENAME, BODY): 2, (FILENAME, BODY + 1): 2}
+    assert table.select(kind='call').line_hits() == {}
+
+
+def test_time_per_depth(table):
+    expected = {}
+    events = list(table)
+    for event, following in zip(events, events[1:]):
+        expected[event.depth] = expected.get(event.depth, 0.0) + following.timestamp - event.timestamp
+    totals = table.time_per_depth()
+    assert sorted(totals) == sorted(expected)
+    assert totals == pytest.approx(expected)
+    assert table.select(kind='none').time_per_depth() == {}
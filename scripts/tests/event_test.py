@@ -0,0 +1,46 @@
+import linecache
+
+from ..hunter import Q
+from ..hunter.event import SOURCE_CACHE
+from ..hunter.event import get_source_entry
+from ..hunter.tracer import Tracer
+from .session_test import write_script
+
+
+def trace_sources(path):
+    sources = []
+    module = {'__file__': path, 'dec': lambda f: f}
+    with open(path) as the_file:
+        code = compile(the_file.read(), path, 'exec')
+    with Tracer().trace(Q(filename=path, kind='call', action=lambda event: sources.append(
+            (event.source, event.fullsource)))):
+        exec(code, module)
+        module['f']()
+    return sources
+
+
+def test_source_follows_linecache(tmp_path):
+    path = write_script(tmp_path, 'def f():\n    return 1\n')
+    assert trace_sources(path)[-1] == ('def f():\n', 'def f():\n')
+
+    write_script(tmp_path, '@dec\ndef f(): return 2\n')
+    linecache.clearcache()
+    assert trace_sources(path)[-1] == ('@dec\n', '@dec\ndef f(): return 2\n')
+
+
+def test_stale_sources_are_dropped(tmp_path):
+    path = write_script(tmp_path, 'def f():\n    return 1\n')
+    trace_sources(path)
+    lines, entries = SOURCE_CACHE[path]
+    assert lines is linecache.cache[path]
+    assert (1, True) in entries
+
+    write_script(tmp_path, '\n\ndef f():\n    return 2\n')
+    linecache.checkcache(path)
+    assert trace_sources(path)[-1] == ('def f():\n', 'def f():\n')
+    assert (1, True) not in SOURCE_CACHE[path][1]
+    assert (3, True) in SOURCE_CACHE[path][1]
+
+    linecache.clearcache()
+    get_source_entry(path + '.missing', 1, False)
+    assert path + '.missing' not in SOURCE_CACHE
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the tracer doesn't need, they must only be imported on first use
+LAZY_MODULES = [
+    'astunparse',
+    'colorama',
+    'distutils',
+    'hunter.background',
+    'hunter.recorder',
+    'six',
+]
+
+# Importing wolf is measured against importing this stdlib module in the
+# same interpreter (it takes about as long), so the budget holds on slower
+# machines too. Generous, this is here to catch regressions
+BASELINE_MODULE = 'asyncio'
+BUDGET_FACTOR = float(os.environ.get('WOLF_IMPORT_BUDGET_FACTOR', 3))
+
+
+def importtime(module):
+    """
+        Runs `python -X importtime -c "import <module>"` in a fresh
+        interpreter and returns the cumulative import time of each
+        module, in microseconds.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        cwd=SCRIPTS_DIR, stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+# `-X importtime` and the module level __getattr__ hunter's lazy imports rely
+# on (PEP 562) are both new in Python 3.7
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='requires Python 3.7+')
+def test_importtime():
+    timings = importtime('wolf')
+    eager = [name for name in timings if name.split('.')[0] in LAZY_MODULES or name in LAZY_MODULES]
+    assert eager == []
+    budget = BUDGET_FACTOR * importtime(BASELINE_MODULE)[BASELINE_MODULE]
+    assert timings['wolf'] < budget, 'importing wolf took {}us (budget: {:.0f}us)'.format(timings['wolf'], budget)
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ..hunter.predicates import And
+from ..hunter.predicates import Not
+from ..hunter.predicates import Or
+from ..hunter.predicates import Query
+from ..hunter.predicates import Sample
+from ..hunter.predicates import Throttle
+
+
+def events(code, *linenos):
+    return [SimpleNamespace(code=code, lineno=lineno) for lineno in linenos]
+
+
+def test_sample_every_n_per_location():
+    sample = Sample(every_n=3)
+    first, second = events('first', 1, 1, 2, 1, 2, 1, 2), events('second', 1, 1)
+    assert [sample(event) for event in first] == [True, False, True, False, False, True, False]
+    assert [sample(event) for event in second] == [True, False]
+
+
+def test_sample_probability():
+    assert [Sample(probability=0.5)(event, random=lambda: 0.4) for event in events('code', 1, 1)] == [True, True]
+    assert Sample(probability=0.5)(events('code', 1)[0], random=lambda: 0.5) is False
+    # Both: the probability only applies to the every_n-th events
+    sample = Sample(every_n=2, probability=1)
+    assert [sample(event) for event in events('code', 1, 1, 1)] == [True, False, True]
+
+
+def test_sample_arguments():
+    for kwargs, error in [({}, TypeError), ({'every_n': 0}, ValueError), ({'probability': 2}, ValueError)]:
+        with pytest.raises(error):
+            Sample(**kwargs)
+
+
+def test_throttle_scopes():
+    one, other = events('code', 1, 2)
+    clock = iter([0.1, 0.2, 0.3, 0.4, 1.0, 1.1]).__next__
+
+    throttle = Throttle(max_per_second=2, per='code')
+    assert [throttle(event, monotonic=clock) for event in [one, other, one, other, one, one]] == [
+        True, True, False, False, True, True]
+
+    clock = iter([0.1, 0.2, 0.3, 0.4]).__next__
+    throttle = Throttle(max_per_second=1, per='line')
+    assert [throttle(event, monotonic=clock) for event in [one, other, one, other]] == [True, True, False, False]
+
+    clock = iter([0.1, 0.2, 0.3]).__next__
+    throttle = Throttle(max_per_second=1, per='global')
+    assert [throttle(event, monotonic=clock) for event in events('other', 1) + [one, other]] == [True, False, False]
+
+    assert Throttle(max_per_second=0)(one) is False
+    with pytest.raises(ValueError):
+        Throttle(max_per_second=1, per='thread')
+
+
+def test_compact_fields_eq_and_hash():
+    query = Query(function='foo', module='bar')
+    assert query == Query(module='bar', function='foo')
+    assert hash(query) == hash(Query(module='bar', function='foo'))
+    assert query != Query(function='foo')
+    assert len({query, Query(module='bar', function='foo'), Not(query), Not(query)}) == 2
+    assert Sample(every_n=2) == Sample(every_n=2) != Sample(every_n=3)
+    assert hash(Throttle(max_per_second=10)) == hash(Throttle(max_per_second=10))
+    # And/Or ignore the order of their predicates
+    first, second = Query(function='foo'), Query(module='bar')
+    assert And(first, second) == And(second, first)
+    assert hash(And(first, second)) == hash(And(second, first))
+    assert Or(first, second) == Or(second, first)
+    assert hash(Or(first, second)) == hash(Or(second, first))
+    assert And(first, second) != Or(first, second)
+
+
+def test_compact_fields_hash_is_cached():
+    sample = Sample(every_n=2)
+    with pytest.raises(AttributeError):
+        sample._hash
+    assert hash(sample) == sample._hash
+    sample._hash = 42
+    assert hash(sample) == 42
+
+
+def test_compact_fields_slots():
+    for predicate in Query(function='foo'), Not(Query(function='foo')), And(Query(function='foo')), Sample(every_n=2):
+        assert not hasattr(predicate, '__dict__')
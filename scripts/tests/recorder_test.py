@@ -0,0 +1,59 @@
+import io
+import os
+
+from ..hunter import CallPrinter
+from ..hunter import Q
+from ..hunter.background import Background
+from ..hunter.recorder import TraceReader
+from ..hunter.recorder import TraceRecorder
+from ..hunter.tracer import Tracer
+
+
+def traced(a):
+    b = a + 1
+    return b * 2
+
+
+def record(directory, **options):
+    path = os.path.join(str(directory), 'trace.bin')
+    events = []
+    with TraceRecorder(path, **options) as recorder:
+        with Tracer().trace(Q(filename=__file__, function='traced', actions=[recorder, events.append])):
+            traced(1)
+            traced(2)
+    return path, [(e.kind, e.function, e.module, e.lineno, e.depth) for e in events]
+
+
+def test_recorder_round_trip(tmp_path):
+    for options in ({}, {'compress': True, 'block_size': 64}):
+        path, expected = record(tmp_path, **options)
+        assert expected[0][:2] == ('call', 'traced') and len(expected) == 8
+        with TraceReader(path) as reader:
+            replayed = [(e.kind, e.function, e.module, e.lineno, e.depth) for e in reader]
+            assert replayed == expected
+            assert [e.filename for e in reader] == [__file__] * len(expected)
+            # The actions get the events as if they were traced
+            seen = []
+            reader.replay(kind='line', action=seen.append)
+            assert [e.lineno for e in seen] == [lineno for kind, _, _, lineno, _ in expected if kind == 'line']
+
+
+def test_reader_rejects_other_files(tmp_path):
+    path = os.path.join(str(tmp_path), 'trace.bin')
+    with open(path, 'wb') as the_file:
+        the_file.write(b'not a hunter trace')
+    try:
+        TraceReader(path)
+    except ValueError as e:
+        assert 'bad magic' in str(e)
+    else:
+        raise AssertionError('no error')
+
+
+def test_background_printer_in_replay(tmp_path):
+    path, expected = record(tmp_path)
+    stream = io.StringIO()
+    with TraceReader(path) as reader:
+        reader.replay(action=Background(CallPrinter(stream=stream, force_colors=False), interval=60))
+    # Flushed when the replay is done, not after the interval
+    assert stream.getvalue().count('=> traced()') == 2
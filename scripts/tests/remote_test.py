@@ -0,0 +1,37 @@
+import os
+import socket
+import threading
+
+import pytest
+
+remote = pytest.importorskip('scripts.hunter.remote', reason='hunter.remote needs manhole')
+
+
+def test_remote_stream_drops_whole_entries(tmp_path):
+    path = os.path.join(str(tmp_path), 'sink')
+    sink = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sink.bind(path)
+    sink.listen(1)
+
+    stream = remote.RemoteStream(path, False, 'utf-8', interval=60, max_buffer=12)
+    conn, _ = sink.accept()
+    stream.write('one ')
+    stream.write('two\n')
+    stream.write('x' * 5)
+    stream.write('does not fit\n')
+    other = threading.Thread(target=stream.write, args=('ignored, not a whole entry',))
+    other.start()
+    other.join()
+    stream.write('end')
+    stream.flush()
+    assert stream.dropped == 1
+    stream.close()
+
+    received = b''
+    data = conn.recv(1024)
+    while data:
+        received += data
+        data = conn.recv(1024)
+    conn.close()
+    sink.close()
+    assert received.decode('utf-8') == 'one two\nend\nHunter dropped 1 trace entries (the output buffer was full).\n'
@@ -0,0 +1,148 @@
+import os
+import sys
+import threading
+
+import pytest
+
+from ..wolf import CodeCache
+from ..wolf import LocalModules
+from ..wolf import WolfSession
+from ..wolf_incremental import IncrementalScript
+
+
+def write_script(directory, source, name='script.py'):
+    path = os.path.join(str(directory), name)
+    with open(path, 'w', encoding='utf-8') as the_file:
+        the_file.write(source)
+    return path
+
+
+def test_eval_error_stops_the_script(tmp_path):
+    path = write_script(tmp_path, 'a = 1\na\nb\nprint("unreachable")\n')
+    results = WolfSession().trace(path).wolf_results()
+    assert [r['lineno'] for r in results] == [2, 3]
+    assert results[-1]['error'].startswith('NameError')
+
+
+def test_interpreter_state_is_restored(tmp_path):
+    cwd, path = os.getcwd(), list(sys.path)
+    script = write_script(tmp_path, 'import os, sys\nos.chdir(os.sep)\nsys.path.append("elsewhere")\nraise SystemExit(3)\n')
+    results = WolfSession().trace(script).wolf_results()
+    sys.path.remove('elsewhere')
+    assert os.getcwd() == cwd
+    assert sys.path == path
+    assert results[-1]['value'] == 'SystemExit: 3\n'
+
+
+def test_sessions_in_threads(tmp_path):
+    paths = [write_script(tmp_path, 'n = {}\nn\n'.format(i), 'script{}.py'.format(i)) for i in range(4)]
+    results = {}
+
+    def run(path):
+        results[path] = WolfSession(chdir=False).trace(path).formats()
+
+    threads = [threading.Thread(target=run, args=(path,)) for path in paths]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for i, path in enumerate(paths):
+        assert results[path] == WolfSession().trace(path).formats()
+        assert '"value": "{}"'.format(i) in results[path]
+
+
+def test_only_changed_local_modules_are_reimported(tmp_path):
+    script = write_script(tmp_path, 'import helper, other\nprint(helper.Y, other.Z)\n')
+    write_script(tmp_path, 'X = 1\n', 'wolf_util.py')
+    write_script(tmp_path, 'from wolf_util import X\nY = X + 1\n', 'helper.py')
+    write_script(tmp_path, 'Z = 5\n', 'other.py')
+    modules = LocalModules()
+
+    def run():
+        return WolfSession(modules=modules).trace(script).wolf_results()[-1]['value']
+
+    try:
+        assert run() == '2 5'
+        other = sys.modules['other']
+        os.utime(write_script(tmp_path, 'X = 41\n', 'wolf_util.py'), (0, 0))
+        assert run() == '42 5'
+        assert sys.modules['other'] is other
+    finally:
+        for name in ('wolf_util', 'helper', 'other'):
+            sys.modules.pop(name, None)
+
+
+def test_script_module_is_like_an_imported_one(tmp_path):
+    source = ('spec = (__name__, __spec__.name, __spec__.origin == __file__, __loader__ is __spec__.loader)\n'
+              'spec\n'
+              'lines = len(__loader__.get_source(__name__).splitlines())\n'
+              'lines\n')
+    script = write_script(tmp_path, source)
+    for incremental in (None, IncrementalScript()):
+        results = WolfSession(incremental=incremental).trace(script).wolf_results()
+        assert [r['value'] for r in results] == ["('script', 'script', True, True)", '4']
+
+
+def test_code_cache(tmp_path):
+    directory = str(tmp_path)
+    code = CodeCache(directory).compile('x = 1\n', '/script.py')
+
+    codes = CodeCache(directory)
+    assert codes.compile('x = 1\n', '/script.py') == code
+    assert codes.codes['/script.py'][1] is codes.compile('x = 1\n', '/script.py')
+
+    namespace = {}
+    exec(CodeCache(directory).compile('x = 2\n', '/script.py'), namespace)
+    assert namespace['x'] == 2
+    assert len(os.listdir(directory)) == 1
+
+
+# The statements' positions need Python 3.8, they're always full runs before
+requires_positions = pytest.mark.skipif(sys.version_info < (3, 8), reason='end_lineno requires Python 3.8+')
+
+
+@requires_positions
+def test_incremental_runs(tmp_path):
+    script = write_script(tmp_path, '')
+    source = 'x = 1\ny = 2\n\ndef f(a):\n    return [a * x]\n\nz = f(3)\nz\nw = y + 1\nw\n'
+    versions = [
+        source,
+        source.replace('y = 2', 'y = 5'),
+        '\n' + source.replace('y = 2', 'y = 5'),
+        source + 'w +\n',
+        source.replace('x = 1', 'x = 10'),
+    ]
+    incremental = IncrementalScript()
+    zs = []
+    for source in versions:
+        results = WolfSession(incremental=incremental).trace(script, source).wolf_results()
+        assert results == WolfSession().trace(script, source).wolf_results()
+        zs.append(getattr(incremental.module, 'z', None))
+
+    # Only the edit to `y` skips the call to `f`, moving `f` doesn't
+    # and a syntax error is followed by a full run
+    assert zs[1] is zs[0]
+    assert zs[2] is not zs[1] and zs[2] == [3]
+    assert zs[3] is None
+    assert zs[4] == [30]
+
+
+@requires_positions
+@pytest.mark.parametrize('source,edited', [
+    ('x = [1]\ny = x\ny.append(2)\nx\n', 'x = [1]\ny = x\ny.append(3)\nx\n'),
+    ('x = [1]\ny = x\ny += [2]\nx\n', 'x = [1]\ny = x\ny += [3]\nx\n'),
+    ('x = [1]\nappend = x.append\nappend(2)\nx\n', 'x = [1]\nappend = x.append\nappend(3)\nx\n'),
+    ('x = [1]\ny = x\nx.append(0)\ny.append(2)\ny\n', 'x = [1]\ny = x\nx.append(0)\ny.append(3)\ny\n'),
+    ('def add(xs):\n    xs.append(1)\n\na = []\nadd(a)\na\n', 'def add(xs):\n    xs.append(1)\n\na = []\nadd(a)\na  # edited\n'),
+    ('n = 5\ng = (n for _ in range(2))\nn = 6\nr = list(g)\nr\n', 'n = 5\ng = (n for _ in range(2))\nn = 7\nr = list(g)\nr\n'),
+    ('def gen():\n    yield 1\n\ng = gen()\nprint(list(g))\n', 'def gen():\n    yield 1\n\ng = gen()\nprint(list(g), 2)\n'),
+    ('z = zip([1], [2])\nprint(list(z))\n', 'z = zip([1], [2])\nprint(list(z), 2)\n'),
+    ('n = 5\nf = lambda: n\nn = 6\nf()\n', 'n = 5\nf = lambda: n\nn = 7\nf()\n'),
+])
+def test_incremental_runs_with_shared_objects(tmp_path, source, edited):
+    script = write_script(tmp_path, '')
+    incremental = IncrementalScript()
+    for version in source, edited:
+        results = WolfSession(incremental=incremental).trace(script, version).wolf_results()
+        assert results == WolfSession().trace(script, version).wolf_results()
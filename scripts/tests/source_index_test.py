@@ -0,0 +1,43 @@
+import sys
+
+import pytest
+
+from ..wolf import SourceIndex
+
+requires_positions = pytest.mark.skipif(sys.version_info < (3, 8), reason='end_col_offset requires Python 3.8+')
+
+SOURCE = """\
+a = 1
+x = a * 2  #?
+print(a, x, sep=', ')
+print()
+y = 'é' + 'ü'; z = 3
+if a:
+    print(  y  )
+w = (
+    a)
+a += 1
+b = c = a
+"""
+
+
+@requires_positions
+def test_source_index():
+    index = SourceIndex(SOURCE)
+    assert index.print_args == {
+        3: "a, x, sep=', '",
+        4: '',
+        7: '  y  ',
+    }
+    assert index.values == {
+        1: '1',
+        2: 'a * 2',
+        # Column offsets are in bytes, the first statement of a line wins
+        5: "'é' + 'ü'",
+    }
+
+
+def test_source_index_of_invalid_source():
+    index = SourceIndex('x = (\n')
+    assert index.print_args == {}
+    assert index.values == {}
@@ -0,0 +1,45 @@
+from ..hunter.util import bounded_repr
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SMALL = [
+    [1, 'a', None], (1,), (), {'a': (1, 2)}, set(), {3}, frozenset(), frozenset({1}),
+    'text', b'bytes', bytearray(b'buffer'),
+]
+
+
+def test_bounded_repr_of_small_objects():
+    for obj in SMALL:
+        assert bounded_repr(obj, 100) == repr(obj)
+
+    recursive = [1]
+    recursive.append(recursive)
+    mapping = {}
+    mapping['self'] = mapping
+    assert bounded_repr(recursive, 100) == repr(recursive) == '[1, [...]]'
+    assert bounded_repr(mapping, 100) == repr(mapping)
+
+
+def test_bounded_repr_limits():
+    huge = list(range(10 ** 5))
+    for obj, end in [
+        (huge, ', ...]'),
+        (tuple(huge), ', ...)'),
+        (dict.fromkeys(huge), ', ...}'),
+        ([huge, huge], ', ...], ...]'),
+        ('x' * 10 ** 5, "x...'"),
+        (b'x' * 10 ** 5, "x...'"),
+        (bytearray(10 ** 5), "...')"),
+    ]:
+        text = bounded_repr(obj, 50)
+        assert text.endswith(end), text
+        assert len(text) < 100, text
+        assert text[:20] == repr(obj)[:20]
+
+    assert len(bounded_repr('\U000e0001' * 100, 20)) < 30
+    if numpy is not None:
+        assert bounded_repr(numpy.arange(3), 50) == repr(numpy.arange(3))
+        assert len(bounded_repr(numpy.zeros(10 ** 5), 50)) < 100
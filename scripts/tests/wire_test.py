@@ -0,0 +1,97 @@
+import json
+import os
+import subprocess
+import sys
+
+from .. import wolf
+from ..wolf import FRAME_HEADER
+from ..wolf import WolfSession
+from ..wolf import read_frame
+from ..wolf import wolf_columnar
+from ..wolf import wolf_encode
+from .session_test import write_script
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOOP = 'for i in range(3):\n    i\n    (i, "same")  # ?\nx = 1 / 0\n'
+
+
+def decode_columnar(payload):
+    """ Same as `decodeTraceResults` in src/utils.ts """
+    strings, errors = payload['strings'], list(payload['errors'])
+    results = []
+    for i in range(len(payload['lineno']) + 1):
+        while errors and errors[0]['index'] == i:
+            error = dict(errors.pop(0))
+            del error['index']
+            results.append(error)
+        if i == len(payload['lineno']):
+            break
+        row = {'lineno': payload['lineno'][i], 'value': strings[payload['value'][i]]}
+        if payload['source'][i] != -1:
+            row['source'] = strings[payload['source'][i]]
+        results.append(row)
+    return results
+
+
+def test_encode_with_and_without_orjson(monkeypatch):
+    results = [{'lineno': 1, 'value': 'caf\u00e9 \U0001f43a'}, {'lineno': 2, 'value': '\ud800'}]
+    for orjson in (wolf.orjson, None):
+        monkeypatch.setattr(wolf, 'orjson', orjson)
+        # A lone surrogate can't be utf-8 encoded, `json` escapes it
+        assert json.loads(b''.join(wolf_encode(results)).decode('utf-8')) == results
+        assert json.loads(b''.join(wolf_encode(results[:1])).decode('utf-8')) == results[:1]
+
+    chunks = list(wolf_encode([{'value': 'x' * 100}] * 10, chunk_size=256))
+    assert len(chunks) > 1 and json.loads(b''.join(chunks).decode('utf-8')) == [{'value': 'x' * 100}] * 10
+
+
+def test_columnar_round_trip(tmp_path):
+    results = json.loads(json.dumps(WolfSession().trace(write_script(tmp_path, LOOP)).wolf_results()))
+    payload = wolf_columnar(results)
+    assert payload['iteration'] == [0, 0, 1, 1, 2, 2]
+    assert len(payload['strings']) < len(results) * 2
+    assert [row.get('error') for row in results].count(True) == 1
+    # The source is sent as a 1-tuple (a list once parsed)
+    expected = [dict(row, source=row['source'][0]) if isinstance(row.get('source'), list) else row for row in results]
+    assert decode_columnar(json.loads(json.dumps(payload))) == expected
+
+
+def test_send_frames(tmp_path):
+    session = WolfSession().trace(write_script(tmp_path, LOOP))
+    read_fd, write_fd = os.pipe()
+    session.send_frames(write_fd)
+    os.close(write_fd)
+    frames = []
+    with os.fdopen(read_fd, 'rb') as stream:
+        frame = read_frame(stream)
+        while frame is not None:
+            frames.append(frame)
+            frame = read_frame(stream)
+    assert frames[-1] == b'' and all(frames[:-1])
+    assert json.loads(b''.join(frames).decode('utf-8')) == json.loads(session.formats())
+
+
+def test_unencodable_result(tmp_path):
+    # Used to make wolf.py exit halfway through the WOOF line with orjson
+    script = write_script(tmp_path, 's = "\\ud800"\ns\n')
+    for options in ([], ['--compact']):
+        proc = subprocess.run([sys.executable, 'wolf.py', script] + options, cwd=SCRIPTS_DIR,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        assert proc.returncode == 0, proc.stderr
+        payload = json.loads(proc.stdout.decode('utf-8').split('WOOF: ', 1)[1])
+        results = decode_columnar(payload) if options else payload
+        assert [row['value'] for row in results] == ['\ud800']
+
+
+def test_served_scripts_dont_read_the_requests(tmp_path):
+    script = write_script(tmp_path, '')
+    requests = b''
+    for source in ('import sys\ndata = sys.stdin.read()\ndata\n', 'x = 2\nx\n'):
+        request = '{}\n{}'.format(script, source).encode('utf-8')
+        requests += FRAME_HEADER.pack(len(request)) + request
+    proc = subprocess.run([sys.executable, 'wolf.py', '--serve'], cwd=SCRIPTS_DIR, input=requests,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert proc.returncode == 0, proc.stderr
+    woofs = [json.loads(line[6:]) for line in proc.stdout.decode('utf-8').splitlines() if line.startswith('WOOF: ')]
+    assert [[row['value'] for row in results] for results in woofs] == [[''], ['2']]
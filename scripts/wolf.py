@@ -27,15 +27,28 @@ import sys
 import re
 import json
 import traceback
+import hashlib
 import io
+import itertools
+import linecache
+import marshal
+import struct
+import tokenize
 from collections import OrderedDict
 from copy import deepcopy
+from functools import lru_cache
 from pprint import pformat
 from importlib import util
+from importlib.machinery import SourceFileLoader
 from contextlib import contextmanager
 
-from astunparse import unparse
-from hunter import trace
+from hunter import Q
+from hunter import Tracer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 ###################
@@ -55,32 +68,158 @@ WOLF_MACROS = re.compile(
 # https://regex101.com/r/sf6nAH/2
 
 
-def import_file(full_name, fullpath):
+def read_script(fullpath, source=None):
+    """
+        The `source` of the script, read from `fullpath` if it's
+        not given. It's put in the linecache so tracebacks and the
+        tracer see it, even if `fullpath` doesn't exist on disk.
+    """
+    if source is None:
+        with tokenize.open(fullpath) as the_file:
+            source = the_file.read()
+    linecache.cache[fullpath] = (len(source), None, source.splitlines(True), fullpath)
+    return source
+
+
+def import_file(full_name, fullpath, source=None, codes=None):
     """
-        The "recommended" method of importing a file by its
-        absolute path in Python 3.5+
+        Imports a file by its absolute path, without adding it
+        to `sys.modules` nor writing its bytecode next to it.
 
-        See: https://stackoverflow.com/questions/67631/how-to-import-a-module-given-the-full-path
+        If the `source` is given the module is compiled from
+        memory instead, under the (logical) `fullpath` which
+        need not exist on disk (see `read_script`).
+
+        The code object comes from the `codes` (`CodeCache`)
+        when the source didn't change.
     """
-    spec = util.spec_from_file_location(full_name, fullpath)
-    mod = util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
+    source = read_script(fullpath, source)
+    mod = new_module(full_name, fullpath)
+    code = (codes or CodeCache()).compile(source, fullpath)
+    exec(code, mod.__dict__)
     return mod
 
 
+def new_module(full_name, fullpath):
+    """
+        An empty module for the file, with the `__spec__`,
+        `__loader__` and `__file__` an import would give it.
+    """
+    loader = SourceFileLoader(full_name, fullpath)
+    return util.module_from_spec(util.spec_from_file_location(full_name, fullpath, loader=loader))
+
+
+class CodeCache(object):
+    """
+        The code objects of the traced scripts, so that a script
+        that didn't change isn't parsed and compiled again when
+        it's traced because of an edit to another file.
+
+        One entry is kept per file, in memory and, if given, in
+        the `directory` (see `cache_dir`, it's never the user's
+        folder). Entries are only valid for the same source and
+        interpreter (magic number).
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        # codes[filename]: (source hash, code object)
+        self.codes = {}
+
+    def compile(self, source, filename):
+        digest = hashlib.sha1(source.encode('utf-8', 'surrogatepass')).digest()
+        cached = self.codes.get(filename)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+        code = self.load(filename, digest)
+        if code is None:
+            code = compile(source, filename, 'exec')
+            self.store(filename, digest, code)
+        self.codes[filename] = digest, code
+        return code
+
+    def path(self, filename):
+        name = hashlib.sha1(filename.encode('utf-8', 'surrogatepass')).hexdigest()
+        return os.path.join(self.directory, name + '.wolfc')
+
+    def load(self, filename, digest):
+        if not self.directory:
+            return None
+        try:
+            with open(self.path(filename), 'rb') as the_file:
+                data = the_file.read()
+        except OSError:
+            return None
+        header = util.MAGIC_NUMBER + digest
+        if not data.startswith(header):
+            return None  # Stale
+        try:
+            return marshal.loads(data[len(header):])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def store(self, filename, digest, code):
+        if not self.directory:
+            return
+        path = self.path(filename)
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'wb') as the_file:
+                the_file.write(util.MAGIC_NUMBER + digest + marshal.dumps(code))
+            os.replace(temp_path, path)
+        except OSError:
+            pass  # It's only a cache
+
+
+def cache_dir():
+    """
+        Where the compiled scripts are cached: `$WOLF_CACHE_DIR`
+        (empty to disable it) or a `wolf` folder in the user's
+        cache directory.
+    """
+    path = os.environ.get('WOLF_CACHE_DIR')
+    if path is not None:
+        return path or None
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'wolf')
+
+
+@lru_cache(maxsize=1024)
+def compile_snippet(source, mode='eval'):
+    """
+        Compiles the expressions (and print calls) Wolf evaluates
+        for the macros, once per distinct text. Leading spaces are
+        stripped, like `eval` does for strings.
+    """
+    return compile(source.lstrip(' \t'), '<string>', mode)
+
+
 @contextmanager
-def script_path(script_dir):
+def script_path(script_dir, chdir=True):
     """
         Context manager for adding a dir to the sys path
-        and restoring it afterwards. This trick allows
-        relative imports to work on the target script.
+        (and making it the working directory) and restoring
+        both afterwards, even if the script failed. This
+        trick allows relative imports to work on the target
+        script.
     """
     original_cwd = os.getcwd()
-    os.chdir(script_dir)
+    if chdir:
+        os.chdir(script_dir)
     sys.path.insert(1, script_dir)
-    yield
-    os.chdir(original_cwd)
-    sys.path.remove(script_dir)
+    try:
+        yield
+    finally:
+        if chdir:
+            os.chdir(original_cwd)
+        try:
+            sys.path.remove(script_dir)
+        except ValueError:
+            pass  # The script removed it itself
 
 
 def try_deepcopy(obj):
@@ -95,8 +234,173 @@ def try_deepcopy(obj):
         return obj
 
 
-def contains_any(*args):
-    return any(i in args[-1] for i in args[:-1])
+class SourceIndex(object):
+    """
+        The exact source text Wolf evaluates for each (single
+        line) statement of a file, sliced from the source with
+        the AST positions:
+
+            print_args[lineno]  ->  "a, b, sep=', '"   <- print(a, b, sep=', ')
+            values[lineno]      ->  "a * 2"            <- x = a * 2  #?
+
+        NOTE: Only the first statement of each line is indexed,
+            and positions need Python 3.8 (otherwise it's empty).
+    """
+
+    def __init__(self, source):
+        self.print_args = {}
+        self.values = {}
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            return
+        lines = source.splitlines()
+
+        def segment(node):
+            # AST column offsets count utf-8 bytes
+            line = lines[node.lineno - 1].encode('utf-8')
+            return line[node.col_offset:node.end_col_offset].decode('utf-8')
+
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.stmt) or getattr(node, 'end_lineno', None) != node.lineno:
+                continue
+            if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call) \
+                    and isinstance(node.value.func, ast.Name) and node.value.func.id == 'print':
+                call = segment(node.value)
+                args = call[len(segment(node.value.func)):].strip()[1:-1]
+                self.print_args.setdefault(node.lineno, args)
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+                self.values.setdefault(node.lineno, segment(node.value))
+
+
+# SOURCE_INDEXES[filename]: (linecache lines, SourceIndex)
+SOURCE_INDEXES = {}
+
+
+def source_index(filename):
+    """
+        The `SourceIndex` of a traced file, rebuilt only if its
+        lines in the linecache were replaced.
+    """
+    lines = linecache.getlines(filename)
+    cached = SOURCE_INDEXES.get(filename)
+    if cached is None or cached[0] is not lines:
+        cached = SOURCE_INDEXES[filename] = lines, SourceIndex(''.join(lines))
+    return cached[1]
+
+
+class LocalModules(object):
+    """
+        Keeps track of the script's own (local) modules in a
+        persistent process (see `serve`): their file, a hash of
+        their source, and the local modules they import.
+
+        Before the next run, only the modules whose source
+        changed, or that import (transitively) one that did, are
+        dropped from `sys.modules`. The others, and all of the
+        third-party modules, are not imported again.
+    """
+
+    def __init__(self):
+        # modules[name]: [path, (mtime, size), source hash, imported names]
+        self.modules = {}
+
+    def record(self, script_dir, before):
+        """
+            Starts tracking the local modules (files in `script_dir`
+            outside of the site-packages and the interpreter) that
+            were imported since `before` (a set of module names).
+        """
+        from hunter.const import get_site_packages_paths, get_sys_prefix_paths
+
+        ignored = get_site_packages_paths() + get_sys_prefix_paths()
+        prefix = os.path.join(script_dir, '')
+        for name in set(sys.modules) - before:
+            path = getattr(sys.modules.get(name), '__file__', None)
+            if not path or not path.endswith('.py'):
+                continue
+            path = os.path.abspath(path)
+            if not path.startswith(prefix) or any(path.startswith(os.path.join(p, '')) for p in ignored):
+                continue
+            try:
+                stat, digest, source = self._read(path)
+            except OSError:
+                continue
+            imports = module_imports(source, name, os.path.basename(path) == '__init__.py')
+            self.modules[name] = [path, stat, digest, imports]
+
+    def evict_changed(self):
+        """
+            Removes the changed modules and their (transitive)
+            importers from `sys.modules`, returns their names.
+        """
+        changed = set()
+        for name, entry in self.modules.items():
+            path, stat, digest, _ = entry
+            try:
+                if os.stat(path).st_mtime_ns == stat[0] and os.path.getsize(path) == stat[1]:
+                    continue
+                entry[1], new_digest, _ = self._read(path)
+            except OSError:
+                changed.add(name)
+                continue
+            if new_digest != digest:
+                changed.add(name)
+
+        # The importers of a changed module are bound to its old version
+        pending = set(changed)
+        while pending:
+            name = pending.pop()
+            for other, (_, _, _, imports) in self.modules.items():
+                if other not in changed and name in imports:
+                    changed.add(other)
+                    pending.add(other)
+
+        for name in changed:
+            del self.modules[name]
+            sys.modules.pop(name, None)
+        return changed
+
+    @staticmethod
+    def _read(path):
+        with open(path, 'rb') as the_file:
+            source = the_file.read()
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size), hashlib.sha1(source).hexdigest(), source
+
+
+def module_imports(source, name, is_package=False):
+    """
+        The names of the modules imported by the module `name` (and
+        of its package, a submodule is bound to it), with relative
+        imports resolved. Names that aren't modules (ie: a function
+        from `from a import f`) are included too, they are harmless.
+    """
+    package = name if is_package else name.rpartition('.')[0]
+    imports = set()
+    if package and package != name:
+        imports.add(package)
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return imports
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ''
+            if node.level:
+                try:
+                    base = util.resolve_name('.' * node.level + base, package)
+                except (ImportError, ValueError):
+                    continue
+            imports.add(base)
+            imports.update(base + '.' + alias.name for alias in node.names)
+    # `import a.b` imports `a` too
+    imports.update(parent for imported in list(imports)
+                   for parent in itertools.accumulate(imported.split('.')[:-1], lambda a, b: a + '.' + b))
+    imports.discard(name)
+    return imports
 
 
 ###################
@@ -130,11 +434,12 @@ def contains_any(*args):
 #                              ;  bug
 
 
-# -% Globals %-
+# -% Constants %-
 #
-# WOLF[dict]: Results from each line trace
-WOLF = []
-COUNTER = 1
+# FRAME_HEADER: The length prefix of each frame (see WolfSession.send_frames)
+FRAME_HEADER = struct.Struct('>I')
+# SNIPPET_IDS: Numbers the snippets traced by `test`
+SNIPPET_IDS = itertools.count()
 #########
 
 
@@ -160,219 +465,460 @@ def resultifier(value):
     return str(value)
 
 
-def wolf_formats():
-    # It's important that we create an output that can be handled
-    # by the javascript `JSON.parse(...)` function.
-    results = (json.dumps(i) for i in WOLF if contains_any(
-        'value', i.keys()) or i['error'])
-    python_data = ", ".join(results)
-
-    return "[" + python_data + "]"
+def wolf_columnar(results):
+    """
+        The compact (columnar) variant of the results. Source lines
+        and values are stored once in a string table, each result is
+        an index into it, and loops no longer repeat themselves:
+
+            {
+                "format": "columnar",
+                "strings": ["x", "[0, 1, 2]", ...],
+                "lineno": [3, ...],
+                "source": [0, ...],     <- -1 if the result has no source
+                "value": [1, ...],
+                "iteration": [0, ...],  <- nth hit of the line
+                "errors": [{...}, ...]  <- error results, as is, plus
+            }                              the "index" of the row they
+                                           came before
+    """
+    strings, index = [], {}
+    lineno, source, value, iteration, errors = [], [], [], [], []
+    hits = {}
+
+    def intern(string):
+        i = index.get(string)
+        if i is None:
+            i = index[string] = len(strings)
+            strings.append(string)
+        return i
+
+    for result in results:
+        if result.get('error'):
+            error = OrderedDict(result)
+            error['index'] = len(lineno)  # <- where it goes back in the rows
+            errors.append(error)
+            continue
+        line = result['lineno']
+        src = result.get('source')
+        if isinstance(src, (tuple, list)):
+            src = src[0]  # XXX: see result_handler, the source can be a 1-tuple
+        lineno.append(line)
+        source.append(-1 if src is None else intern(src))
+        value.append(intern(result['value']))
+        iteration.append(hits.get(line, 0))
+        hits[line] = iteration[-1] + 1
+
+    return OrderedDict([
+        ("format",  "columnar"),
+        ("strings",    strings),
+        ("lineno",      lineno),
+        ("source",      source),
+        ("value",        value),
+        ("iteration", iteration),
+        ("errors",      errors),
+    ])
 
-def wolf_prints():
-    # DO NOT TOUCH, ie: no pretty printing
-    print("WOOF: " + wolf_formats())  # <--  Wolf result
-    ######################################
 
+def wolf_encode(results, chunk_size=64 * 1024):
+    """
+        Yields the JSON encoded results as utf-8 chunks of about
+        `chunk_size` bytes. Uses `orjson` when it's installed,
+        otherwise (or if it can't encode them, ie: a lone surrogate
+        in a string) a single `JSONEncoder.iterencode` pass.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(results)
+        except orjson.JSONEncodeError:
+            encoded = None  # <- `json` escapes them
+        if encoded is not None:
+            yield encoded
+            return
+
+    chunks, size = [], 0
+    for chunk in json.JSONEncoder().iterencode(results):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield "".join(chunks).encode("utf-8")
+            chunks, size = [], 0
+    yield "".join(chunks).encode("utf-8")
 
-def parse_eval(*args, **kw):
-    global WOLF
-    event = kw.get('event')
 
-    try:
-        rv = eval(*args)
-    except BaseException as e:
-        if event['kind'] == 'line':
-            thrown = traceback.format_exception_only(type(e), e)
-            error = '\n'.join(thrown)
-            source = event['source'].strip()
-            metadata = OrderedDict([
-                ("lineno",              event['lineno']),
-                ("source",                       source),
-                ("value",                     thrown[0]),
-                ("error",                         error),
-                # ("filename",          event['filename']),
-            ])
+def filename_filter(filename):
+    """
+        Removes dependency noise from the output. We're only
+        interested in code paths travelled by the target script,
+        so this filter traces based on the filename, provided as
+        a prop on the `event` dict.
 
-            WOLF.append(metadata)
-            wolf_prints()
-            sys.exit(0)
-    else:
-        return rv
+        NOTE: `filename_filter` is a closure over the actual filtering
+            function. It captures the target filename for injection
+            into the inner scope when the filter is actually run.
+    """
+    return lambda event: bool(event['filename'] == filename)
 
 
-def result_handler(event):
+class WolfEvalError(BaseException):
     """
-        Called by the `trace` function to handle any actions post
-        filter. ie: trace => filter => result_handler
-
-        Side Effects: Results are appended to the global WOLF list.
+        Raised (through the traced script) to stop it once an
+        evaluation error was recorded. It's a `BaseException`,
+        like the `SystemExit` it replaces, so the script can't
+        swallow it with an `except Exception:`.
     """
 
-    # XXX: WARNING, SIDE EFFECTS MAY INCLUDE:
-    global WOLF
 
-    # NOTE: Consider refactoring this using
-    #      class variables instead of globals.
+class WolfSession(object):
+    """
+        A single trace of a script. The session owns everything
+        that used to be module globals: the results buffer, the
+        output options and the tracer, so any number of them can
+        be run in the same process (one at a time per thread).
+
+            session = WolfSession(compact=True)
+            session.trace('/some/path/to/script.py')
+            session.prints()
+
+        The working directory and `sys.path` are put back once
+        the script is done, whatever happened. With `chdir=False`
+        the working directory is left alone (it is shared by all
+        the threads).
+    """
 
-    # We don't want any whitespace around our
-    # source code that could mess up the parser.
-    source = event['source'].strip()
+    def __init__(self, compact=False, result_fd=None, chdir=True, modules=None, codes=None, incremental=None):
+        # results[dict]: Results from each line trace
+        self.results = []
+        # compact[bool]: Send the results in the columnar format
+        self.compact = compact
+        # result_fd[int]: Send the results on this file descriptor (see send_frames)
+        self.result_fd = result_fd
+        self.chdir = chdir
+        # modules[LocalModules]: Shared by the sessions of a persistent process
+        self.modules = modules
+        # codes[CodeCache]: The compiled scripts, only in memory by default
+        self.codes = CodeCache() if codes is None else codes
+        # incremental[IncrementalScript]: Re-run only the statements an edit affects
+        self.incremental = incremental
+        # marks[(int, int)]: The result count at each module level line
+        self.marks = []
+        self.tracer = Tracer()
+
+    def trace(self, filename, source=None):
+        """
+            Imports and traces the script, an error is recorded
+            as the last result. Returns the session.
+        """
+        # The full path to the script (including filename and extension)
+        full_path = os.path.abspath(filename)
+
+        # The `import`able name of the target file
+        # ie: /home/duroktar/scripts/my_script.py  ->  my_script
+        module_name = os.path.basename(full_path).split('.')[0]
+
+        failed = True
+        try:
 
-    # These are the fields returned from each line
-    # of the traced program. This is essentially
-    # the metadata returned to the extension in the
-    # WOLF list.
-    metadata = OrderedDict([
-        ("lineno",             event['lineno']),
-        # "value"    <-  Defined below MAYBE..
-    ])
+            self.import_and_trace_script(module_name, full_path, source)
+            failed = False
 
-    # The annotation will take on this value
-    # (if present).
-    value = None
+        except WolfEvalError:
 
-    # We'll need to look up any values in the
-    # correct scope, so let's grab the locals
-    # and globals from the current frame to
-    # use later on.
-    _globals = event['globals']
-    _locals = event['locals']
+            # Already recorded by `parse_eval`
+            pass
 
-    # This regex does all the heavy lifting. Check out
-    # https://regex101.com/r/npWf6w/5 for an example of
-    # # how it works.
-    match = WOLF_MACROS.search(source)
+        except BaseException as e:
 
-    # Sometimes we have to skip an entry to prevent dupes
-    skip = False
+            # If there's an error, we try to handle it and
+            # send back data that can be used to decorate
+            # the offending line.
 
-    # Regex match groups are used for convenience.
-    if source not in ['pass', 'break', 'continue'] and match: # fixes https://github.com/Duroktar/Wolf/issues/28 to 30
+            value = traceback.format_exception_only(type(e), e)[0]
 
-        # TODO: We should be using the ast instead of regex for all cases.
-        tree = ast.parse(source)
-
-        # Simplest case.
-        if match.group('variable'):
-            if event.kind != 'call':
-                value = parse_eval(match.group('variable'),
-                                   _globals, _locals, event=event)
-                metadata["source"] = event['source'],
+            if isinstance(e, SyntaxError):
+                lineno = getattr(e, 'lineno')
+                value = e.msg
+                text = e.text or ''
             else:
-                skip = True
-
-        # A little magic to parse print args
-        elif match.group('print'):
-            buffer = io.StringIO()
-            src_seg = unparse(tree).strip()
-            try:
-                to_eval = "print({}, file=wolf__buffer__)".format(src_seg[6:-1]) # fixes https://github.com/Duroktar/Wolf/issues/34
-                exec(to_eval, _globals, {**_locals, 'wolf__buffer__': buffer})
-                value = str(buffer.getvalue()).strip('\n')
-            finally:
-                buffer.close()
+                _, _, exc_traceback = sys.exc_info()
+                tb = traceback.extract_tb(exc_traceback)[-1]
+                for i in traceback.extract_tb(exc_traceback):
+                    if i.filename == filename:
+                        tb = i
+                lineno = tb.lineno
+                text = tb.line
 
-        # Macros require a few more steps..
-        elif match.group('macro'):
-
-            # XXX: This is to help avoid side effects when evaluating expressions
-            m_locals_copy = {k: try_deepcopy(v) for k, v in _locals.items()}
-            m_globals_copy = {k: try_deepcopy(v) for k, v in _globals.items()}
+            metadata = OrderedDict([
+                ("lineno",        lineno),
+                # ("filename", tb.filename),
+                ("source",  text.strip()),
+                ("value",          value),
+                ("error",           True),
+            ])
 
-            if isinstance(tree.body[0], ast.Assign):
-                node = tree.body[0]
+            # And tack the error on to the end of the response.
+            self.results.append(metadata)
 
-                if hasattr(node, 'target'):
-                    target = node.target
-                else:
-                    target = node.targets[0]
+        if self.incremental is not None:
+            self.results = self.incremental.finish(self.results, self.marks, failed)
 
-                # Get the variable name
-                local_name = target.id
+        return self
 
-                if isinstance(tree.body[0], ast.AugAssign):
-                    operator = {'Mult': '*=', 'Add': '+=', 'Sub': '-=', 'Div': '/='}[node.op]
+    def import_and_trace_script(self, module_name, module_path, source=None):
+        """
+            As the name suggests, this imports and traces the target script.
 
-                    # This get the value of the local variable from earlier
-                    left_side_value = parse_eval(local_name, m_globals_copy, m_locals_copy, event=event)
+            Filters for the running script and delegates the resulting calls
+            to the result_handler method.
 
-                    # This evaluates the statement with the infixed operator
-                    value = parse_eval("{} {} {}".format(left_side_value, operator, value), event=event)
+            NOTE: script_path is necessary here for relative imports to work
+        """
+        script_dir = os.path.abspath(os.path.dirname(module_path))
+        changed = ()
+        if self.modules is not None:
+            changed = self.modules.evict_changed()
+            before = set(sys.modules)
+        try:
+            with script_path(script_dir, chdir=self.chdir):
+                if self.incremental is None:
+                    with self.tracer.trace(Q(filename_filter(module_path), action=self.result_handler)):
+                        import_file(module_name, module_path, source, self.codes)
                 else:
-                    # Basic macro to evaluate
-                    value = parse_eval(source[source.index('=')+1:].strip(), m_globals_copy, m_locals_copy, event=event)
-
-                # Make sure to display the output as a variable assignment
-                value = "{} = {}".format(local_name, value)
+                    source = read_script(module_path, source)
+                    module, code = self.incremental.prepare(
+                        module_name, module_path, source, self.codes.compile, changed)
+                    actions = [self.mark_statement, self.result_handler]
+                    with self.tracer.trace(Q(filename_filter(module_path), actions=actions)):
+                        exec(code, module.__dict__)
+        finally:
+            if self.modules is not None:
+                self.modules.record(script_dir, before)
+
+    def mark_statement(self, event):
+        # Module level lines tell which top-level statement runs
+        if event.kind == 'line' and event.function == '<module>':
+            self.marks.append((len(self.results), event.lineno))
+
+    def wolf_results(self):
+        # Only the entries with a value (or an error) are sent back.
+        return [i for i in self.results if 'value' in i or i.get('error')]
+
+    def payload(self):
+        results = self.wolf_results()
+        if self.compact:
+            results = wolf_columnar(results)
+        return results
+
+    def formats(self):
+        # It's important that we create an output that can be handled
+        # by the javascript `JSON.parse(...)` function.
+        return json.dumps(self.wolf_results())
+
+    def send_frames(self, fd):
+        """
+            Writes the results to the `fd` file descriptor as frames:
+            a 4 byte (big-endian) length followed by that many bytes
+            of the JSON. An empty frame ends the results. This keeps
+            them apart from whatever the script writes to stdout.
+        """
+        with os.fdopen(fd, 'wb', closefd=False) as out:
+            for chunk in wolf_encode(self.payload()):
+                if chunk:
+                    out.write(FRAME_HEADER.pack(len(chunk)))
+                    out.write(chunk)
+            out.write(FRAME_HEADER.pack(0))
+
+    def prints(self):
+        sys.stdout.flush()  # <-- keep the user's prints before the result
+        if self.result_fd is not None:
+            try:
+                return self.send_frames(self.result_fd)
+            except OSError:
+                pass  # Not open (ie: Windows), fall back to stdout
+
+        # DO NOT TOUCH, ie: no pretty printing
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            print("WOOF: " + json.dumps(self.payload()))  # <--  Wolf result
+            return
+        out.write(b"WOOF: ")  # <--  Wolf result
+        for chunk in wolf_encode(self.payload()):
+            out.write(chunk)
+        out.write(b"\n")
+        out.flush()
+        ######################################
+
+    def parse_eval(self, *args, **kw):
+        event = kw.get('event')
 
-            else:
-                # Basic macro evaluation
-                value = parse_eval(match.group('macro').strip(), m_globals_copy, m_locals_copy, event=event)
+        try:
+            rv = eval(compile_snippet(args[0]), *args[1:])
+        except BaseException as e:
+            if event['kind'] == 'line':
+                thrown = traceback.format_exception_only(type(e), e)
+                error = '\n'.join(thrown)
+                source = event['source'].strip()
+                metadata = OrderedDict([
+                    ("lineno",              event['lineno']),
+                    ("source",                       source),
+                    ("value",                     thrown[0]),
+                    ("error",                         error),
+                    # ("filename",          event['filename']),
+                ])
+
+                self.results.append(metadata)
+                raise WolfEvalError()
         else:
-            # Basic macro evaluation
-            value = parse_eval(match.group('macro').strip(), m_globals_copy, m_locals_copy, event=event)
+            return rv
 
-        # Final results are formatted
-        metadata['value'] = resultifier(value)
+    def result_handler(self, event):
+        """
+            Called by the `trace` function to handle any actions post
+            filter. ie: trace => filter => result_handler
 
-        if not skip and event.kind not in ['return', 'call']:
-            # And lastly, update our WOLF results list
-            WOLF.append(metadata)
+            Side Effects: Results are appended to the session results.
+        """
 
+        # We don't want any whitespace around our
+        # source code that could mess up the parser.
+        source = event['source'].strip()
 
-def filename_filter(filename):
-    """
-        Removes dependency noise from the output. We're only
-        interested in code paths travelled by the target script,
-        so this filter traces based on the filename, provided as
-        a prop on the `event` dict.
+        # These are the fields returned from each line
+        # of the traced program. This is essentially
+        # the metadata returned to the extension in the
+        # session results.
+        metadata = OrderedDict([
+            ("lineno",             event['lineno']),
+            # "value"    <-  Defined below MAYBE..
+        ])
 
-        NOTE: `filename_filter` is a closure over the actual filtering
-            function. It captures the target filename for injection
-            into the inner scope when the filter is actually run.
-    """
-    return lambda event: bool(event['filename'] == filename)
+        # The annotation will take on this value
+        # (if present).
+        value = None
+
+        # We'll need to look up any values in the
+        # correct scope, so let's grab the locals
+        # and globals from the current frame to
+        # use later on.
+        _globals = event['globals']
+        _locals = event['locals']
+
+        # This regex does all the heavy lifting. Check out
+        # https://regex101.com/r/npWf6w/5 for an example of
+        # # how it works.
+        match = WOLF_MACROS.search(source)
+
+        # Sometimes we have to skip an entry to prevent dupes
+        skip = False
+
+        # Regex match groups are used for convenience.
+        if source not in ['pass', 'break', 'continue'] and match: # fixes https://github.com/Duroktar/Wolf/issues/28 to 30
+
+            # TODO: We should be using the ast instead of regex for all cases.
+            tree = ast.parse(source)
+
+            # Simplest case.
+            if match.group('variable'):
+                if event.kind != 'call':
+                    value = self.parse_eval(match.group('variable'),
+                                       _globals, _locals, event=event)
+                    metadata["source"] = event['source'],
+                else:
+                    skip = True
+
+            # A little magic to parse print args
+            elif match.group('print'):
+                args = source_index(event['filename']).print_args.get(event['lineno'])
+                if args is None:
+                    args = SourceIndex(source).print_args.get(1)
+                if args is None:
+                    # No AST positions before Python 3.8
+                    from astunparse import unparse
+                    args = unparse(tree).strip()[6:-1]
+
+                buffer = io.StringIO()
+                try:
+                    to_eval = "print({}, file=wolf__buffer__)".format(args) # fixes https://github.com/Duroktar/Wolf/issues/34
+                    exec(compile_snippet(to_eval, 'exec'), _globals, {**_locals, 'wolf__buffer__': buffer})
+                    value = str(buffer.getvalue()).strip('\n')
+                finally:
+                    buffer.close()
+
+            # Macros require a few more steps..
+            elif match.group('macro'):
+
+                # XXX: This is to help avoid side effects when evaluating expressions
+                m_locals_copy = {k: try_deepcopy(v) for k, v in _locals.items()}
+                m_globals_copy = {k: try_deepcopy(v) for k, v in _globals.items()}
+
+                if isinstance(tree.body[0], ast.Assign):
+                    node = tree.body[0]
+
+                    if hasattr(node, 'target'):
+                        target = node.target
+                    else:
+                        target = node.targets[0]
+
+                    # Get the variable name
+                    local_name = target.id
+
+                    if isinstance(tree.body[0], ast.AugAssign):
+                        operator = {'Mult': '*=', 'Add': '+=', 'Sub': '-=', 'Div': '/='}[node.op]
+
+                        # This get the value of the local variable from earlier
+                        left_side_value = self.parse_eval(local_name, m_globals_copy, m_locals_copy, event=event)
+
+                        # This evaluates the statement with the infixed operator
+                        value = self.parse_eval("{} {} {}".format(left_side_value, operator, value), event=event)
+                    else:
+                        # Basic macro to evaluate
+                        expression = source_index(event['filename']).values.get(event['lineno'])
+                        if expression is None:
+                            expression = source[source.index('=')+1:].strip()
+                        value = self.parse_eval(expression, m_globals_copy, m_locals_copy, event=event)
+
+                    # Make sure to display the output as a variable assignment
+                    value = "{} = {}".format(local_name, value)
 
+                else:
+                    # Basic macro evaluation
+                    value = self.parse_eval(match.group('macro').strip(), m_globals_copy, m_locals_copy, event=event)
+            else:
+                # Basic macro evaluation
+                value = self.parse_eval(match.group('macro').strip(), m_globals_copy, m_locals_copy, event=event)
 
-def import_and_trace_script(module_name, module_path):
-    """
-        As the name suggests, this imports and traces the target script.
+            # Final results are formatted
+            metadata['value'] = resultifier(value)
 
-        Filters for the running script and delegates the resulting calls
-        to the result_handler function.
+            if not skip and event.kind not in ['return', 'call']:
+                # And lastly, update our results list
+                self.results.append(metadata)
 
-        NOTE: script_path is necessary here for relative imports to work
-    """
-    with script_path(os.path.abspath(os.path.dirname(module_path))):
-        with trace(filename_filter(module_path), action=result_handler):
-            import_file(module_name, module_path)
 
 def test(snippet):
     """
-        TODO
+        Traces the `snippet` from memory in a new session and
+        returns its results as a JSON string. Nothing is written
+        to disk and the working directory is left alone, so it
+        can be used from many threads (or processes) at once.
     """
-    from tempfile import mkstemp
-
-    testdir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests')
-    tmpfile_path = mkstemp(suffix=".py", text=True)[1]
-    full_path = os.path.abspath(tmpfile_path)
-    tmpfile_name = os.path.basename(tmpfile_path).split('.')[0]
-    filename = os.path.basename(tmpfile_path)
+    from tempfile import gettempdir
 
-    with open(full_path, 'a', encoding="utf-8") as the_file:
-        the_file.write(snippet.strip() + '\n')
+    # A (logical) path of its own, the source goes to the linecache
+    full_path = os.path.join(gettempdir(), 'wolf_snippet_{}_{}.py'.format(os.getpid(), next(SNIPPET_IDS)))
 
-    return main(full_path, test=True) 
+    try:
+        return WolfSession(chdir=False).trace(full_path, snippet.strip() + '\n').formats()
+    finally:
+        linecache.cache.pop(full_path, None)
+        SOURCE_INDEXES.pop(full_path, None)
 
 
-def main(filename, test = False):
+def main(filename, compact = False, source = None, result_fd = None):
     """
-        Simply ensures the target script exists and calls
-        the import_and_trace_script function. The results
-        are stored in the global WOLF variable which are
-        stringified and outputted to the console on script
-        completion.
+        Simply ensures the target script exists and traces it
+        in a `WolfSession`. The results are stringified and
+        outputted to the console on script completion.
 
         We follow convention by returning a proper (hm...)
         `exit` code to the shell, so the actual return data
@@ -389,7 +935,8 @@ def main(filename, test = False):
 
             -> `ARGS_ERROR:`    Happens if no target script provided.
 
-            -> `EXISTS_ERROR:`  Happens if the target file doesn't exist.
+            -> `EXISTS_ERROR:`  Happens if the target file doesn't exist
+                                (and its `source` wasn't given).
 
             -> `RUNTIME_ERROR:` Captures runtime errors from the main function.
 
@@ -414,78 +961,113 @@ def main(filename, test = False):
                 NOTE: May return wrong index if parsing the script
                 for Home Alone. /jk
 
+        The source of unsaved buffers can be piped in instead,
+        the filename is then only used for `__file__` and for
+        relative imports:
+
+            $ cat script.py | python wolf.py --stdin /some/path/to/script.py
+
+        or, with a filename of `-`, the filename is read from the
+        first line of stdin (the extension starts Wolf before it
+        knows what to trace).
+
+        With `--result-fd N` the results are sent on the file
+        descriptor `N` instead, as length-prefixed frames (see
+        `WolfSession.send_frames`), and stdout is left to the script.
+
+        With `--serve` Wolf keeps running and traces the scripts it
+        reads from stdin, one after the other (see `serve`).
+
+        The compiled scripts are cached out of the user's folders,
+        in `cache_dir()` (see `CodeCache`).
+
         XXX: This script can now be debugged from VS-Code. Simply choose
         `wolf.py Debug Session` from the list to start debugging with the
         `./test.py` selected as input automatically.
     """
-    if not os.path.exists(filename):
+    if source is None and not os.path.exists(filename):
         message = "EXISTS_ERROR: " + filename + " doesn't exist"
         print(message, file=sys.stderr)
         return 1
 
-    # The full path to the script (including filename and extension)
-    full_path = os.path.abspath(filename)
-
-    # The `import`able name of the target file
-    # ie: /home/duroktar/scripts/my_script.py  ->  my_script
-    module_name = os.path.basename(full_path).split('.')[0]
-
-    try:
-
-        import_and_trace_script(module_name, full_path)
+    session = WolfSession(compact=compact, result_fd=result_fd, codes=CodeCache(cache_dir()))
+    session.trace(filename, source)
 
-    except BaseException as e:
-
-        # If there's an error, we try to handle it and
-        # send back data that can be used to decorate
-        # the offending line.
-
-        value = traceback.format_exception_only(type(e), e)[0]
-
-        if isinstance(e, SyntaxError):
-            lineno = getattr(e, 'lineno')
-            value = e.msg
-            source = e.line
-        else:
-            _, _, exc_traceback = sys.exc_info()
-            tb = traceback.extract_tb(exc_traceback)[-1]
-            for i in traceback.extract_tb(exc_traceback):
-                if i.filename == filename:
-                    tb = i
-            lineno = tb.lineno
-            source = tb.line
+    # print the results and return a 0 for the exit code
+    session.prints()
+    return 0
 
-        metadata = OrderedDict([
-            ("lineno",          lineno),
-            # ("filename",   tb.filename),
-            ("source",  source.strip()),
-            ("value",            value),
-            ("error",             True),
-        ])
 
-        # And tack the error on to the end of the response.
-        WOLF.append(metadata)
+def read_frame(stream):
+    """
+        Reads a frame (see `WolfSession.send_frames`) from the
+        `stream`, returns None once it's closed.
+    """
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    size, = FRAME_HEADER.unpack(header)
+    return stream.read(size)
 
-    # handle testing
-    if test:
-        res = wolf_formats()
-        WOLF.clear()
-        try:
-            os.remove(full_path)
-        except PermissionError:
-            # NBD, this can fail on Windows CI tests..
-            pass
-        finally:
-            return res 
 
-    # print the results and return a 0 for the exit code
-    wolf_prints()
-    return 0
+def serve(compact = False, result_fd = None):
+    """
+        The persistent variant of `main`: traces a script for each
+        frame read from stdin, a `filename\nsource` request, and
+        sends back its results, until stdin is closed or an empty
+        frame is read. The scripts themselves see an empty stdin.
+
+        The local modules the scripts import stay in `sys.modules`
+        from one run to the next, unless they were edited (see
+        `LocalModules`). The globals of each script are kept too,
+        and only the statements an edit affects are run again (see
+        `wolf_incremental`).
+    """
+    from wolf_incremental import IncrementalScript
+
+    modules = LocalModules()
+    codes = CodeCache(cache_dir())
+    scripts = {}
+    # The requests are read from a copy of stdin, the scripts get an empty
+    # one instead (eg: `input()` raises EOFError rather than eat a request)
+    stdin = os.fdopen(os.dup(sys.stdin.fileno()), 'rb')
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, sys.stdin.fileno())
+    os.close(devnull)
+    while True:
+        request = read_frame(stdin)
+        if not request:
+            return 0
+        filename, _, source = request.decode('utf-8').partition('\n')
+        incremental = scripts.setdefault(os.path.abspath(filename), IncrementalScript())
+        session = WolfSession(compact=compact, result_fd=result_fd, modules=modules, codes=codes,
+                              incremental=incremental)
+        session.trace(filename, source)
+        session.prints()
 
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    result_fd = None
+    if '--result-fd' in args:
+        i = args.index('--result-fd')
+        result_fd = int(args[i + 1])
+        del args[i:i + 2]
+    compact = '--compact' in args
+    stdin = '--stdin' in args
+    if '--serve' in args:
+        sys.exit(serve(compact=compact, result_fd=result_fd))
+    args = [arg for arg in args if arg not in ('--compact', '--stdin')]
+
+    if len(args) < 1:
         print("ARGS_ERROR: Must provide a file to trace.")
         exit(1)
 
-    sys.exit(main(sys.argv[1]))
+    source = None
+    if stdin:
+        if args[0] == '-':
+            # Started ahead of time, the filename comes first
+            args[0] = sys.stdin.buffer.readline().decode('utf-8').rstrip('\r\n')
+        source = sys.stdin.buffer.read().decode('utf-8')
+
+    sys.exit(main(args[0], compact=compact, source=source, result_fd=result_fd))
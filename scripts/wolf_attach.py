@@ -0,0 +1,409 @@
+""" Wolf attach mode - look inside a running Python process.
+
+    Injects Wolf's capture plan for a source file into a live process (using
+    the same manhole/gdb bootstrap as `hunter-trace`) and streams aggregated
+    per-line values and hit counts back over a local unix socket:
+
+        $ python wolf_attach.py --pid 1234 /path/to/worker.py
+        WOOF: [{"lineno": 12, "source": "total", "value": "42", "hits": 1031, ...}]
+        ...
+
+    Only variable lines and `#?` macros are captured; print lines are skipped
+    so nothing is written to the target's stdout. Captures are sampled
+    (every Nth hit of a line) and rate-limited (per line, per second) so a
+    warmed-up worker keeps running at full speed. Hit counts are exact.
+
+    Before Python 3.12 only the main thread and the threads started after
+    attaching are captured, not the other threads that are already running.
+"""
+import argparse
+import ast
+import json
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import OrderedDict
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Top-level names of this directory, ie: wolf and its vendored dependencies
+VENDORED = ('astunparse', 'colorama', 'fields', 'hunter', 'six', 'wolf')
+
+
+def import_wolf():
+    """
+        Imports wolf.py with its vendored dependencies, and takes them
+        back out of `sys.modules` and `sys.path`: in an attached process
+        the target's own copies (ie: of hunter or six) must be the ones
+        it keeps using.
+    """
+    def vendored():
+        return [name for name in sys.modules if name.split('.')[0] in VENDORED]
+
+    saved = dict((name, sys.modules.pop(name)) for name in vendored())
+    sys.path.insert(0, SCRIPTS_DIR)
+    try:
+        import wolf
+    finally:
+        sys.path.remove(SCRIPTS_DIR)
+        for name in vendored():
+            del sys.modules[name]
+        sys.modules.update(saved)
+    return wolf
+
+
+wolf = import_wolf()
+WOLF_MACROS = wolf.WOLF_MACROS
+SourceIndex = wolf.SourceIndex
+resultifier = wolf.resultifier
+try_deepcopy = wolf.try_deepcopy
+
+
+###################
+#
+# Capture plan
+
+class LinePlan(object):
+    """
+        What to evaluate when a line is hit, and the aggregated results.
+    """
+
+    def __init__(self, lineno, source, code, target=None, names=None):
+        self.lineno = lineno
+        self.source = source
+        self.code = code
+        self.target = target
+        # The variables to copy before evaluating (macros only)
+        self.names = names
+
+        self.hits = 0
+        self.captured = 0
+        self.window = 0
+        self.window_count = 0
+        self.value = None
+        self.error = False
+
+    def as_result(self):
+        return OrderedDict([
+            ("lineno",     self.lineno),
+            ("source",     self.source),
+            ("value",       self.value),
+            ("error",       self.error),
+            ("hits",         self.hits),
+            ("captured", self.captured),
+        ])
+
+
+def build_capture_plan(source):
+    """
+        Maps line numbers to a `LinePlan`, using the same rules as the
+        `result_handler` in wolf.py (minus print lines).
+    """
+    plan = {}
+    index = SourceIndex(source)
+    for lineno, line in enumerate(source.splitlines(), 1):
+        line = line.strip()
+        match = WOLF_MACROS.search(line)
+        if line in ['pass', 'break', 'continue'] or not match:
+            continue
+        try:
+            if match.group('variable'):
+                plan[lineno] = LinePlan(lineno, line, compile(match.group('variable'), '<wolf>', 'eval'))
+            elif match.group('macro'):
+                tree = ast.parse(line)
+                if isinstance(tree.body[0], ast.Assign) and isinstance(tree.body[0].targets[0], ast.Name):
+                    expression = index.values.get(lineno) or line[line.index('=') + 1:].strip()
+                    target = tree.body[0].targets[0].id
+                else:
+                    expression = match.group('macro').strip()
+                    target = None
+                names = frozenset(node.id for node in ast.walk(ast.parse(expression)) if isinstance(node, ast.Name))
+                plan[lineno] = LinePlan(lineno, line, compile(expression, '<wolf>', 'eval'), target, names)
+        except SyntaxError:
+            continue
+    return plan
+
+
+###################
+#
+# Remote side (runs inside the target process)
+
+class AttachedCapture(object):
+    """
+        A minimal trace function: frames from other files are not traced
+        at all, and only the lines in the plan are looked at.
+    """
+
+    def __init__(self, sink_path, filename, sample_every=10, max_per_second=5, interval=0.5):
+        self.filename = os.path.abspath(filename)
+        self.sample_every = max(int(sample_every), 1)
+        self.max_per_second = max_per_second
+        self.interval = interval
+
+        with open(self.filename, encoding="utf-8") as fh:
+            self.plan = build_capture_plan(fh.read())
+
+        self._codes = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(sink_path)
+
+        self._thread = threading.Thread(target=self._run, name='wolf.AttachedCapture')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _is_target(self, code):
+        result = self._codes.get(code)
+        if result is None:
+            result = self._codes[code] = os.path.abspath(code.co_filename) == self.filename
+        return result
+
+    def global_trace(self, frame, event, arg):
+        if self._is_target(frame.f_code) and not self._closed.is_set():
+            return self.local_trace
+        return None
+
+    def local_trace(self, frame, event, arg):
+        if self._closed.is_set():
+            return None
+        if event == 'line':
+            line = self.plan.get(frame.f_lineno)
+            if line is not None:
+                with self._lock:
+                    line.hits += 1
+                    hits = line.hits
+                if (hits - 1) % self.sample_every == 0:
+                    self.capture(line, frame)
+        return self.local_trace
+
+    def capture(self, line, frame):
+        now = int(time.monotonic())
+        if line.window != now:
+            line.window = now
+            line.window_count = 0
+        if self.max_per_second and line.window_count >= self.max_per_second:
+            return
+        line.window_count += 1
+
+        _globals, _locals = frame.f_globals, frame.f_locals
+        if line.names is not None:
+            # XXX: This is to help avoid side effects when evaluating expressions,
+            # only the variables the expression refers to are copied
+            _globals, _locals = dict(_globals), dict(_locals)
+            for scope in _globals, _locals:
+                for name in line.names:
+                    if name in scope:
+                        scope[name] = try_deepcopy(scope[name])
+        try:
+            value = resultifier(eval(line.code, _globals, _locals))
+            if line.target is not None:
+                value = "{} = {}".format(line.target, value)
+            error = False
+        except Exception as e:
+            value = traceback.format_exception_only(type(e), e)[0]
+            error = True
+
+        with self._lock:
+            line.value = value
+            line.error = error
+            line.captured += 1
+
+    def results(self):
+        with self._lock:
+            return [line.as_result() for _, line in sorted(self.plan.items()) if line.hits]
+
+    def send(self):
+        self._sock.sendall((json.dumps(self.results()) + "\n").encode("utf-8"))
+
+    def _run(self):
+        sys.settrace(None)
+        try:
+            while not self._closed.wait(self.interval):
+                self.send()
+            self.send()
+        except OSError:
+            # The reader went away, stop capturing.
+            self._closed.set()
+            self.stop()
+        finally:
+            self._sock.close()
+
+    def start(self):
+        settrace_all_threads = getattr(threading, 'settrace_all_threads', None)
+        if settrace_all_threads is not None:
+            settrace_all_threads(self.global_trace)
+            for frame in sys._current_frames().values():
+                self.trace_frames(frame)
+        else:
+            # Before Python 3.12 a thread can only start tracing itself, so
+            # this is done by the new threads, this one and the main thread
+            # (see `run_in_main_thread`). The other threads that are already
+            # running are not traced.
+            threading.settrace(self.global_trace)
+            self.trace_current_thread()
+            if threading.current_thread() is not threading.main_thread():
+                run_in_main_thread(self.trace_current_thread)
+
+    def trace_current_thread(self):
+        sys.settrace(self.global_trace)
+        self.trace_frames(sys._getframe())
+
+    def trace_frames(self, frame):
+        # The frames that are already running never call `global_trace`
+        while frame is not None:
+            if self._is_target(frame.f_code):
+                frame.f_trace = self.local_trace
+            frame = frame.f_back
+
+    def stop(self):
+        settrace_all_threads = getattr(threading, 'settrace_all_threads', None)
+        if settrace_all_threads is not None:
+            settrace_all_threads(None)
+        else:
+            threading.settrace(None)
+            sys.settrace(None)
+            if threading.current_thread() is not threading.main_thread():
+                run_in_main_thread(lambda: sys.settrace(None))
+
+    def close(self):
+        self.stop()
+        self._closed.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+
+# Scheduled calls, kept alive until they run
+PENDING_CALLS = []
+
+
+def run_in_main_thread(func):
+    """
+        Makes the main thread call `func` in between two bytecodes (with
+        `Py_AddPendingCall`, CPython only). Returns whether it could be
+        scheduled.
+    """
+    try:
+        import ctypes
+        add_pending_call = ctypes.pythonapi.Py_AddPendingCall
+    except (ImportError, AttributeError):
+        return False
+    pending_call_type = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p)
+
+    def call(_):
+        try:
+            func()
+        except Exception:
+            traceback.print_exc()
+        return 0
+
+    callback = pending_call_type(call)
+    PENDING_CALLS.append(callback)
+    add_pending_call.argtypes = [pending_call_type, ctypes.c_void_p]
+    return add_pending_call(callback, None) == 0
+
+
+ACTIVE = None
+
+
+def activate(sink_path, filename, sample_every, max_per_second, interval):
+    global ACTIVE
+
+    if ACTIVE is not None:
+        ACTIVE.close()
+    ACTIVE = AttachedCapture(sink_path, filename, sample_every, max_per_second, interval)
+    ACTIVE.start()
+
+
+def deactivate():
+    global ACTIVE
+
+    if ACTIVE is not None:
+        ACTIVE.close()
+        ACTIVE = None
+
+
+###################
+#
+# Local side
+
+parser = argparse.ArgumentParser(description='Attach Wolf to a running Python process.')
+parser.add_argument('filename', metavar='FILE',
+                    help='The source file to capture values from (as seen by the target process).')
+parser.add_argument('-p', '--pid', metavar='PID', type=int, required=True,
+                    help='A numerical process id.')
+parser.add_argument('-t', '--timeout', dest='timeout', default=1, type=float,
+                    help='Timeout to use. Default: %(default)s seconds.')
+parser.add_argument('--gdb', dest='gdb', action='store_true',
+                    help='Use GDB to activate tracing. WARNING: it may deadlock the process!')
+parser.add_argument('-s', '--signal', dest='signal', type=int, metavar="SIGNAL", default=signal.SIGURG,
+                    help='Send the given SIGNAL to the process before connecting.')
+parser.add_argument('--sample-every', dest='sample_every', default=10, type=int,
+                    help='Capture values on every Nth hit of a line. Default: %(default)s.')
+parser.add_argument('--max-per-second', dest='max_per_second', default=5, type=int,
+                    help='Maximum captures per line per second (0 for no limit). Default: %(default)s.')
+parser.add_argument('--interval', dest='interval', default=0.5, type=float,
+                    help='Time between result updates. Default: %(default)s seconds.')
+
+
+# Loads this file without adding its directory to the target's `sys.path`
+ATTACH_PAYLOAD = """
+import sys
+if 'wolf_attach' not in sys.modules:
+    import importlib.util
+    spec = importlib.util.spec_from_file_location('wolf_attach', %r)
+    sys.modules['wolf_attach'] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sys.modules['wolf_attach'])
+sys.modules['wolf_attach'].activate(%r, %r, %r, %r, %r)
+"""
+
+
+def main():
+    from hunter.remote import gdb_bootstrap
+    from hunter.remote import get_peercred
+    from hunter.remote import manhole_bootstrap
+
+    args = parser.parse_args()
+
+    # Only this user can connect to the socket (mkdtemp makes a 0o700 directory)
+    sink_dir = tempfile.mkdtemp(prefix='wolf-attach-')
+    sink = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sink_path = os.path.join(sink_dir, 'sink')
+    sink.bind(sink_path)
+    sink.listen(1)
+
+    bootstrapper = gdb_bootstrap if args.gdb else manhole_bootstrap
+    payload = ATTACH_PAYLOAD % (
+        os.path.abspath(__file__),
+        sink_path,
+        os.path.abspath(args.filename),
+        args.sample_every,
+        args.max_per_second,
+        args.interval,
+    )
+    try:
+        with bootstrapper(args, payload, 'import wolf_attach; wolf_attach.deactivate()'):
+            conn, _ = sink.accept()
+            os.unlink(sink_path)
+            pid, _, _ = get_peercred(conn)
+            if pid != args.pid:
+                raise Exception("Unexpected pid %r connected to output socket. Was expecting %s." % (pid, args.pid))
+            try:
+                for line in conn.makefile('r', encoding='utf-8'):
+                    # DO NOT TOUCH, ie: no pretty printing
+                    print("WOOF: " + line.rstrip('\n'), flush=True)  # <--  Wolf result
+            except KeyboardInterrupt:
+                pass
+    finally:
+        sink.close()
+        shutil.rmtree(sink_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,786 @@
+""" Wolf incremental runs - only re-run what an edit can change.
+
+    In a persistent process (`wolf.py --serve`) the globals of the last
+    run of a script are kept. On the next run its top-level statements
+    are compared with the previous ones, and a def-use analysis of the
+    names each statement reads and writes decides which of them must
+    run again:
+
+        - the new and edited statements,
+        - the statements reading a name one of them writes,
+        - the earlier statements needed to put back a name they read
+          (ie: it was overwritten, or mutated, later on),
+        - the later writers of a name one of them writes,
+        - the moved statements defining functions or classes (their
+          code keeps the line numbers it was compiled with).
+
+    Names that may share an object (`y = x`, `x.append(y)`, `m =
+    x.append`, `y = f(x)` ...) are grouped: changing one of them in place
+    (`y.append(1)`, `y += [1]`, `m(1)`, iterating over a generator ...)
+    reads and writes all of them.
+
+    The other statements are skipped and their previous results reused
+    (moved to their new lines). Statements calling something that may
+    have side effects (anything but a few known pure builtins, modules
+    and user functions) all depend on each other through a `<world>`
+    pseudo-name, so they keep running in the same order relative to
+    each other. Anything the analysis can't follow (`exec`, `globals()`,
+    star imports, two statements on one line, a lambda or generator
+    reading a name a later statement changes, ...) makes it a full run.
+"""
+import ast
+import difflib
+import sys
+from collections import OrderedDict
+from importlib import util
+from importlib.machinery import SourceFileLoader
+
+
+# Calls that only read their arguments
+PURE_BUILTINS = frozenset((
+    'abs', 'all', 'any', 'ascii', 'bin', 'bool', 'bytes', 'callable', 'chr', 'complex', 'dict', 'divmod',
+    'enumerate', 'filter', 'float', 'format', 'frozenset', 'hasattr', 'hash', 'hex', 'id', 'int', 'isinstance',
+    'issubclass', 'len', 'list', 'map', 'max', 'min', 'oct', 'ord', 'pow', 'print', 'range', 'repr', 'reversed',
+    'round', 'set', 'slice', 'sorted', 'str', 'sum', 'tuple', 'type', 'zip',
+))
+# Modules whose functions only read their arguments
+PURE_MODULES = frozenset(('math', 'cmath', 'operator', 'string'))
+# Calls that read or write names behind our back
+OPAQUE_BUILTINS = frozenset((
+    'eval', 'exec', 'compile', 'globals', 'locals', 'vars', 'dir', 'setattr', 'delattr', 'getattr', '__import__',
+))
+# Calls returning an iterator over (some of) their arguments
+ITERATOR_BUILTINS = frozenset(('enumerate', 'filter', 'iter', 'map', 'reversed', 'zip'))
+# Calls consuming the iterables (and calling the functions) they're given
+CONSUMING_BUILTINS = frozenset((
+    'all', 'any', 'bytearray', 'bytes', 'dict', 'frozenset', 'list', 'max', 'min', 'print', 'set', 'sorted', 'sum',
+    'tuple',
+))
+# Calls returning a new object
+CONSTRUCTORS = frozenset((
+    'bytearray', 'bytes', 'dict', 'float', 'frozenset', 'int', 'list', 'set', 'sorted', 'str', 'tuple',
+))
+# Nodes compiling to code objects that outlive the statement
+CODE_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda, ast.GeneratorExp)
+# Statements binding names to functions, classes and modules
+DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Import, ast.ImportFrom)
+# Nodes evaluating to a new object (with LITERALS)
+DISPLAYS = (ast.List, ast.Dict, ast.Set, ast.ListComp, ast.SetComp, ast.DictComp)
+if sys.version_info < (3, 8):
+    CONSTANTS = (ast.Num, ast.Str, ast.Bytes, ast.NameConstant, ast.Ellipsis)
+else:
+    CONSTANTS = (ast.Constant,)
+LITERALS = CONSTANTS + tuple(getattr(ast, name) for name in ('JoinedStr', 'List', 'Tuple', 'Dict', 'Set') if hasattr(ast, name))
+# Stands for the state outside of the globals (files, sockets, random ...)
+WORLD = '<world>'
+
+
+class Opaque(Exception):
+    """ The script can't be analysed, it must be run in full """
+
+
+class Statement(object):
+    """
+        A top-level statement: its text and lines, the names it
+        reads and writes (see `ScriptAnalysis`) and, from the
+        previous run, its results.
+    """
+
+    def __init__(self, node, lineno, end_lineno, text):
+        self.node = node
+        self.lineno = lineno
+        self.end_lineno = end_lineno
+        self.text = text
+        self.reads = set()
+        self.writes = set()
+        # The names whose objects it changes in place
+        self.mutates = set()
+        # The names its lambdas and generators read, whenever they run
+        self.late_reads = set()
+        # Local modules imported, a statement is re-run if they changed
+        self.imports = set()
+        self.results = []
+
+
+class _Scope(object):
+    """
+        A function, lambda, class or comprehension body: the names it
+        reads (`loads`) when it runs, and the ones its own nested
+        functions read (`deferred`) when they're called.
+    """
+
+    def __init__(self, kind, params=()):
+        self.kind = kind
+        self.params = set(params)
+        self.locals = set()
+        self.globals = set()
+        self.loads = set()
+        self.deferred = set()
+        self.calls = set()  # <- names it calls, resolved in `ScriptAnalysis.resolve`
+        # Locals changed in place, and the ones that may share their
+        # object with something else (bound to anything but a new
+        # object)
+        self.mutated = set()
+        self.shared = set()
+        self.impure = False
+        self.generator = False
+
+    def free(self):
+        return (self.loads | self.deferred) - self.locals - self.params
+
+
+class ScriptAnalysis(ast.NodeVisitor):
+    """
+        Collects the names each top-level statement reads and writes
+        when it runs. The bodies of the functions it defines only run
+        when they're called: they're summarised, and their reads are
+        added to the statements that use them.
+    """
+
+    def __init__(self):
+        # functions[name]: _Scope summary of the top-level function or class
+        self.functions = {}
+        self.import_names = set()
+        self.definition_names = set()
+        self.pure_names = set(PURE_BUILTINS)
+        self.generators = set()
+        self.statement = None
+        self.scopes = []
+        # calls[statement]: names it calls
+        self.calls = {}
+        self.impure = set()
+        # Whether the name being bound gets a new object
+        self.fresh = False
+
+    def analyse(self, statement):
+        self.statement = statement
+        self.calls[statement] = set()
+        self.visit(statement.node)
+        for node in late_code(statement.node):
+            statement.late_reads |= free_names(node)
+
+    def resolve(self, statements):
+        """
+            Once every statement was seen: adds what the functions
+            they use read, and the `<world>` of the impure ones. An
+            impure statement may change any object it can reach.
+        """
+        # The names bound by anything but a def, class or import, and
+        # the names that are bound at all (the others are builtins)
+        variables, bound = set(), set()
+        for statement in statements:
+            if not isinstance(statement.node, DEFINITIONS):
+                variables |= statement.writes
+            bound |= statement.writes
+        constants = (self.import_names | self.definition_names) - variables
+        pure = self._pure_functions(variables)
+        for statement in statements:
+            statement.reads |= self._reach(statement.reads)
+            calls = self.calls[statement]
+            if statement in self.impure or any(name not in pure and name not in self.pure_names for name in calls):
+                statement.reads.add(WORLD)
+                statement.writes.add(WORLD)
+                # Bindings can't be changed by a call, only their objects
+                statement.mutates |= (statement.reads & bound) - constants
+                statement.writes |= statement.mutates
+        self._share(statements, bound - constants)
+
+        for index, statement in enumerate(statements):
+            late_reads = statement.late_reads | self._reach(statement.late_reads)
+            if any(late_reads & later.writes for later in statements[index + 1:]):
+                raise Opaque('late binding')
+
+    def _share(self, statements, shareable):
+        """
+            Groups the names that may share an object: the ones a
+            statement writes with the ones it reads. Changing one in
+            place changes all of them, and iterating over an iterator
+            (or a name sharing it) changes it.
+        """
+        groups = {}
+        for statement in statements:
+            if not statement.writes & shareable:
+                continue
+            group = set()
+            for name in (statement.reads | statement.writes) & shareable:
+                group |= groups.get(name, set([name]))
+            for name in group:
+                groups[name] = group
+
+        iterators = set()
+        for statement in statements:
+            node = statement.node
+            if isinstance(node, ast.Assign) and self._makes_iterator(node.value):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        iterators |= groups.get(target.id, set([target.id]))
+
+        # A name bound later on can't share an object with one changed
+        # now, unless it's bound to it (then its statement reads it)
+        bound_before = set()
+        for statement in statements:
+            mutates = statement.mutates | (statement.reads & iterators)
+            for name in mutates:
+                sharing = groups.get(name, set([name])) & bound_before | set([name])
+                statement.reads |= sharing
+                statement.writes |= sharing
+            bound_before |= statement.writes
+
+    def _makes_iterator(self, node):
+        if isinstance(node, ast.GeneratorExp):
+            return True
+        return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and \
+            (node.func.id in ITERATOR_BUILTINS or node.func.id in self.generators)
+
+    def _reach(self, names):
+        seen, pending = set(), [name for name in names if name in self.functions]
+        reach = set()
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            summary = self.functions[name]
+            reach |= summary.loads | summary.globals
+            pending.extend(n for n in summary.loads | summary.calls if n in self.functions)
+        return reach
+
+    def _pure_functions(self, variables):
+        pure = set(name for name, summary in self.functions.items() if not summary.impure and name not in variables)
+        changed = True
+        while changed:
+            changed = False
+            for name in list(pure):
+                calls = self.functions[name].calls
+                if any(called not in pure and called not in self.pure_names for called in calls):
+                    pure.discard(name)
+                    changed = True
+        return pure
+
+    # -% Bindings %-
+
+    def _read(self, name):
+        if self.scopes:
+            self.scopes[-1].loads.add(name)
+        else:
+            self.statement.reads.add(name)
+
+    def _write(self, name):
+        if not self.scopes:
+            self.statement.writes.add(name)
+        elif name in self.scopes[-1].globals:
+            # Assigning a global, when the function is called
+            self.scopes[-1].loads.add(name)
+            self.scopes[-1].impure = True
+        else:
+            self.scopes[-1].locals.add(name)
+            if not self.fresh:
+                self.scopes[-1].shared.add(name)
+
+    def _mutate(self, target):
+        """ The object `target` evaluates to is changed in place """
+        node = target
+        while isinstance(node, (ast.Attribute, ast.Subscript)):
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return
+        if not self.scopes:
+            self.statement.reads.add(node.id)
+            self.statement.writes.add(node.id)
+            self.statement.mutates.add(node.id)
+        elif node is target:
+            self.scopes[-1].mutated.add(node.id)  # <- checked in `_enter`
+        else:
+            self._set_impure()  # ie: local[0].append(...), may be anything's
+
+    def _set_impure(self):
+        if self.scopes:
+            self.scopes[-1].impure = True
+        else:
+            self.impure.add(self.statement)
+
+    def _enter(self, scope, body):
+        self.scopes.append(scope)
+        for child in body:
+            self.visit(child)
+        self.scopes.pop()
+        # Only the new objects of the scope can be changed in place
+        if scope.mutated - (scope.locals - scope.shared - scope.params):
+            scope.impure = True
+
+        if scope.kind in ('function', 'lambda'):
+            free, deferred = set(), scope.free()
+            if scope.kind == 'lambda':
+                # Can't tell where it's called from, as if it ran now
+                free, deferred = deferred, set()
+        else:
+            free, deferred = scope.loads - scope.locals - scope.params, scope.deferred
+
+        if self.scopes:
+            outer = self.scopes[-1]
+            outer.loads |= free
+            outer.deferred |= deferred
+            outer.calls |= scope.calls
+            outer.impure = outer.impure or scope.impure
+        else:
+            self.statement.reads |= free
+            self.calls[self.statement] |= scope.calls
+            if scope.impure and scope.kind in ('lambda', 'comprehension', 'class'):
+                self.impure.add(self.statement)
+
+    def _define(self, name, scope):
+        if self.scopes:
+            return
+        self.definition_names.add(name)
+        summary = self.functions.setdefault(name, _Scope('summary'))
+        summary.loads |= scope.free() if scope.kind == 'function' else \
+            (scope.loads - scope.locals) | scope.deferred
+        summary.globals |= scope.globals
+        summary.calls |= scope.calls
+        summary.impure = summary.impure or scope.impure
+        if scope.generator:
+            self.generators.add(name)
+
+    # -% Visitors %-
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load):
+            self._read(node.id)
+        else:
+            self._write(node.id)
+
+    def visit_Attribute(self, node):
+        if not isinstance(node.ctx, ast.Load):
+            self._mutate(node.value)
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node):
+        if not isinstance(node.ctx, ast.Load):
+            self._mutate(node.value)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        self.visit(node.value)
+        fresh = isinstance(node.value, LITERALS + DISPLAYS) or isinstance(node.value, ast.Call) and \
+            isinstance(node.value.func, ast.Name) and node.value.func.id in CONSTRUCTORS
+        for target in node.targets:
+            self.fresh = fresh and isinstance(target, ast.Name)
+            self.visit(target)
+        self.fresh = False
+
+    def visit_AugAssign(self, node):
+        self.visit(node.value)
+        if isinstance(node.target, ast.Name):
+            self._read(node.target.id)
+            # ie: `x += [1]` extends the list in place, it's still the same object
+            self._mutate(node.target)
+            self.fresh = True
+        self.visit(node.target)
+        self.fresh = False
+
+    def visit_Yield(self, node):
+        if self.scopes:
+            self.scopes[-1].generator = True
+        self.generic_visit(node)
+
+    visit_YieldFrom = visit_Yield
+
+    def visit_ExceptHandler(self, node):
+        if node.name:
+            self._write(node.name)
+        self.generic_visit(node)
+
+    def visit_Global(self, node):
+        if self.scopes:
+            self.scopes[-1].globals.update(node.names)
+
+    def visit_Nonlocal(self, node):
+        raise Opaque('nonlocal')
+
+    def visit_Await(self, node):
+        raise Opaque('await')
+
+    def visit_Match(self, node):
+        raise Opaque('match')
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self._bind_import(alias.asname or alias.name.partition('.')[0], alias.name)
+
+    def visit_ImportFrom(self, node):
+        if any(alias.name == '*' for alias in node.names):
+            raise Opaque('star import')
+        for alias in node.names:
+            self._bind_import(alias.asname or alias.name, node.module or '')
+
+    def _bind_import(self, name, module):
+        self._write(name)
+        if not self.scopes:
+            self.import_names.add(name)
+            if module.partition('.')[0] in PURE_MODULES:
+                self.pure_names.add(name)
+            self.statement.imports.add(module)
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Name):
+            if func.id in OPAQUE_BUILTINS:
+                raise Opaque(func.id)
+            if self.scopes and (func.id in self.scopes[-1].locals or func.id in self.scopes[-1].params):
+                self._set_impure()  # A callback, could be anything
+            elif self.scopes:
+                self.scopes[-1].calls.add(func.id)
+            else:
+                self.calls[self.statement].add(func.id)
+        elif isinstance(func, ast.Attribute):
+            receiver = func.value
+            while isinstance(receiver, (ast.Attribute, ast.Subscript)):
+                receiver = receiver.value
+            if isinstance(receiver, LITERALS):
+                pass  # ie: ', '.join(...)
+            elif isinstance(receiver, ast.Name) and receiver.id in self.pure_names:
+                pass  # ie: math.sqrt(...)
+            elif isinstance(receiver, ast.Name):
+                self._mutate(func.value)
+                if not self.scopes:
+                    self._set_impure()
+            else:
+                self._set_impure()
+        else:
+            self._set_impure()
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self._visit_signature(node.args, node.decorator_list, [node.returns])
+        self._write(node.name)
+        scope = _Scope('function', self._arg_names(node.args))
+        self._enter(scope, node.body)
+        self._define(node.name, scope)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        self._visit_signature(node.args, [], [])
+        self._enter(_Scope('lambda', self._arg_names(node.args)), [node.body])
+
+    def visit_ClassDef(self, node):
+        for child in node.decorator_list + node.bases + [keyword.value for keyword in node.keywords]:
+            self.visit(child)
+        self._write(node.name)
+        scope = _Scope('class')
+        self._enter(scope, node.body)
+        self._define(node.name, scope)
+
+    def _visit_signature(self, args, decorators, annotations):
+        defaults = list(args.defaults) + [default for default in args.kw_defaults if default is not None]
+        annotations = annotations + [arg.annotation for arg in self._all_args(args)]
+        for child in decorators + defaults + annotations:
+            if child is not None:
+                self.visit(child)
+
+    @staticmethod
+    def _all_args(args):
+        every = list(getattr(args, 'posonlyargs', [])) + list(args.args) + list(args.kwonlyargs)
+        return every + [arg for arg in (args.vararg, args.kwarg) if arg is not None]
+
+    def _arg_names(self, args):
+        return [arg.arg for arg in self._all_args(args)]
+
+    def _visit_comprehension(self, node):
+        # The first iterable is evaluated outside, the targets are local
+        self.visit(node.generators[0].iter)
+        scope = _Scope('comprehension')
+        self.scopes.append(scope)
+        for index, generator in enumerate(node.generators):
+            self.visit(generator.target)
+            if index:
+                self.visit(generator.iter)
+            for condition in generator.ifs:
+                self.visit(condition)
+        self.scopes.pop()
+        self._enter(scope, [getattr(node, name) for name in ('elt', 'key', 'value') if hasattr(node, name)])
+
+    visit_ListComp = visit_SetComp = visit_DictComp = visit_GeneratorExp = _visit_comprehension
+
+    def visit_NamedExpr(self, node):
+        # Binds in the first enclosing scope that isn't a comprehension
+        self.visit(node.value)
+        scopes = self.scopes
+        self.scopes = list(scopes)
+        while self.scopes and self.scopes[-1].kind == 'comprehension':
+            self.scopes.pop()
+        try:
+            self._write(node.target.id)
+        finally:
+            self.scopes = scopes
+
+
+def split_statements(source):
+    """
+        The top-level statements of `source`, analysed. Raises
+        `Opaque` if they can't be.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        raise Opaque('syntax')
+    lines = source.splitlines(True)
+    statements = []
+    previous_end = 0
+    for node in tree.body:
+        end_lineno = getattr(node, 'end_lineno', None)
+        if end_lineno is None:
+            raise Opaque('no end_lineno before Python 3.8')
+        lineno = min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', [])])
+        if lineno <= previous_end:
+            raise Opaque('statements sharing a line')
+        previous_end = end_lineno
+        statements.append(Statement(node, lineno, end_lineno, ''.join(lines[lineno - 1:end_lineno])))
+
+    analysis = ScriptAnalysis()
+    for statement in statements:
+        analysis.analyse(statement)
+    analysis.resolve(statements)
+    return statements
+
+
+def late_code(node):
+    """
+        The lambdas and generator expressions in `node` that may run
+        after it: the ones not given to a call consuming them right
+        away (ie: `sorted(x, key=lambda ...)`, `sum(... for ...)`).
+        The function bodies are left out, they're summarised.
+    """
+    consumed = set()
+    pending = [node]
+    while pending:
+        child = pending.pop()
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if isinstance(child, (ast.Lambda, ast.GeneratorExp)) and id(child) not in consumed:
+            yield child
+            continue
+        if isinstance(child, ast.Call) and consumes(child):
+            arguments = list(child.args) + [keyword.value for keyword in child.keywords]
+            while arguments:
+                argument = arguments.pop()
+                consumed.add(id(argument))
+                if isinstance(argument, ast.Call) and isinstance(argument.func, ast.Name) \
+                        and argument.func.id in ITERATOR_BUILTINS:
+                    arguments.extend(argument.args)  # ie: list(map(lambda ..., x))
+        pending.extend(ast.iter_child_nodes(child))
+
+
+def consumes(call):
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id in CONSUMING_BUILTINS
+    return isinstance(func, ast.Attribute) and func.attr == 'join'
+
+
+def free_names(node):
+    """ The names `node` reads but doesn't bind (or more) """
+    loads, bound = set(), set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            (loads if isinstance(child.ctx, ast.Load) else bound).add(child.id)
+        elif isinstance(child, ast.arguments):
+            bound.update(arg.arg for arg in ScriptAnalysis._all_args(child))
+    return loads - bound
+
+
+def defines_code(node):
+    """ Whether running `node` leaves code objects behind """
+    return any(isinstance(child, CODE_NODES) for child in ast.walk(node))
+
+
+def plan(previous, statements, changed_modules=()):
+    """
+        Which of the `statements` must run, given the `previous`
+        ones (with their results) and the local modules that
+        changed since. Returns the indexes to re-run, the `{new
+        index: old index}` of the reused ones, the names to remove
+        from the globals and the `{old lineno: new lineno}` of the
+        reused lines. Raises `Opaque` if it has to be a full run.
+    """
+    matcher = difflib.SequenceMatcher(None, [s.text for s in previous], [s.text for s in statements], autojunk=False)
+    matched = {}  # new index -> old index
+    for block in matcher.get_matching_blocks():
+        for k in range(block.size):
+            matched[block.b + k] = block.a + k
+    old_to_new = dict((old, new) for new, old in matched.items())
+
+    # Old lines -> new lines, for the results of the reused statements
+    line_map = {}
+    for new, old in matched.items():
+        shift = statements[new].lineno - previous[old].lineno
+        for lineno in range(previous[old].lineno, previous[old].end_lineno + 1):
+            line_map[lineno] = lineno + shift
+
+    rerun = set()
+    for index, statement in enumerate(statements):
+        if index not in matched or statement.imports & set(changed_modules):
+            rerun.add(index)
+        elif any(result['lineno'] not in line_map for result in previous[matched[index]].results):
+            rerun.add(index)
+        elif statement.lineno != previous[matched[index]].lineno and defines_code(statement.node):
+            rerun.add(index)
+
+    # The statement that wrote each name last, in the previous run
+    last_old_writer = {}
+    for old, statement in enumerate(previous):
+        for name in statement.writes:
+            last_old_writer[name] = old
+
+    old_writers, writers = {}, {}
+    for old, statement in enumerate(previous):
+        for name in statement.writes:
+            old_writers.setdefault(name, []).append(old)
+    for index, statement in enumerate(statements):
+        for name in statement.writes:
+            writers.setdefault(name, []).append(index)
+
+    def last_writer_before(name, index, writers=writers):
+        before = [i for i in writers.get(name, ()) if i < index]
+        return before[-1] if before else None
+
+    # A reused statement must read what it read last time, from the
+    # same writers (a writer in between was added or removed otherwise)
+    for new, old in matched.items():
+        for name in statements[new].reads:
+            writer = last_writer_before(name, new)
+            if old_to_new.get(last_writer_before(name, old, old_writers)) != writer:
+                rerun.add(new)
+
+    def holds_output_of(name, index):
+        # The kept globals have the value `index` gave `name`
+        old = last_old_writer.get(name)
+        return old is not None and old_to_new.get(old) == index
+
+    # The final values must be the ones of the last writers
+    for name, indexes in writers.items():
+        if not holds_output_of(name, indexes[-1]):
+            rerun.add(indexes[-1])
+    removed = set(last_old_writer) - set(writers)
+
+    def check_unset_reads(index):
+        for name in statements[index].reads:
+            if name == WORLD or last_writer_before(name, index) is not None:
+                continue
+            if name in writers:
+                # The kept globals have it already
+                raise Opaque('{} read before it is set'.format(name))
+            if name in removed:
+                rerun.add(index)  # <- a NameError now
+
+    for index in range(len(statements)):
+        check_unset_reads(index)
+
+    pending = sorted(rerun)
+    while pending:
+        index = pending.pop()
+        statement = statements[index]
+        additions = set()
+        for name in statement.reads:
+            writer = last_writer_before(name, index)
+            if writer is not None and writer not in rerun and not holds_output_of(name, writer):
+                additions.add(writer)
+        for name in statement.writes:
+            for other in range(index + 1, len(statements)):
+                if other not in rerun and (name in statements[other].reads or name in statements[other].writes):
+                    additions.add(other)
+        for addition in additions - rerun:
+            rerun.add(addition)
+            pending.append(addition)
+
+    reused = dict((new, old) for new, old in matched.items() if new not in rerun)
+    return rerun, reused, removed, line_map
+
+
+class IncrementalScript(object):
+    """
+        The state a persistent process keeps for a script between
+        runs: the module it ran in, and its statements with their
+        results. A failed run, or one that couldn't be planned, is
+        followed by a full run.
+    """
+
+    def __init__(self):
+        self.module = None
+        self.statements = None
+        self.pending = None
+
+    def prepare(self, module_name, filename, source, compile_script, changed_modules=()):
+        """
+            Returns the module to run the code in, and the code to
+            run: all of it, or only the statements `plan` picked.
+        """
+        try:
+            statements = split_statements(source)
+        except Opaque:
+            statements = None
+        try:
+            if statements is None or self.statements is None:
+                raise Opaque('first run')
+            rerun, reused, removed, line_map = plan(self.statements, statements, changed_modules)
+        except Opaque:
+            loader = SourceFileLoader(module_name, filename)
+            self.module = util.module_from_spec(util.spec_from_file_location(module_name, filename, loader=loader))
+            self.pending = statements, None, {}, {}
+            return self.module, compile_script(source, filename)
+
+        for name in removed:
+            self.module.__dict__.pop(name, None)
+        body = [statement.node for index, statement in enumerate(statements) if index in rerun]
+        self.pending = statements, rerun, reused, line_map
+        return self.module, compile(ast.Module(body=body, type_ignores=[]), filename, 'exec')
+
+    def finish(self, results, marks, failed):
+        """
+            Puts the `results` of the run back together with the
+            reused ones, in the order of the statements. `marks` are
+            the `(result count, lineno)` of each module level line.
+        """
+        statements, rerun, reused, line_map = self.pending or (None, None, None, None)
+        self.pending = None
+        if not statements:
+            self.statements = None
+            return results
+
+        statement_at = {}
+        for index, statement in enumerate(statements):
+            for lineno in range(statement.lineno, statement.end_lineno + 1):
+                statement_at[lineno] = index
+
+        fresh = dict((index, []) for index in range(len(statements)))
+        current = None
+        marks = list(marks)
+        for position, result in enumerate(results):
+            while marks and marks[0][0] <= position:
+                current = statement_at.get(marks.pop(0)[1], current)
+            fresh[current if current is not None else 0].append(result)
+        last_run = current
+        while marks:
+            last_run = statement_at.get(marks.pop(0)[1], last_run)
+        if failed and last_run is None:
+            self.statements = None
+            return results
+
+        merged = []
+        for index, statement in enumerate(statements):
+            if rerun is None or index in rerun:
+                statement.results = fresh[index]
+            else:
+                statement.results = [self._moved(result, line_map) for result in self.statements[reused[index]].results]
+            merged.extend(statement.results)
+            if failed and index == last_run:
+                break
+
+        self.statements = None if failed else statements
+        return merged
+
+    @staticmethod
+    def _moved(result, line_map):
+        moved = OrderedDict(result)
+        moved['lineno'] = line_map[result['lineno']]
+        return moved
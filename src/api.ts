@@ -1,4 +1,3 @@
-import * as fs from "fs";
 import {
   WolfDecorationsController,
   wolfDecorationStoreFactory
@@ -18,16 +17,19 @@ import {
   TextDocument,
   TextEditor,
   workspace,
+  window,
   WorkspaceConfiguration,
 } from "vscode";
 import { WolfSessionController, wolfSessionStoreFactory } from "./sessions";
 import { PythonTracer, pythonTracerFactory } from "./tracer";
-import { getActiveEditor, makeTempFile } from "./helpers";
+import { getActiveEditor } from "./helpers";
 import { hotModeWarning } from "./hotWarning";
 import { wolfOutputFactory, WolfOutputController } from "./output";
 import { EventEmitter } from "events";
 import { platform } from "os";
-import { WolfError } from "./errors";
+import { WolfError, WolfTraceCancelledError } from "./errors";
+import { WolfLatencyTracker, wolfLatencyTrackerFactory } from "./latency";
+import { clamp } from "./utils";
 
 export function wolfStandardApiFactory(
   context: ExtensionContext,
@@ -39,6 +41,7 @@ export function wolfStandardApiFactory(
     wolfDecorationStoreFactory(context),
     wolfSessionStoreFactory(),
     pythonTracerFactory(),
+    wolfLatencyTrackerFactory(),
   );
 }
 
@@ -46,33 +49,59 @@ export class WolfAPI {
   private _changedConfigFlag = false;
   private _endOfFile = 0;
   private _eventEmitter = new EventEmitter()
+  private _updateDelays = new Map<string, number>();
 
   constructor(
     public context: ExtensionContext,
     private _outputController: WolfOutputController,
     private _decorationController: WolfDecorationsController,
     private _sessionController: WolfSessionController,
-    private _pythonTracer: PythonTracer
-  ) { }
+    private _pythonTracer: PythonTracer,
+    private _latencyTracker: WolfLatencyTracker
+  ) {
+    this._pythonTracer.onRunFinished = this._latencyTracker.record;
+  }
 
   public stepInWolf = (): void => {
     this.decorations.setDefaultDecorationOptions("green", "red");
     this.sessions.createSessionFromEditor(this.activeEditor);
     this.updateLineCount(this.activeEditor.document.lineCount);
-    this.traceAndSetDecorations(this.activeEditor.document.fileName);
+    this.traceAndSetDecorationsFromBuffer(this.activeEditor.document);
     this.enterWolfContext();
   };
 
   public stopWolf = (): void => {
+    this.tracer.cancelAll();
     this.clearAllSessionsAndDecorations();
     this.exitWolfContext();
   };
 
-  public traceAndSetDecorationsUsingTempFile = (document: TextDocument): void => {
-    const tempFileObj = makeTempFile(document.fileName);
-    fs.writeFileSync(tempFileObj.name, document.getText());
-    this.traceAndSetDecorations(tempFileObj.name)
-      .finally(tempFileObj.removeCallback);
+  /**
+   * The time to wait after a change before tracing the document. Derived
+   * from the recent trace durations, unless `wolf.adaptiveUpdateFrequency`
+   * is off, then it's `wolf.updateFrequency`.
+   */
+  public getUpdateDelay = (document: TextDocument): number => {
+    const fixed = clamp(100, 10000, this.updateFrequency ?? Infinity);
+    if (!this.adaptiveUpdateFrequency) {
+      return fixed;
+    }
+    const fileName = document.fileName;
+    const delay = this._latencyTracker.getDelay(
+      fileName,
+      fixed,
+      this.config.get<number>("minUpdateFrequency") ?? 100,
+      this.config.get<number>("maxUpdateFrequency") ?? 10000,
+    );
+    if (this._updateDelays.get(fileName) !== delay) {
+      this._updateDelays.set(fileName, delay);
+      this.logUpdateDelay(fileName);
+    }
+    return delay;
+  };
+
+  public traceAndSetDecorationsFromBuffer = (document: TextDocument): void => {
+    this.traceAndSetDecorations(document.fileName, document.getText());
   };
 
   public enterWolfContext = (): void => {
@@ -90,6 +119,7 @@ export class WolfAPI {
 
   public clearAllDecorations = (): void => {
     this.decorations.reInitDecorationCollection();
+    this.decorations.resetRenderedDecorations();
     for (const name of this.sessions.sessionNames) {
       const session = this.sessions.getSessionByFileName(name);
       this.clearDecorations(session);
@@ -115,21 +145,37 @@ export class WolfAPI {
   }
 
   private onPythonDataError = (data?: string): void => {
+    if ((data as unknown) instanceof WolfTraceCancelledError) {
+      return;
+    }
     if (this.shouldLogErrors) {
       this.logToOutput("(Wolf Error):", data ?? '<no message>');
     }
   };
 
-  private onPythonDataSuccess = ([data, stdout]: TracerParsedResultTuple): void => {
-    this.parsePythonDataAndSetDecorations(this.activeEditor, data);
+  private visibleEditorFor = (fileName: string): TextEditor | undefined => {
+    return window.visibleTextEditors.find(editor => editor.document.fileName === fileName);
+  };
+
+  private onPythonDataSuccess = (
+    fileName: string,
+    [data, stdout]: TracerParsedResultTuple
+  ): void => {
+    /* Background traces can finish after the user switched editors */
+    const session = this.visibleEditorFor(fileName);
+    if (session === undefined) {
+      return;
+    }
+    this.parsePythonDataAndSetDecorations(session, data);
     if (this.printLogging) {
       const output = this.prettyPrintWolfData(data);
       this._outputController.clear();
       this.logToOutput(stdout ? stdout + '\n\n' : '');
       this.logToOutput(`(Wolf Output): ${JSON.stringify(output, null, 4)}`);
       this.logToOutput(`\n\nTotal Line Count: ${data?.length}`);
+      this.logUpdateDelay(fileName);
     }
-    const filepath = this.activeEditor.document.uri.path;
+    const filepath = session.document.uri.path;
     this.emit('decorations-changed', filepath, this.decorations);
   };
 
@@ -137,16 +183,17 @@ export class WolfAPI {
     session: TextEditor,
     data: WolfParsedTraceResults = []
   ) => {
-    this.decorations.reInitDecorationCollection();
-    this.decorations.prepareParsedPythonData(data);
-    this.clearDecorations(session);
+    this.decorations.prepareParsedPythonData(session.document.fileName, data);
     this.setPreparedDecorations(session);
   };
 
-  private setPreparedDecorations = (session: TextEditor): void => {
+  public setPreparedDecorations = (session: TextEditor): void => {
+    const fileName = session.document.fileName;
     this.decorations.setPreparedDecorationsForEditor(session);
-    const decorations = this.decorations.getPreparedDecorations();
-    this.setDecorations(session, decorations);
+    if (this.decorations.preparedDecorationsChanged(fileName)) {
+      const decorations = this.decorations.getPreparedDecorations(fileName);
+      this.setDecorations(session, decorations);
+    }
   };
 
   private setDecorations = (
@@ -160,13 +207,17 @@ export class WolfAPI {
     }
   };
 
-  private traceAndSetDecorations = (fileName: string): Promise<void> => {
+  private traceAndSetDecorations = (fileName: string, source: string): Promise<void> => {
     return this.tracer.tracePythonScript({
       fileName,
+      source,
+      priority: window.activeTextEditor?.document.fileName === fileName ? "foreground" : "background",
+      maxWorkers: this.config.get<number>("maxWorkers"),
+      workerIdleTimeout: this.config.get<number>("workerIdleTimeout"),
       pythonPath: this.pythonPath,
       rootDir: this.rootExtensionDir,
     })
-      .then(this.onPythonDataSuccess)
+      .then(results => this.onPythonDataSuccess(fileName, results))
       .catch(this.onPythonDataError)
   };
 
@@ -179,7 +230,18 @@ export class WolfAPI {
       this.setPreparedDecorations(this.activeEditor);
       this.updateLineCount(event.document.lineCount);
     }
-    this.activeEditor.document.save();
+  };
+
+  private logUpdateDelay = (fileName: string): void => {
+    const delay = this._updateDelays.get(fileName);
+    const stats = this._latencyTracker.getStats(fileName);
+    if (delay === undefined || stats === undefined) {
+      return;
+    }
+    this.logToOutput(
+      `\n(Wolf Update Delay): ${delay}ms ` +
+      `(average: ${Math.round(stats.average)}ms, p95: ${Math.round(stats.p95)}ms, traces: ${stats.count})\n`
+    );
   };
 
   public setConfigUpdatedFlag(v: boolean): void {
@@ -230,6 +292,10 @@ export class WolfAPI {
     return this.config.get<number>("updateFrequency");
   }
 
+  public get adaptiveUpdateFrequency(): boolean {
+    return this.config.get<boolean>("adaptiveUpdateFrequency") !== false;
+  }
+
   public get oldLineCount(): number {
     return this._endOfFile;
   }
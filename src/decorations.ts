@@ -25,6 +25,25 @@ import { clamp, stringEscape } from "./utils";
 
 import { js as beautify } from "js-beautify";
 
+/* Files with fewer lines are always decorated in full */
+const VIEWPORT_MIN_LINE_COUNT = 1000;
+/* Lines decorated above and below the visible ranges */
+const VIEWPORT_MARGIN = 200;
+
+interface WolfRenderedDecoration {
+  key: string;
+  decoration: DecorationOptions;
+}
+
+/* Each document has its own, so a trace of another visible editor doesn't touch them */
+interface WolfDocumentDecorations {
+  decorations: WolfDecorationMapping;
+  renderCache: Map<number, WolfRenderedDecoration>;
+  prepared: WolfDecorations | null;
+  preparedChanged: boolean;
+  preparedEditor: TextEditor | null;
+}
+
 export function wolfDecorationStoreFactory(
   context: ExtensionContext,
 ): WolfDecorationsController {
@@ -32,9 +51,8 @@ export function wolfDecorationStoreFactory(
 }
 
 export class WolfDecorationsController {
-  private _decorations: WolfDecorationMapping = {};
   private _decorationTypes: WolfStandardDecorationTypes | null = null;
-  private _preparedDecorations: WolfDecorations | null = null;
+  private _documents = new Map<string, WolfDocumentDecorations>();
 
   constructor(public context: ExtensionContext) {}
 
@@ -47,22 +65,37 @@ export class WolfDecorationsController {
     return { success: [], error: [] };
   };
 
-  public getPreparedDecorations = (): WolfDecorations => {
-    if (this._preparedDecorations) {
-      return this._preparedDecorations;
+  public getPreparedDecorations = (fileName: string): WolfDecorations => {
+    const prepared = this._documents.get(fileName)?.prepared;
+    if (prepared) {
+      return prepared;
     } else {
       return this.getEmptyDecorations();
     }
   };
 
-  public prepareParsedPythonData = (data: WolfParsedTraceResults): void => {
+  /* Replaces the decorations of the document `fileName` */
+  public prepareParsedPythonData = (fileName: string, data: WolfParsedTraceResults): void => {
+    const document = this.getDocumentDecorations(fileName);
+    document.decorations = {};
     for (const line of data ?? []) {
-      this.setDecorationAtLine(line);
+      this.setDecorationAtLine(document, line);
     }
   };
 
   public reInitDecorationCollection = (): void => {
-    this._decorations = {};
+    for (const document of this._documents.values()) {
+      document.decorations = {};
+    }
+  };
+
+  public resetRenderedDecorations = (): void => {
+    for (const document of this._documents.values()) {
+      document.renderCache.clear();
+      document.prepared = null;
+      document.preparedChanged = true;
+      document.preparedEditor = null;
+    }
   };
 
   public setDefaultDecorationOptions = (
@@ -75,56 +108,96 @@ export class WolfDecorationsController {
     };
   };
 
+  /**
+   * Decoration options are only created for lines whose results (or
+   * source text) changed since they were last rendered, the others are
+   * reused. On large files only the visible ranges (plus a margin) are
+   * decorated, see `getDecoratedLineRange`.
+   */
   public setPreparedDecorationsForEditor = (editor: TextEditor): void => {
+    const document = this.getDocumentDecorations(editor.document.fileName);
     const decorations: DecorationOptions[] = [];
     const errorDecorations: DecorationOptions[] = [];
+    const truncLength = this.maxLineLength;
+    const [firstLine, lastLine] = this.getDecoratedLineRange(editor);
 
-    Object.keys(this._decorations).forEach(key => {
+    Object.keys(document.decorations).forEach(key => {
       const lineNo = parseInt(key, 10);
       const lineIndex = lineNo - 1;
-      const decorationData = this.getDecorationAtLine(lineNo);
+      const decorationData = document.decorations[lineNo];
 
-      if (!decorationData.data || editor.document.lineCount < lineNo) {
+      if (!decorationData.data || lineNo < firstLine || lineNo > lastLine) {
         return;
       }
 
       const textLine = editor.document.lineAt(lineIndex);
       const source = textLine.text;
-      const decoRange = new Range(
-        new Position(lineIndex, textLine.firstNonWhitespaceCharacterIndex),
-        new Position(lineIndex, textLine.text.indexOf(source) + source.length)
-      );
-
-      const decoration = this.createWolfDecorationOptions({
-        range: decoRange,
-        text: decorationData.data.join(" => "), // This seperator should be adjustable from the config
-        hoverText: decorationData.pretty.join("\n"),
-        color: decorationData.error ? "red" : "cornflower"
-      });
+      const renderKey = [
+        decorationData.error ? "E" : "S", truncLength, source, ...decorationData.data
+      ].join("\u0000");
+
+      let rendered = document.renderCache.get(lineNo);
+      if (rendered === undefined || rendered.key !== renderKey) {
+        const decoRange = new Range(
+          new Position(lineIndex, textLine.firstNonWhitespaceCharacterIndex),
+          new Position(lineIndex, textLine.text.indexOf(source) + source.length)
+        );
+
+        rendered = {
+          key: renderKey,
+          decoration: this.createWolfDecorationOptions({
+            range: decoRange,
+            text: decorationData.data.join(" => "), // This seperator should be adjustable from the config
+            hoverText: this.getPrettyValues(decorationData).join("\n"),
+            color: decorationData.error ? "red" : "cornflower"
+          }, truncLength)
+        };
+        document.renderCache.set(lineNo, rendered);
+      }
 
       if (decorationData.error)
-        errorDecorations.push(decoration)
+        errorDecorations.push(rendered.decoration)
       else
-        decorations.push(decoration)
+        decorations.push(rendered.decoration)
     });
 
-    this._preparedDecorations = {
-      success: decorations,
-      error: errorDecorations
-    };
+    for (const lineNo of Array.from(document.renderCache.keys())) {
+      if (document.decorations[lineNo] === undefined) {
+        document.renderCache.delete(lineNo);
+      }
+    }
+
+    const previous = document.prepared;
+    document.preparedChanged = previous === null
+      || document.preparedEditor !== editor
+      || !sameDecorations(previous.success, decorations)
+      || !sameDecorations(previous.error, errorDecorations);
+
+    if (document.preparedChanged) {
+      document.preparedEditor = editor;
+      document.prepared = {
+        success: decorations,
+        error: errorDecorations
+      };
+    }
+  };
+
+  /* Whether the last `setPreparedDecorationsForEditor` of the document changed its decorations */
+  public preparedDecorationsChanged = (fileName: string): boolean => {
+    return this._documents.get(fileName)?.preparedChanged ?? false;
   };
 
   public get hasDecorations(): boolean {
-    return Object.keys(this._decorations).length > 0;
+    return Array.from(this._documents.values()).some(
+      document => Object.keys(document.decorations).length > 0
+    );
   }
 
 
   private createWolfDecorationOptions = (
-    options: WolfDecorationOptions
+    options: WolfDecorationOptions,
+    truncLength: number
   ): DecorationOptions => {
-    const truncLength = workspace
-      .getConfiguration("wolf")
-      .get<number>("maxLineLength") ?? 100;
     const textLength = options.text.length;
     const ellipsis = textLength > truncLength ? " ..." : "";
     return {
@@ -167,34 +240,85 @@ export class WolfDecorationsController {
     });
   };
 
-  private getDecorationAtLine = (lineNo: number): WolfLineDecoration => {
-    return this._decorations[lineNo];
+  private getDocumentDecorations = (fileName: string): WolfDocumentDecorations => {
+    let document = this._documents.get(fileName);
+    if (document === undefined) {
+      document = {
+        decorations: {},
+        renderCache: new Map(),
+        prepared: null,
+        preparedChanged: true,
+        preparedEditor: null
+      };
+      this._documents.set(fileName, document);
+    }
+    return document;
   };
 
-  private getDecorationAtLineOrDefault = (lineNo: number): WolfLineDecoration => {
-    return (this.getDecorationAtLine(lineNo) || { data: [], pretty: [] });
+  private getDecoratedLineRange = (editor: TextEditor): [number, number] => {
+    const lineCount = editor.document.lineCount;
+    const visibleRanges = editor.visibleRanges;
+    if (lineCount < VIEWPORT_MIN_LINE_COUNT || !visibleRanges.length) {
+      return [1, lineCount];
+    }
+    let first = lineCount;
+    let last = 1;
+    for (const range of visibleRanges) {
+      first = Math.min(first, range.start.line + 1);
+      last = Math.max(last, range.end.line + 1);
+    }
+    return [
+      Math.max(1, first - VIEWPORT_MARGIN),
+      Math.min(lineCount, last + VIEWPORT_MARGIN)
+    ];
   };
 
-  private setDecorationAtLine = (line: WolfTraceLineResult): void => {
+  /* Beautifying is only done for the lines that are rendered */
+  private getPrettyValues = (decoration: WolfLineDecoration): string[] => {
+    if (decoration.pretty === undefined) {
+      decoration.pretty = decoration.values.map(value => beautify(value, {
+        indent_size: 4,
+        space_in_empty_paren: true
+      }));
+    }
+    return decoration.pretty;
+  };
+
+  private setDecorationAtLine = (
+    document: WolfDocumentDecorations,
+    line: WolfTraceLineResult
+  ): void => {
     const lineNo = line.lineno;
-    const { data, pretty } = this.getDecorationAtLineOrDefault(lineNo);
     const annotation = formatWolfResponseElement(line);
 
-    this._decorations[lineNo] = {
-      data: [...data, stringEscape(annotation)],
-      lineno: lineNo,
-      error: line.error ? true : false,
-      loop: line["_loop"],
-      pretty: [...pretty, beautify(line.value, {
-        indent_size: 4,
-        space_in_empty_paren: true
-      })]
-    };
+    let decoration = document.decorations[lineNo];
+    if (decoration === undefined) {
+      decoration = document.decorations[lineNo] = {
+        data: [],
+        lineno: lineNo,
+        error: false,
+        values: []
+      };
+    }
+    decoration.data.push(stringEscape(annotation));
+    decoration.values.push(line.value);
+    decoration.error = line.error ? true : false;
+    decoration.loop = line["_loop"];
   };
 
+  private get maxLineLength(): number {
+    return workspace
+      .getConfiguration("wolf")
+      .get<number>("maxLineLength") ?? 100;
+  }
+
   private get pawprints(): boolean {
     return workspace
       .getConfiguration("wolf")
       .get<boolean>("pawPrintsInGutter") ?? false;
   }
 }
+
+function sameDecorations(a: DecorationOptions[], b: DecorationOptions[]): boolean {
+  return a.length === b.length && a.every((decoration, i) => decoration === b[i]);
+}
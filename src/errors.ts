@@ -1 +1,2 @@
 export class WolfError extends Error {}
+export class WolfTraceCancelledError extends WolfError {}
@@ -4,12 +4,12 @@ import type {
   ConfigurationChangeEvent,
   OutputChannel,
   TextDocumentChangeEvent,
+  TextEditorVisibleRangesChangeEvent,
 } from "vscode";
 
 import { wolfStandardApiFactory, WolfAPI } from "./api";
 import type { ActiveTextEditorChangeEventResult } from "./types";
 import { registerCommand } from "./helpers";
-import { clamp } from "./utils";
 
 export function activate(context: ExtensionContext): WolfAPI {
   const output: OutputChannel = vscode.window.createOutputChannel("Wolf");
@@ -31,6 +31,7 @@ export function activate(context: ExtensionContext): WolfAPI {
     const sharedOptions = [null, context.subscriptions];
     vscode.window.onDidChangeActiveTextEditor(changedActiveTextEditor, ...sharedOptions);
     vscode.workspace.onDidChangeTextDocument(changedTextDocument, ...sharedOptions);
+    vscode.window.onDidChangeTextEditorVisibleRanges(changedVisibleRanges, ...sharedOptions);
     vscode.workspace.onDidChangeConfiguration(changedConfiguration, ...sharedOptions);
   }
 
@@ -79,10 +80,19 @@ export function activate(context: ExtensionContext): WolfAPI {
     }
   }
 
+  function changedVisibleRanges(event: TextEditorVisibleRangesChangeEvent): void {
+    if (event.textEditor === vscode.window.activeTextEditor && wolfAPI.isDocumentWolfSession(event.textEditor.document)) {
+      wolfAPI.setPreparedDecorations(event.textEditor);
+    }
+  }
+
   function changedConfiguration(event: ConfigurationChangeEvent): void {
     if (
       event.affectsConfiguration("wolf.pawPrintsInGutter") ||
       event.affectsConfiguration("wolf.updateFrequency") ||
+      event.affectsConfiguration("wolf.adaptiveUpdateFrequency") ||
+      event.affectsConfiguration("wolf.minUpdateFrequency") ||
+      event.affectsConfiguration("wolf.maxUpdateFrequency") ||
       event.affectsConfiguration("wolf.maxLineLength")
     ) {
       wolfAPI.setConfigUpdatedFlag(true);
@@ -94,8 +104,8 @@ export function activate(context: ExtensionContext): WolfAPI {
   ): void {
     clearThrottleUpdateBuffer()
     updateTimeout = setTimeout(
-      () => wolfAPI.traceAndSetDecorationsUsingTempFile(event.document),
-      clamp(100, 10000, wolfAPI.updateFrequency ?? Infinity)
+      () => wolfAPI.traceAndSetDecorationsFromBuffer(event.document),
+      wolfAPI.getUpdateDelay(event.document)
     );
   }
 
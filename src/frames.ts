@@ -0,0 +1,38 @@
+/* Length of the (big-endian, unsigned) frame length prefix */
+const FRAME_HEADER_SIZE = 4;
+
+/**
+ * Reads the length-prefixed frames `wolf.py --result-fd` writes: a 4 byte
+ * length followed by that many bytes of JSON. An empty frame ends the
+ * results, which are then parsed in one go.
+ */
+export class WolfFrameReader {
+  private _pending: Buffer = Buffer.alloc(0);
+  private _payload: Buffer[] = [];
+  private _complete = false;
+
+  public push = (data: Buffer): void => {
+    let buffer = this._pending.length ? Buffer.concat([this._pending, data]) : data;
+    while (!this._complete && buffer.length >= FRAME_HEADER_SIZE) {
+      const length = buffer.readUInt32BE(0);
+      if (buffer.length < FRAME_HEADER_SIZE + length) {
+        break;
+      }
+      if (length === 0) {
+        this._complete = true;
+      } else {
+        this._payload.push(buffer.slice(FRAME_HEADER_SIZE, FRAME_HEADER_SIZE + length));
+      }
+      buffer = buffer.slice(FRAME_HEADER_SIZE + length);
+    }
+    this._pending = buffer;
+  };
+
+  public get complete(): boolean {
+    return this._complete;
+  }
+
+  public parse = (): unknown => {
+    return JSON.parse(Buffer.concat(this._payload).toString("utf8"));
+  };
+}
@@ -1,10 +1,7 @@
-import * as path from "path";
 import * as vscode from "vscode";
 import type { WolfTraceLineResult } from "./types";
 import type { Disposable, TextEditor } from "vscode";
 
-import * as tmp from "tmp";
-
 export function formatWolfResponseElement(
   element: WolfTraceLineResult
 ): string {
@@ -38,11 +35,3 @@ export function registerCommand(
 ): Disposable {
   return vscode.commands.registerCommand(cmdName, callBack);
 }
-
-export function makeTempFile(filename: string): tmp.FileResult {
-  return tmp.fileSync({
-    dir: path.dirname(filename),
-    prefix: "/.wolf",
-    postfix: ".py"
-  });
-}
@@ -0,0 +1,62 @@
+import { clamp } from "./utils";
+
+export interface WolfLatencyStats {
+  average: number;
+  p95: number;
+  count: number;
+}
+
+export function wolfLatencyTrackerFactory(windowSize = 20): WolfLatencyTracker {
+  return new WolfLatencyTracker(windowSize);
+}
+
+/**
+ * Keeps the durations of the last `windowSize` traces of each document,
+ * the update (debounce) delay is derived from them.
+ */
+export class WolfLatencyTracker {
+  private _samples = new Map<string, number[]>();
+
+  constructor(private _windowSize: number) {}
+
+  public record = (key: string, duration: number): void => {
+    let samples = this._samples.get(key);
+    if (samples === undefined) {
+      samples = [];
+      this._samples.set(key, samples);
+    }
+    samples.push(duration);
+    if (samples.length > this._windowSize) {
+      samples.shift();
+    }
+  };
+
+  public forget = (key: string): void => {
+    this._samples.delete(key);
+  };
+
+  public getStats = (key: string): WolfLatencyStats | undefined => {
+    const samples = this._samples.get(key);
+    if (samples === undefined || samples.length === 0) {
+      return;
+    }
+    const sorted = [...samples].sort((a, b) => a - b);
+    const total = sorted.reduce((sum, duration) => sum + duration, 0);
+    return {
+      average: total / sorted.length,
+      p95: sorted[Math.min(sorted.length - 1, Math.ceil(sorted.length * 0.95) - 1)],
+      count: sorted.length,
+    };
+  };
+
+  /**
+   * Halfway between the average and the p95 duration: cheap files are
+   * traced right away and expensive ones are not started faster than
+   * they usually finish. Falls back to `initial` until there's a sample.
+   */
+  public getDelay = (key: string, initial: number, min: number, max: number): number => {
+    const stats = this.getStats(key);
+    const delay = stats === undefined ? initial : (stats.average + stats.p95) / 2;
+    return Math.round(clamp(min, max, delay));
+  };
+}
@@ -0,0 +1,141 @@
+import { constants, setPriority } from "os";
+import type { ChildProcessWithoutNullStreams } from "child_process";
+import type { WolfTracePriority } from "./types";
+
+export interface WolfPoolJob {
+  priority: WolfTracePriority;
+  /* Called with the worker once the job gets one */
+  start: (worker: ChildProcessWithoutNullStreams) => void;
+  /* Called to kick a running background job out for a foreground one */
+  preempt: () => void;
+}
+
+export function wolfWorkerPoolFactory(
+  spawnWorker: () => ChildProcessWithoutNullStreams,
+  size: number,
+  idleTimeout: number,
+): WolfWorkerPool {
+  return new WolfWorkerPool(spawnWorker, size, idleTimeout);
+}
+
+/**
+ * Runs at most `size` jobs at a time on `wolf.py` workers of a single
+ * interpreter. Foreground jobs (the focused editor) are queued before
+ * background ones and preempt a running background job when the pool is
+ * full. Background workers get a lower OS priority.
+ *
+ * Workers are started ahead of time (they wait for the script on stdin),
+ * one is kept idle until it's needed or `idleTimeout` ms have passed.
+ */
+export class WolfWorkerPool {
+  private _queue: WolfPoolJob[] = [];
+  private _running = new Map<WolfPoolJob, ChildProcessWithoutNullStreams>();
+  private _idle: ChildProcessWithoutNullStreams | null = null;
+  private _idleTimer: NodeJS.Timeout | null = null;
+
+  constructor(
+    private _spawnWorker: () => ChildProcessWithoutNullStreams,
+    public size: number,
+    public idleTimeout: number,
+  ) {}
+
+  public submit = (job: WolfPoolJob): void => {
+    if (job.priority === "foreground") {
+      const firstBackground = this._queue.findIndex(queued => queued.priority === "background");
+      this._queue.splice(firstBackground === -1 ? this._queue.length : firstBackground, 0, job);
+      this.preemptBackgroundJob();
+    } else {
+      this._queue.push(job);
+    }
+    this.drain();
+  };
+
+  /* Removes a job that didn't start yet, returns false if it did */
+  public cancel = (job: WolfPoolJob): boolean => {
+    const index = this._queue.indexOf(job);
+    if (index === -1) {
+      return false;
+    }
+    this._queue.splice(index, 1);
+    return true;
+  };
+
+  public evictIdleWorker = (): void => {
+    if (this._idleTimer !== null) {
+      clearTimeout(this._idleTimer);
+      this._idleTimer = null;
+    }
+    if (this._idle !== null) {
+      this._idle.kill();
+      this._idle = null;
+    }
+  };
+
+  private drain(): void {
+    while (this._running.size < Math.max(1, this.size) && this._queue.length) {
+      const job = this._queue.shift() as WolfPoolJob;
+      const worker = this.takeWorker();
+      this._running.set(job, worker);
+      worker.once("close", () => {
+        this._running.delete(job);
+        this.drain();
+      });
+      if (job.priority === "background") {
+        lowerPriority(worker);
+      }
+      job.start(worker);
+    }
+    if (!this._queue.length) {
+      this.prepareIdleWorker();
+    }
+  }
+
+  private preemptBackgroundJob(): void {
+    if (this._running.size < Math.max(1, this.size)) {
+      return;
+    }
+    /* The most recently started one has lost the least work */
+    const background = Array.from(this._running.keys())
+      .filter(job => job.priority === "background")
+      .pop();
+    background?.preempt();
+  }
+
+  private takeWorker(): ChildProcessWithoutNullStreams {
+    const worker = this._idle;
+    this._idle = null;
+    if (this._idleTimer !== null) {
+      clearTimeout(this._idleTimer);
+      this._idleTimer = null;
+    }
+    if (worker !== null && worker.exitCode === null && !worker.killed) {
+      return worker;
+    }
+    return this._spawnWorker();
+  }
+
+  private prepareIdleWorker(): void {
+    if (this._idle === null && this.idleTimeout > 0) {
+      const worker = this._idle = this._spawnWorker();
+      /* Reported to the job that gets it, if any */
+      worker.on("error", () => undefined);
+      worker.once("close", () => {
+        if (this._idle === worker) {
+          this._idle = null;
+        }
+      });
+    }
+    if (this._idleTimer !== null) {
+      clearTimeout(this._idleTimer);
+    }
+    this._idleTimer = setTimeout(this.evictIdleWorker, this.idleTimeout);
+  }
+}
+
+function lowerPriority(worker: ChildProcessWithoutNullStreams): void {
+  try {
+    setPriority(worker.pid, constants.priority.PRIORITY_BELOW_NORMAL);
+  } catch (err) {
+    /* The worker may be gone already, or the platform doesn't allow it */
+  }
+}
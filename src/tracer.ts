@@ -1,37 +1,95 @@
 import * as path from "path";
 import { spawn } from "child_process"
-import { indexOrLast } from "./utils";
-import type { WolfTracerInterface, TracerParsedResultTuple } from "./types";
+import type { ChildProcessWithoutNullStreams } from "child_process"
+import type { Readable } from "stream";
+import { decodeTraceResults, indexOrLast } from "./utils";
+import { WolfTraceCancelledError } from "./errors";
+import { WolfFrameReader } from "./frames";
+import { WolfPoolJob, WolfWorkerPool, wolfWorkerPoolFactory } from "./pool";
+import type {
+  WolfColumnarTraceResults,
+  WolfTracerInterface,
+  TracerParsedResultTuple
+} from "./types";
+
+/* The file descriptor `wolf.py` sends the results on */
+const RESULT_FD = 3;
 
 export function pythonTracerFactory(): PythonTracer {
   return new PythonTracer();
 }
 
+interface WolfTraceRequest {
+  options: WolfTracerInterface;
+  resolve: (result: TracerParsedResultTuple) => void;
+  reject: (reason: unknown) => void;
+}
+
+interface WolfTraceRun {
+  id: number;
+  request: WolfTraceRequest;
+  job: WolfPoolJob;
+  pool: WolfWorkerPool;
+  python: ChildProcessWithoutNullStreams | null;
+  cancelled: boolean;
+  preempted: boolean;
+}
+
+interface WolfDocumentTraces {
+  running: WolfTraceRun | null;
+  pending: WolfTraceRequest | null;
+  lastFinished: number;
+}
+
 export class PythonTracer {
+  /* Time a superseded run gets to exit after SIGTERM before it's sent SIGKILL */
+  public killGracePeriod = 500;
+  public traceTimeout = 10 * 1000;
+  /* Called with the duration (in ms) of every run that wasn't cancelled */
+  public onRunFinished: ((fileName: string, duration: number) => void) | null = null;
 
+  /**
+   * Traces are scheduled per document: at most one `wolf.py` runs and one
+   * waits. A new request supersedes the pending one (which is cancelled
+   * right away) and terminates the running one, then starts once it exits.
+   *
+   * Runs of all documents share a worker pool per interpreter, see
+   * `WolfWorkerPool`.
+   */
   public tracePythonScript = async (
     options: WolfTracerInterface,
   ): Promise<TracerParsedResultTuple> => {
     return new Promise((resolve, reject) => {
-      const { fileName, pythonPath, rootDir } = options
+      const traces = this.getDocumentTraces(options.fileName);
+
+      if (traces.pending !== null) {
+        traces.pending.reject(new WolfTraceCancelledError('superseded'));
+      }
+      traces.pending = { options, resolve, reject };
 
-      if (this.tracerTimeout !== null) {
-        clearTimeout(this.tracerTimeout)
+      if (traces.running !== null) {
+        this.cancelRun(traces, traces.running);
+      } else {
+        this.startPendingRun(traces);
       }
-  
-      const python = this.getPythonRunner(pythonPath, rootDir, fileName);
-      this.tracerTimeout = setTimeout(function () { python.kill() }, 10 * 1000);
-  
-      python.stderr.on("data", (data: Buffer) => {
-        reject(data.toString());
-      });
-  
-      python.stdout.on("data", (data: Buffer): void => {
-        resolve(this.tryParsePythonData(data));
-      });
     })
   }
 
+  public cancelAll = (): void => {
+    for (const traces of this._documents.values()) {
+      if (traces.pending !== null) {
+        traces.pending.reject(new WolfTraceCancelledError('cancelled'));
+        traces.pending = null;
+      }
+      if (traces.running !== null) {
+        this.cancelRun(traces, traces.running);
+      }
+    }
+    for (const pool of this._pools.values()) {
+      pool.evictIdleWorker();
+    }
+  }
+
   public getPythonMajorVersion(pythonPath: string): Promise<string> {
     const child = spawn(pythonPath, ['--version']);
     return new Promise((resolve, reject) => {
@@ -44,12 +102,141 @@ export class PythonTracer {
     })
   }
 
-  private tracerTimeout: null | NodeJS.Timeout = null;
+  private _documents = new Map<string, WolfDocumentTraces>();
+  private _pools = new Map<string, WolfWorkerPool>();
+  private _nextRunId = 1;
+
+  private getDocumentTraces(key: string): WolfDocumentTraces {
+    let traces = this._documents.get(key);
+    if (traces === undefined) {
+      traces = { running: null, pending: null, lastFinished: 0 };
+      this._documents.set(key, traces);
+    }
+    return traces;
+  }
+
+  private getWorkerPool(options: WolfTracerInterface): WolfWorkerPool {
+    const { pythonPath, rootDir, maxWorkers = 2, workerIdleTimeout = 30 * 1000 } = options;
+    let pool = this._pools.get(pythonPath);
+    if (pool === undefined) {
+      pool = wolfWorkerPoolFactory(
+        () => this.getPythonRunner(pythonPath, rootDir),
+        maxWorkers,
+        workerIdleTimeout,
+      );
+      this._pools.set(pythonPath, pool);
+    }
+    pool.size = maxWorkers;
+    pool.idleTimeout = workerIdleTimeout;
+    return pool;
+  }
+
+  private startPendingRun(traces: WolfDocumentTraces): void {
+    const request = traces.pending;
+    if (request === null) {
+      return;
+    }
+    traces.pending = null;
 
-  private getPythonRunner(pythonPath: string, rootDir: string, scriptName: string) {
+    const pool = this.getWorkerPool(request.options);
+    const run: WolfTraceRun = {
+      id: this._nextRunId++,
+      request,
+      job: {
+        priority: request.options.priority ?? "foreground",
+        start: (python) => this.startRun(traces, run, python),
+        preempt: () => {
+          run.preempted = true;
+          this.killRun(run);
+        },
+      },
+      pool,
+      python: null,
+      cancelled: false,
+      preempted: false,
+    };
+    traces.running = run;
+    pool.submit(run.job);
+  }
+
+  private startRun(
+    traces: WolfDocumentTraces,
+    run: WolfTraceRun,
+    python: ChildProcessWithoutNullStreams
+  ): void {
+    const { request } = run;
+    const { fileName, source } = request.options;
+    const started = Date.now();
+    const stdout: Buffer[] = [];
+    const stderr: Buffer[] = [];
+    const results = new WolfFrameReader();
+    run.python = python;
+
+    const timeout = setTimeout(() => this.cancelRun(traces, run), this.traceTimeout);
+
+    python.stdout.on("data", (data: Buffer) => stdout.push(data));
+    python.stderr.on("data", (data: Buffer) => stderr.push(data));
+    (python.stdio[RESULT_FD] as Readable | null | undefined)?.on("data", results.push);
+    python.on("error", (err: Error) => stderr.push(Buffer.from(err.message)));
+    /* EPIPE if the process exits before reading it all, it's reported on close */
+    python.stdin.on("error", () => undefined);
+    python.stdin.end(`${fileName}\n${source}`, "utf8");
+
+    python.on("close", () => {
+      clearTimeout(timeout);
+      traces.running = null;
+
+      if (run.preempted && !run.cancelled && traces.pending === null) {
+        /* Kicked out for a foreground run, try again later */
+        traces.pending = request;
+      } else if (run.cancelled || run.preempted || run.id < traces.lastFinished) {
+        request.reject(new WolfTraceCancelledError('superseded'));
+      } else {
+        traces.lastFinished = run.id;
+        this.onRunFinished?.(fileName, Date.now() - started);
+        if (stderr.length) {
+          request.reject(Buffer.concat(stderr).toString());
+        } else {
+          request.resolve(this.parseTraceResults(results, Buffer.concat(stdout)));
+        }
+      }
+      this.startPendingRun(traces);
+    });
+  }
+
+  private cancelRun(traces: WolfDocumentTraces, run: WolfTraceRun): void {
+    if (run.cancelled) {
+      return;
+    }
+    run.cancelled = true;
+    if (run.python !== null) {
+      this.killRun(run);
+    } else if (run.pool.cancel(run.job)) {
+      /* Still queued in the pool, there's no process to wait for */
+      traces.running = null;
+      run.request.reject(new WolfTraceCancelledError('superseded'));
+      this.startPendingRun(traces);
+    }
+  }
+
+  private killRun(run: WolfTraceRun): void {
+    const python = run.python;
+    if (python === null) {
+      return;
+    }
+    python.kill("SIGTERM");
+    const killTimer = setTimeout(() => python.kill("SIGKILL"), this.killGracePeriod);
+    python.once("close", () => clearTimeout(killTimer));
+  }
+
+  /**
+   * Workers are started before there's anything to trace: `wolf.py` reads
+   * the (logical) filename and the source from stdin once it's needed.
+   */
+  private getPythonRunner(pythonPath: string, rootDir: string) {
     const wolfPath: string = path.join(rootDir, "scripts/wolf.py");
     const options = { env: { ...process.env } as Record<string, string> }
-    
+
     /* Copied from https://github.com/Almenon/AREPL-backend/blob/209eb5b8ae8cda1677f925749a10cd263f6d9860/index.ts#L85-L93 */
     if (process.platform == "darwin") {
 			// needed for Mac to prevent ENOENT
@@ -61,7 +248,35 @@ export class PythonTracer {
       options.env.PYTHONIOENCODING = 'utf8'
     }
 
-    return spawn(pythonPath, [wolfPath, scriptName], options);
+    const args = [wolfPath, "--compact", "--stdin"];
+    if (process.platform !== "win32") {
+      /* Python can't use inherited pipes as plain file descriptors on windows */
+      args.push("--result-fd", `${RESULT_FD}`);
+    }
+    return spawn(pythonPath, [...args, "-"], {
+      ...options,
+      stdio: ["pipe", "pipe", "pipe", "pipe"],
+    }) as ChildProcessWithoutNullStreams;
+  }
+
+  /**
+   * Results come in on their own pipe, stdout is only the script's output.
+   * Falls back to looking for the results in stdout when they didn't.
+   */
+  private parseTraceResults = (results: WolfFrameReader, stdout: Buffer): TracerParsedResultTuple => {
+    if (!results.complete) {
+      return this.tryParsePythonData(stdout);
+    }
+    try {
+      return [
+        decodeTraceResults(results.parse() as WolfColumnarTraceResults), // Trace Results
+        stdout.toString(),
+      ];
+    } catch (err) {
+      console.error("Error parsing Wolf output. ->");
+      console.error(err);
+    }
+    return [undefined, stdout.toString()];
   }
 
   private tryParsePythonData = (buffer: Buffer): TracerParsedResultTuple => {
@@ -70,7 +285,7 @@ export class PythonTracer {
     if (index !== -1) {
       try {
         return [
-          JSON.parse(asString.slice(index)), // Trace Results
+          decodeTraceResults(JSON.parse(asString.slice(index))), // Trace Results
           asString.slice(0, index - "WOOF:".length),
         ];
       } catch (err) {
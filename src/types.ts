@@ -30,7 +30,8 @@ export interface WolfLineDecoration {
   error: boolean;
   loop?: boolean;
   source?: string;
-  pretty: string[];
+  values: string[];
+  pretty?: string[];
   calls?: number;
 }
 
@@ -67,13 +68,30 @@ export interface WolfTraceLineResult {
   _loop?: boolean;
 }
 
+export interface WolfColumnarTraceResults {
+  format: "columnar";
+  strings: string[];
+  lineno: number[];
+  source: number[];
+  value: number[];
+  iteration: number[];
+  errors: (WolfTraceLineResult & { index: number })[];
+}
+
 export type WolfParsedTraceResults = WolfTraceLineResult[] | null | undefined;
 export type TracerParsedResultTuple = [WolfParsedTraceResults, string]
 
+export type WolfTracePriority = "foreground" | "background";
+
 export interface WolfTracerInterface {
   pythonPath: string;
   fileName: string;
   rootDir: string;
+  /* Traced instead of the file contents, piped to `wolf.py --stdin` */
+  source: string;
+  priority?: WolfTracePriority;
+  maxWorkers?: number;
+  workerIdleTimeout?: number;
 }
 
 export type ActiveTextEditorChangeEventResult = TextEditor | undefined;
@@ -1,3 +1,8 @@
+import type {
+  WolfColumnarTraceResults,
+  WolfParsedTraceResults,
+  WolfTraceLineResult
+} from "./types";
 
 export function clamp(blop: number, bloop: number, bleep: number): number {
   return bleep > bloop ? bloop : bleep < blop ? blop : bleep;
@@ -33,3 +38,30 @@ export function stringEscape(text: string | number): string {
     }
   });
 }
+
+export function decodeTraceResults(
+  payload: WolfColumnarTraceResults | WolfParsedTraceResults
+): WolfParsedTraceResults {
+  if (!payload || Array.isArray(payload)) {
+    return payload;
+  }
+  const { strings, lineno, source, value, errors } = payload;
+  const results: WolfTraceLineResult[] = [];
+  let nextError = 0;
+  for (let i = 0; i <= lineno.length; i++) {
+    while (nextError < errors.length && errors[nextError].index === i) {
+      const error: Partial<WolfColumnarTraceResults["errors"][number]> = { ...errors[nextError++] };
+      delete error.index;
+      results.push(error as WolfTraceLineResult);
+    }
+    if (i === lineno.length) {
+      break;
+    }
+    const row = { lineno: lineno[i], value: strings[value[i]] } as WolfTraceLineResult;
+    if (source[i] !== -1) {
+      row.source = strings[source[i]];
+    }
+    results.push(row);
+  }
+  return results;
+}
@@ -4,6 +4,8 @@
 //
 
 import * as assert from "assert";
+import { mkdtempSync, writeFileSync } from "fs";
+import { tmpdir } from "os";
 import { join } from "path";
 
 import * as vscode from "vscode";
@@ -25,4 +27,47 @@ suite("Extension Tests", () => {
         .then(() => api.stepInWolf())
     })
 	}).timeout(30000); // This can sometimes take awhile on CI servers.
+
+	test("Should keep the decorations of each visible editor apart", async () => {
+    const started = vscode.extensions.getExtension("trabpukcip.wolf");
+    const api: WolfAPI = await started?.activate()
+
+    const directory = mkdtempSync(join(tmpdir(), "wolf-"));
+    const shortPath = join(directory, "short.py");
+    const longPath = join(directory, "long.py");
+    writeFileSync(shortPath, "a = 1\na\n");
+    writeFileSync(longPath, "\n".repeat(20) + "b = 2\nb\n");
+
+    const traced = (fileName: string) => new Promise<void>(resolve => {
+      api.on('decorations-changed', (filepath: unknown) => {
+        if (filepath === vscode.Uri.file(fileName).path) {
+          resolve()
+        }
+      })
+    })
+
+    const short = await openAndShowTextDocument(shortPath);
+    let done = traced(shortPath);
+    api.stepInWolf();
+    await done;
+
+    /* The long file is visible beside, but the short one stays active */
+    const long = await vscode.window.showTextDocument(
+      await vscode.workspace.openTextDocument(longPath),
+      { viewColumn: vscode.ViewColumn.Beside, preserveFocus: true, preview: false }
+    );
+    assert.strictEqual(vscode.window.activeTextEditor?.document, short.document);
+    done = traced(longPath);
+    api.traceAndSetDecorationsFromBuffer(long.document);
+    await done;
+
+    /* ie: what scrolling the active editor does */
+    api.setPreparedDecorations(short);
+    const lines = (fileName: string) => api.decorations.getPreparedDecorations(fileName).success.map(
+      decoration => decoration.range.start.line + 1
+    );
+    assert.deepStrictEqual(lines(short.document.fileName), [2]);
+    assert.deepStrictEqual(lines(long.document.fileName), [22]);
+    api.stopWolf();
+	}).timeout(30000);
 });
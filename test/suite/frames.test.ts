@@ -0,0 +1,52 @@
+import * as assert from "assert";
+
+import { WolfFrameReader } from "../../src/frames";
+
+function frame(payload: string): Buffer {
+  const data = Buffer.from(payload, "utf8");
+  const header = Buffer.alloc(4);
+  header.writeUInt32BE(data.length, 0);
+  return Buffer.concat([header, data]);
+}
+
+const END = frame("");
+
+suite("Frame Reader Tests", () => {
+  test("Should read frames split across pushes", () => {
+    const data = Buffer.concat([frame('[{"lineno": 1,'), frame(' "value": "2"}]'), END]);
+    const reader = new WolfFrameReader();
+    // Split inside the first header, then byte by byte through the payloads
+    reader.push(data.slice(0, 2));
+    reader.push(data.slice(2, 7));
+    for (let i = 7; i < data.length; i++) {
+      assert.strictEqual(reader.complete, false);
+      reader.push(data.slice(i, i + 1));
+    }
+    assert.strictEqual(reader.complete, true);
+    assert.deepStrictEqual(reader.parse(), [{ lineno: 1, value: "2" }]);
+  });
+
+  test("Should read several frames from one push", () => {
+    const reader = new WolfFrameReader();
+    reader.push(Buffer.concat([frame("[1, "), frame("2, "), frame("3]"), END]));
+    assert.strictEqual(reader.complete, true);
+    assert.deepStrictEqual(reader.parse(), [1, 2, 3]);
+  });
+
+  test("Should ignore data after the empty frame", () => {
+    const reader = new WolfFrameReader();
+    reader.push(Buffer.concat([frame("[]"), END, frame("garbage")]));
+    reader.push(frame("more garbage"));
+    assert.strictEqual(reader.complete, true);
+    assert.deepStrictEqual(reader.parse(), []);
+  });
+
+  test("Should wait for the empty frame", () => {
+    const reader = new WolfFrameReader();
+    reader.push(frame("[]"));
+    reader.push(END.slice(0, 3));
+    assert.strictEqual(reader.complete, false);
+    reader.push(END.slice(3));
+    assert.strictEqual(reader.complete, true);
+  });
+});
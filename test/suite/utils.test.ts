@@ -0,0 +1,56 @@
+import * as assert from "assert";
+import { execFileSync } from "child_process";
+import { join } from "path";
+
+import * as vscode from "vscode";
+import { WolfAPI } from "../../src/api";
+import { decodeTraceResults, indexOrLast } from "../../src/utils";
+import type { WolfColumnarTraceResults, WolfTraceLineResult } from "../../src/types";
+
+const WOLF_PY = join(__dirname, "..", "..", "..", "scripts", "wolf.py");
+const TEST_PY = join(__dirname, "..", "test.py");
+
+function traceWithWolf(pythonPath: string, ...options: string[]): unknown {
+  const stdout = execFileSync(pythonPath, [WOLF_PY, TEST_PY, ...options]).toString();
+  return JSON.parse(stdout.slice(indexOrLast(stdout, "WOOF:")));
+}
+
+suite("Columnar Results Tests", () => {
+  test("Should decode the columnar results", () => {
+    const payload: WolfColumnarTraceResults = {
+      format: "columnar",
+      strings: ["x", "1", "2"],
+      lineno: [2, 2, 3],
+      source: [0, 0, -1],
+      value: [1, 2, 1],
+      iteration: [0, 1, 0],
+      errors: [
+        { index: 0, lineno: 1, value: "NameError", error: true } as WolfTraceLineResult & { index: number },
+        { index: 3, lineno: 4, value: "ZeroDivisionError", error: true } as WolfTraceLineResult & { index: number },
+      ],
+    };
+
+    assert.deepStrictEqual(decodeTraceResults(payload), [
+      { lineno: 1, value: "NameError", error: true },
+      { lineno: 2, source: "x", value: "1" },
+      { lineno: 2, source: "x", value: "2" },
+      { lineno: 3, value: "1" },
+      { lineno: 4, value: "ZeroDivisionError", error: true },
+    ]);
+    assert.deepStrictEqual(decodeTraceResults([]), []);
+  });
+
+  test("Should decode what wolf.py --compact sends", async () => {
+    const started = vscode.extensions.getExtension("trabpukcip.wolf");
+    const api: WolfAPI = await started?.activate();
+
+    const rows = traceWithWolf(api.pythonPath) as WolfTraceLineResult[];
+    const columnar = traceWithWolf(api.pythonPath, "--compact") as WolfColumnarTraceResults;
+    assert.strictEqual(columnar.format, "columnar");
+    assert.notStrictEqual(rows.length, 0, "No results");
+
+    // The source is sent as a 1-tuple in the rows
+    const expected = rows.map(row => Array.isArray(row.source) ? { ...row, source: row.source[0] } : row);
+    assert.deepStrictEqual(decodeTraceResults(columnar), expected);
+  }).timeout(30000);
+});